@@ -0,0 +1,205 @@
+# This file is part of nvitop, the interactive NVIDIA-GPU process viewer.
+# License: GNU GPL version 3.
+
+"""Benchmark the lock contention of concurrent NVML queries with multiple polling threads.
+
+The benchmark runs on the simulated NVML backend by default, so it does not need NVIDIA GPUs. Each
+polling thread queries the dynamic metrics of all devices via :func:`nvmlQuery` in a tight loop.
+
+The simulated driver latency sleeps and releases the GIL, so the throughput scales with the number
+of threads as long as the locks are held briefly, no matter how often they are taken. To measure
+the locking itself, the module-level locks of :mod:`nvitop.api.libnvml` are replaced by
+instrumented ones, and the number of acquisitions, the contended acquisitions, and the time spent
+waiting for and holding the locks are reported per query. A lock-free query path takes no lock
+acquisitions per query.
+
+Usage:
+
+    python3 benchmarks/libnvml_threads.py --threads 1 2 4 8 16 --latency 100E-6
+    python3 benchmarks/libnvml_threads.py --real  # benchmark with the NVIDIA driver
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import threading
+import time
+
+from nvitop.api import libnvml
+from nvitop.api.libnvml_sim import SimulatedBackend
+
+
+# The module-level locks in `nvitop.api.libnvml` to instrument
+LOCK_NAMES = (
+    '__lock',
+    '__unknown_functions_lock',
+    '__memory_info_v2_lock',
+    '__query_stats_lock',
+    '__capability_cache_lock',
+)
+
+QUERIES = (
+    ('nvmlDeviceGetMemoryInfo',),
+    ('nvmlDeviceGetUtilizationRates',),
+    ('nvmlDeviceGetTemperature', libnvml.NVML_TEMPERATURE_GPU),
+    ('nvmlDeviceGetPowerUsage',),
+    ('nvmlDeviceGetClockInfo', libnvml.NVML_CLOCK_SM),
+    ('nvmlDeviceGetFanSpeed',),
+)
+
+
+class InstrumentedLock:
+    """A lock wrapper that records the acquisitions, the wait time, and the hold time."""
+
+    def __init__(self, lock: threading.Lock) -> None:
+        self.lock = lock
+        self.reset()
+
+    def reset(self) -> None:
+        self.acquisitions = self.contentions = 0
+        self.wait_time = self.hold_time = 0.0
+        self._acquired_at = 0.0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        start = time.perf_counter()
+        contended = not self.lock.acquire(blocking=False)
+        if contended and not self.lock.acquire(blocking, timeout):
+            return False
+        # The statistics are updated while holding the lock
+        self._acquired_at = time.perf_counter()
+        self.acquisitions += 1
+        self.contentions += contended
+        self.wait_time += self._acquired_at - start
+        return True
+
+    def release(self) -> None:
+        self.hold_time += time.perf_counter() - self._acquired_at
+        self.lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+
+def instrument_locks() -> dict[str, InstrumentedLock]:
+    locks = {}
+    for name in LOCK_NAMES:
+        lock = getattr(libnvml, name, None)
+        if lock is not None:
+            locks[name] = InstrumentedLock(lock)
+            setattr(libnvml, name, locks[name])
+    return locks
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', maxsplit=1)[0])
+    parser.add_argument(
+        '--threads',
+        type=int,
+        nargs='+',
+        default=[1, 2, 4, 8, 16],
+        help='The numbers of polling threads to benchmark. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--devices',
+        type=int,
+        default=8,
+        help='The number of simulated devices. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--latency',
+        type=float,
+        default=100e-6,
+        help='The simulated latency of each NVML call in seconds. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=2.0,
+        help='The duration of each run in seconds. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--real',
+        action='store_true',
+        help='Benchmark with the NVIDIA driver instead of the simulated backend.',
+    )
+    return parser.parse_args()
+
+
+def run(handles: list[libnvml.c_nvmlDevice_t], num_threads: int, duration: float) -> tuple[int, int]:
+    counts = [0] * num_threads
+    barrier = threading.Barrier(num_threads + 1)
+    stop = threading.Event()
+
+    def poll(index: int) -> None:
+        barrier.wait()
+        count = 0
+        while not stop.is_set():
+            for handle in handles:
+                for func, *args in QUERIES:
+                    libnvml.nvmlQuery(func, handle, *args)
+                count += len(QUERIES)
+        counts[index] = count
+
+    threads = [threading.Thread(target=poll, args=(i,), daemon=True) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return round(sum(counts) / (time.perf_counter() - start)), sum(counts)
+
+
+def main() -> None:
+    args = parse_arguments()
+
+    if args.real:
+        backend = contextlib.nullcontext()
+    else:
+        backend = SimulatedBackend.generate(args.devices, latency=args.latency, noise=0.0)
+
+    with backend:
+        handles = [
+            libnvml.nvmlQuery('nvmlDeviceGetHandleByIndex', index, ignore_errors=False)
+            for index in range(libnvml.nvmlQuery('nvmlDeviceGetCount', ignore_errors=False))
+        ]
+        run(handles, num_threads=1, duration=min(args.duration, 0.5))  # warm up
+        locks = instrument_locks()
+
+        print(
+            f'{"Threads":>7}  {"Queries/s":>12}  {"Speedup":>7}  {"Locks/query":>11}  '
+            f'{"Contended":>9}  {"Wait/query":>10}  {"Hold/query":>10}',
+        )
+        baseline = None
+        for num_threads in args.threads:
+            for lock in locks.values():
+                lock.reset()
+            throughput, queries = run(handles, num_threads=num_threads, duration=args.duration)
+            baseline = baseline or throughput
+            acquisitions = sum(lock.acquisitions for lock in locks.values())
+            contentions = sum(lock.contentions for lock in locks.values())
+            wait_time = sum(lock.wait_time for lock in locks.values())
+            hold_time = sum(lock.hold_time for lock in locks.values())
+            print(
+                f'{num_threads:>7}  {throughput:>12}  {throughput / baseline:>6.2f}x  '
+                f'{acquisitions / queries:>11.3f}  {contentions:>9}  '
+                f'{wait_time / queries * 1e6:>8.3f}us  {hold_time / queries * 1e6:>8.3f}us',
+            )
+
+        print()
+        print(f'Locks in the last run ({args.threads[-1]} threads):')
+        for name, lock in locks.items():
+            print(
+                f'  {name:<26}  {lock.acquisitions:>9} acquisitions  {lock.contentions:>7} contended  '
+                f'{lock.wait_time * 1e3:>8.3f}ms wait  {lock.hold_time * 1e3:>8.3f}ms hold',
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+# This file is part of nvitop, the interactive NVIDIA-GPU process viewer.
+# License: GNU GPL version 3.
+
+"""Micro-benchmark the TTL cache decorators for the device attributes.
+
+Compare :func:`cachetools.func.ttl_cache` (one cache per method keyed by ``self``) with
+:func:`nvitop.caching.ttl_cache` and :func:`nvitop.caching.ttl_cached_method` (one cache per instance)
+on the hit path (all calls within the TTL) and the miss path (TTL of zero), in a single thread and in
+multiple threads calling the methods of different instances concurrently.
+
+Usage:
+
+    python3 benchmarks/ttl_cache.py --calls 1000000 --threads 1 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+from cachetools.func import ttl_cache as cachetools_ttl_cache
+
+from nvitop.api import caching
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', maxsplit=1)[0])
+    parser.add_argument(
+        '--calls',
+        type=int,
+        default=1_000_000,
+        help='The total number of calls for each run. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--threads',
+        type=int,
+        nargs='+',
+        default=[1, 4, 16],
+        help='The numbers of threads to benchmark. (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--instances',
+        type=int,
+        default=16,
+        help='The number of instances. (default: %(default)s)',
+    )
+    return parser.parse_args()
+
+
+def make_classes(ttl: float) -> dict[str, type]:
+    caching.set_ttl('benchmark_shared', ttl)
+    caching.set_ttl('benchmark_per_instance', ttl)
+
+    class CachetoolsDevice:
+        @cachetools_ttl_cache(ttl=ttl if ttl > 0.0 else 1e-9)
+        def value(self) -> int:
+            return 0
+
+    class SharedCacheDevice:
+        @caching.ttl_cache(ttl=ttl, name='benchmark_shared')
+        def value(self) -> int:
+            return 0
+
+    class PerInstanceCacheDevice:
+        @caching.ttl_cached_method(ttl=ttl, name='benchmark_per_instance')
+        def value(self) -> int:
+            return 0
+
+    return {
+        'cachetools.func.ttl_cache': CachetoolsDevice,
+        'caching.ttl_cache': SharedCacheDevice,
+        'caching.ttl_cached_method': PerInstanceCacheDevice,
+    }
+
+
+def run(cls: type, num_instances: int, num_threads: int, calls: int) -> float:
+    instances = [cls() for _ in range(num_instances)]
+    calls_per_thread = calls // num_threads
+    barrier = threading.Barrier(num_threads + 1)
+
+    def target(index: int) -> None:
+        methods = [instance.value for instance in instances[index::num_threads] or instances]
+        rounds = calls_per_thread // len(methods)
+        barrier.wait()
+        for _ in range(rounds):
+            for method in methods:
+                method()
+
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main() -> None:
+    args = parse_arguments()
+
+    print(f'{"Decorator":<28}  {"Path":<4}  {"Threads":>7}  {"ns/call":>8}')
+    for path, ttl in (('hit', 3600.0), ('miss', 0.0)):
+        for name, cls in make_classes(ttl).items():
+            for num_threads in args.threads:
+                elapsed = run(cls, args.instances, num_threads, args.calls)
+                print(f'{name:<28}  {path:<4}  {num_threads:>7}  {elapsed:>8.1f}')
+    caching.reset_ttl()
+
+
+if __name__ == '__main__':
+    main()
@@ -16,26 +16,49 @@
 # ==============================================================================
 """The core APIs of nvitop."""
 
-from nvitop.api import collector, device, host, libcuda, libcudart, libnvml, process, utils
-from nvitop.api.collector import ResourceMetricCollector, collect_in_background, take_snapshots
+from nvitop.api import (
+    caching,
+    collector,
+    device,
+    event,
+    host,
+    libcuda,
+    libcudart,
+    libnvml,
+    process,
+    table,
+    utils,
+)
+from nvitop.api.collector import (
+    ResourceMetricCollector,
+    collect_in_background,
+    stream_snapshots,
+    take_snapshots,
+)
 from nvitop.api.device import (
     CudaDevice,
     CudaMigDevice,
     Device,
     MigDevice,
     PhysicalDevice,
+    diff_snapshots,
     normalize_cuda_visible_devices,
     parse_cuda_visible_devices,
 )
+from nvitop.api.event import DeviceEvent, EventMonitor
 from nvitop.api.libnvml import NVMLError, nvmlCheckReturn
-from nvitop.api.process import GpuProcess, HostProcess, command_join
+from nvitop.api.process import GpuProcess, HostProcess, cmdline_cache_clear, command_join
+from nvitop.api.table import DeviceTable
 from nvitop.api.utils import *  # noqa: F403
 
 
 __all__ = [
     'take_snapshots',
+    'stream_snapshots',
     'collect_in_background',
     'ResourceMetricCollector',
+    'EventMonitor',
+    'DeviceEvent',
     'libnvml',
     'nvmlCheckReturn',
     'NVMLError',
@@ -48,9 +71,13 @@ __all__ = [
     'CudaMigDevice',
     'parse_cuda_visible_devices',
     'normalize_cuda_visible_devices',
+    'diff_snapshots',
+    'DeviceTable',
+    'caching',
     'host',
     'HostProcess',
     'GpuProcess',
     'command_join',
+    'cmdline_cache_clear',
     *utils.__all__,
 ]
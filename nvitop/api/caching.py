@@ -0,0 +1,283 @@
+# This file is part of nvitop, the interactive NVIDIA-GPU process viewer.
+#
+# Copyright 2021-2023 Xuehai Pan. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""The time-to-live (TTL) cache policy of the device attributes.
+
+The query results of the device attributes (e.g., :meth:`Device.memory_info` and
+:meth:`Device.processes`) are cached for a short time to reduce the NVML calls. The TTLs are looked up
+by the attribute names in a process-wide registry on each call, so they can be changed at runtime by
+:func:`set_ttl`, or via the environment variable ``NVITOP_CACHE_TTL`` with comma-separated
+``<name>=<seconds>`` pairs:
+
+.. code:: bash
+
+    NVITOP_CACHE_TTL='*=10,memory_info=0.5,utilization_rates=0.5' python3 train.py
+
+The name ``'*'`` sets the TTL for all the attributes that do not have an explicit TTL. A TTL of ``0``
+disables the cache. The attributes queried dynamically via :meth:`Device.__getattr__` are registered
+by their names as well.
+
+Examples:
+    >>> from nvitop import Device, caching
+
+    >>> caching.ttl_policy()
+    {'memory_info': 1.0, 'bar1_memory_info': 1.0, 'utilization_rates': 1.0, 'clock_infos': 5.0, ...}
+
+    >>> caching.set_ttl('memory_info', 0.1)  # for high-rate profilers
+    >>> caching.set_ttl('*', 30.0)           # for fleet agents polling hundreds of devices
+    >>> caching.get_ttl('memory_info'), caching.get_ttl('temperature')
+    (0.1, 30.0)
+    >>> caching.reset_ttl()                  # restore the default TTLs
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import os
+import threading
+import time
+import warnings
+from typing import Any, Callable, TypeVar
+
+from cachetools import LRUCache
+from cachetools.keys import hashkey
+
+
+__all__ = ['ttl_cache', 'ttl_cached_method', 'get_ttl', 'set_ttl', 'reset_ttl', 'ttl_policy']
+
+
+WILDCARD = '*'
+
+_Func = TypeVar('_Func', bound=Callable[..., Any])
+
+_DEFAULT_TTLS: dict[str, float] = {}
+_TTLS: dict[str, float] = {}
+_LOCK = threading.Lock()
+
+
+def _check_ttl(ttl: float) -> float:
+    ttl = float(ttl)
+    if not ttl >= 0.0:
+        raise ValueError(f'The TTL should be a non-negative number, but got {ttl!r}.')
+    return ttl
+
+
+def _parse_ttls(value: str) -> dict[str, float]:
+    ttls = {}
+    for item in filter(None, map(str.strip, value.split(','))):
+        name, _, ttl = item.partition('=')
+        try:
+            ttls[name.strip()] = _check_ttl(ttl)
+        except ValueError:
+            warnings.warn(
+                f'Invalid item {item!r} in environment variable `NVITOP_CACHE_TTL` is ignored.',
+                RuntimeWarning,
+                stacklevel=2,
+            )
+    return ttls
+
+
+def get_ttl(name: str) -> float:
+    """Return the effective TTL in seconds of the given attribute name.
+
+    Raises:
+        KeyError:
+            If the attribute is not registered and no TTL is set for it or the wildcard ``'*'``.
+    """
+    try:
+        return _TTLS[name]
+    except KeyError:
+        pass
+    try:
+        return _TTLS[WILDCARD]
+    except KeyError:
+        return _DEFAULT_TTLS[name]
+
+
+def set_ttl(name: str, ttl: float | None) -> None:
+    """Set the TTL in seconds of the given attribute name, or ``'*'`` for all attributes.
+
+    The new TTL takes effect on the next call, including the values already cached. Pass :data:`None`
+    to restore the default TTL of the attribute.
+
+    Raises:
+        ValueError:
+            If the TTL is negative.
+    """
+    with _LOCK:
+        if ttl is None:
+            _TTLS.pop(name, None)
+        else:
+            _TTLS[name] = _check_ttl(ttl)
+
+
+def reset_ttl() -> None:
+    """Restore the default TTLs of all attributes, discarding the ones from ``NVITOP_CACHE_TTL``."""
+    with _LOCK:
+        _TTLS.clear()
+
+
+def ttl_policy() -> dict[str, float]:
+    """Return a dictionary mapping the registered attribute names to the effective TTLs in seconds."""
+    with _LOCK:
+        names = [*_DEFAULT_TTLS, *(name for name in _TTLS if name not in _DEFAULT_TTLS)]
+    return {name: get_ttl(name) for name in names if name != WILDCARD}
+
+
+def _register(name: str, ttl: float) -> None:
+    with _LOCK:
+        _DEFAULT_TTLS.setdefault(name, ttl)
+
+
+def ttl_cache(
+    ttl: float,
+    *,
+    name: str | None = None,
+    maxsize: int = 128,
+) -> Callable[[_Func], _Func]:
+    """A TTL cache decorator with the TTL looked up in the registry on each call.
+
+    The cache is shared by all calls of the decorated function and protected by a lock. Use
+    :func:`ttl_cached_method` for methods to store the cache in the instances.
+
+    The decorated function has the same interface as the one decorated by
+    :func:`cachetools.func.ttl_cache`, with an additional attribute ``cache_name``.
+
+    Args:
+        ttl (float):
+            The default TTL in seconds.
+        name (Optional[str]):
+            The name to register in the registry. If not given, use the name of the function.
+        maxsize (int):
+            The maximum number of entries to cache. The least recently used entry is discarded when
+            the cache is full.
+    """
+    ttl = _check_ttl(ttl)
+
+    def decorator(func: _Func) -> _Func:
+        cache_name = name or func.__name__
+        _register(cache_name, ttl)
+
+        cache = LRUCache(maxsize=maxsize)
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapped(*args: Any, **kwargs: Any) -> Any:
+            key = hashkey(*args, **kwargs)
+            timestamp = time.monotonic()
+            with lock:
+                try:
+                    cached_timestamp, value = cache[key]
+                except KeyError:
+                    pass
+                else:
+                    if timestamp - cached_timestamp < get_ttl(cache_name):
+                        return value
+            value = func(*args, **kwargs)
+            with lock:
+                cache[key] = (timestamp, value)
+            return value
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapped.cache_clear = cache_clear
+        wrapped.cache_name = cache_name
+        return wrapped
+
+    return decorator
+
+
+class _CacheEntry:  # pylint: disable=too-few-public-methods
+    __slots__ = ('timestamp', 'value')
+
+    def __init__(self, timestamp: float, value: Any) -> None:
+        self.timestamp = timestamp
+        self.value = value
+
+
+def ttl_cached_method(ttl: float, *, name: str | None = None) -> Callable[[_Func], _Func]:
+    """A TTL cache decorator for methods with the cache stored in the instances.
+
+    Unlike :func:`ttl_cache`, the results are stored in the ``__dict__`` of each instance, so there
+    is no shared lock between the threads and no strong reference to the instances. The TTL is looked
+    up in the registry on each call as :func:`ttl_cache`.
+
+    The cache can be invalidated by ``Class.method.cache_clear(instance)`` for one instance, or by
+    ``Class.method.cache_clear()`` for all instances.
+
+    Args:
+        ttl (float):
+            The default TTL in seconds.
+        name (Optional[str]):
+            The name to register in the registry. If not given, use the name of the method.
+    """
+    ttl = _check_ttl(ttl)
+
+    def decorator(func: _Func) -> _Func:
+        cache_name = name or func.__name__
+        _register(cache_name, ttl)
+        # Use the qualified name to avoid conflicts with the overridden methods in subclasses
+        attrname = f'_ttl_cache_{func.__qualname__}'
+        cleared_at = -math.inf
+
+        @functools.wraps(func)
+        def wrapped(self: Any, *args: Any, **kwargs: Any) -> Any:
+            storage = self.__dict__
+            timestamp = time.monotonic()
+            if args or kwargs:
+                key = hashkey(*args, **kwargs)
+                try:
+                    entries = storage[attrname]
+                except KeyError:
+                    entries = storage.setdefault(attrname, {})
+                entry = entries.get(key)
+            else:
+                entry = storage.get(attrname)
+
+            if (
+                entry is not None
+                and entry.timestamp >= cleared_at
+                and timestamp - entry.timestamp < get_ttl(cache_name)
+            ):
+                return entry.value
+
+            value = func(self, *args, **kwargs)
+            if args or kwargs:
+                entries[key] = _CacheEntry(timestamp, value)
+            else:
+                storage[attrname] = _CacheEntry(timestamp, value)
+            return value
+
+        def cache_clear(instance: Any = None) -> None:
+            """Clear the cache of the given instance, or all instances if not given."""
+            nonlocal cleared_at
+
+            if instance is None:
+                cleared_at = time.monotonic()
+            else:
+                instance.__dict__.pop(attrname, None)
+
+        wrapped.cache_clear = cache_clear
+        wrapped.cache_name = cache_name
+        return wrapped
+
+    return decorator
+
+
+_TTLS.update(_parse_ttls(os.getenv('NVITOP_CACHE_TTL', default='')))
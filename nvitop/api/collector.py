@@ -26,16 +26,20 @@ import os
 import threading
 import time
 from collections import OrderedDict, defaultdict
-from typing import Callable, Hashable, Iterable, NamedTuple
-from weakref import WeakSet
+from typing import Any, Callable, Generator, Hashable, Iterable, NamedTuple
 
 from nvitop.api import host
-from nvitop.api.device import CudaDevice, Device
-from nvitop.api.process import GpuProcess, HostProcess
+from nvitop.api.device import CudaDevice, Device, diff_snapshots
+from nvitop.api.process import GpuProcess
 from nvitop.api.utils import GiB, MiB, Snapshot
 
 
-__all__ = ['take_snapshots', 'collect_in_background', 'ResourceMetricCollector']
+__all__ = [
+    'take_snapshots',
+    'stream_snapshots',
+    'collect_in_background',
+    'ResourceMetricCollector',
+]
 
 
 class SnapshotResult(NamedTuple):  # pylint: disable=missing-class-docstring
@@ -43,6 +47,12 @@ class SnapshotResult(NamedTuple):  # pylint: disable=missing-class-docstring
     gpu_processes: list[Snapshot]
 
 
+class SnapshotDelta(NamedTuple):  # pylint: disable=missing-class-docstring
+    timestamp: float
+    keyframe: bool
+    devices: dict[Device, dict[str, Any]]
+
+
 timer = time.monotonic
 
 
@@ -176,12 +186,85 @@ def take_snapshots(
             itertools.chain.from_iterable(device.processes().values() for device in leaf_devices),
         )
 
-    devices = [device.as_snapshot() for device in devices]
+    devices = Device.take_snapshots(devices)
     gpu_processes = GpuProcess.take_snapshots(gpu_processes, failsafe=True)
 
     return SnapshotResult(devices, gpu_processes)
 
 
+# pylint: disable-next=too-many-arguments
+def stream_snapshots(
+    devices: Device | Iterable[Device] | None = None,
+    interval: float = 1.0,
+    *,
+    keys: str | Iterable[str] | None = None,
+    keyframe_every: int = 60,
+    max_workers: int | None = None,
+) -> Generator[SnapshotDelta, None, None]:
+    """Yield the changed device attributes periodically, with a periodic full keyframe.
+
+    On each tick, the devices are queried by :meth:`Device.take_snapshots` and compared with the
+    snapshots of the previous tick. Only the attributes that changed are yielded. The first tick and
+    every ``keyframe_every`` ticks afterward are keyframes that contain all attributes, so a consumer
+    that starts in the middle of the stream or drops a delta can resynchronize.
+
+    Args:
+        devices (Optional[Union[Device, Iterable[Device]]]):
+            The devices to monitor. If not given, use all physical devices and the MIG devices on
+            them.
+        interval (float):
+            The interval in seconds between two ticks.
+        keys (Optional[Union[str, Iterable[str]]]):
+            The attributes to include in the snapshots. See also :meth:`Device.as_snapshot`.
+        keyframe_every (int):
+            The number of ticks between two keyframes. Use ``0`` to only send the first keyframe.
+        max_workers (Optional[int]):
+            The maximum number of worker threads. See also :meth:`Device.take_snapshots`.
+
+    Yields: SnapshotDelta
+        A named tuple of the monotonic timestamp, whether it is a keyframe, and a dictionary mapping
+        the devices to the changed attributes (all attributes for a keyframe). The devices without
+        any changes are omitted.
+
+    Examples:
+        >>> from nvitop import Device, stream_snapshots
+
+        >>> for delta in stream_snapshots(Device.all(), interval=1.0, keys='memory'):
+        ...     for device, changes in delta.devices.items():
+        ...         publish(device.uuid(), changes, keyframe=delta.keyframe)
+    """
+    if isinstance(devices, Device):
+        devices = [devices]
+    elif devices is None:
+        devices = []
+        for physical_device in Device.all():
+            devices.append(physical_device)
+            devices.extend(physical_device.mig_devices())
+    else:
+        devices = list(devices)
+    if not (isinstance(interval, (int, float)) and interval > 0):
+        raise ValueError(f'Invalid argument interval={interval!r}')
+    if not (isinstance(keyframe_every, int) and keyframe_every >= 0):
+        raise ValueError(f'Invalid argument keyframe_every={keyframe_every!r}')
+
+    previous = {}
+    next_snapshot = timer()
+    for tick in itertools.count():
+        timestamp = timer()
+        keyframe = tick == 0 or (keyframe_every > 0 and tick % keyframe_every == 0)
+        snapshots = Device.take_snapshots(devices, keys=keys, max_workers=max_workers)
+        changes = {}
+        for device, snapshot in zip(devices, snapshots):
+            changed = diff_snapshots(None if keyframe else previous.get(device), snapshot)
+            if changed:
+                changes[device] = changed
+            previous[device] = snapshot
+        yield SnapshotDelta(timestamp, keyframe, changes)
+
+        next_snapshot += interval
+        time.sleep(max(0.0, next_snapshot - timer()))
+
+
 # pylint: disable-next=too-many-arguments
 def collect_in_background(
     on_collect: Callable[[dict[str, float]], bool],
@@ -421,8 +504,9 @@ class ResourceMetricCollector:  # pylint: disable=too-many-instance-attributes
                 self.leaf_devices.append(device)
 
         self.root_pids = root_pids
-        self._positive_processes = WeakSet(HostProcess(pid) for pid in self.root_pids)
-        self._negative_processes = WeakSet()
+        # Map the PIDs of the GPU processes to their creation times and whether they are descendants
+        # of the root processes. Only the GPU processes in the last snapshot are kept.
+        self._descendants = {}
 
         self._last_timestamp = timer() - 2.0 * self.interval
         self._lock = threading.RLock()
@@ -669,38 +753,42 @@ class ResourceMetricCollector:  # pylint: disable=too-many-instance-attributes
             for device in self.leaf_devices:
                 all_gpu_processes.extend(device.processes().values())
 
-            gpu_processes = []
+            descendants = {}
+            unresolved = []
             for process in all_gpu_processes:
-                if process.host in self._negative_processes:
+                try:
+                    create_time = process.host.create_time()
+                except host.PsutilError:
                     continue
-
-                positive = True
-                if process.host not in self._positive_processes:
-                    positive = False
-                    p = process.host
-                    parents = []
-                    while p is not None:
-                        parents.append(p)
-                        if p in self._positive_processes:
-                            positive = True
-                            break
-                        try:
-                            p = p.parent()
-                        except host.PsutilError:
-                            break
-                    if positive:
-                        self._positive_processes.update(parents)
-                    else:
-                        self._negative_processes.update(parents)
-
-                if positive:
-                    gpu_processes.append(process)
+                cached = self._descendants.get(process.pid)
+                # The creation time changes when the PID is reused by a new process
+                if cached is not None and cached[0] == create_time:
+                    descendants[process.pid] = cached
+                else:
+                    unresolved.append((process.pid, create_time))
+
+            if len(unresolved) > 0:
+                # Resolve the ancestors of all new GPU processes from one snapshot of the process tree
+                ppid_map = host.ppid_map()
+                memo = {}
+                for pid, create_time in unresolved:
+                    descendants[pid] = (create_time, self._is_descendant(pid, ppid_map, memo))
+            self._descendants = descendants
+
+            gpu_processes = [
+                process
+                for process in all_gpu_processes
+                if descendants.get(process.pid, (None, False))[1]
+            ]
         else:
             gpu_processes = []
 
         timestamp = timer()
         metrics = {}
-        devices = [device.as_snapshot() for device in self.all_devices]
+        devices = Device.take_snapshots(
+            self.all_devices,
+            keys=[attr for attr, _, _ in self.DEVICE_METRICS],
+        )
         gpu_processes = GpuProcess.take_snapshots(gpu_processes, failsafe=True)
 
         metrics.update(
@@ -748,6 +836,26 @@ class ResourceMetricCollector:  # pylint: disable=too-many-instance-attributes
 
         return SnapshotResult(devices, gpu_processes)
 
+    def _is_descendant(self, pid: int, ppid_map: dict[int, int], memo: dict[int, bool]) -> bool:
+        """Return whether the process is one of the root processes or their descendants."""
+        path = []
+        visited = set()
+        positive = False
+        while pid is not None and pid not in visited:
+            if pid in self.root_pids:
+                positive = True
+                break
+            if pid in memo:
+                positive = memo[pid]
+                break
+            path.append(pid)
+            visited.add(pid)
+            pid = ppid_map.get(pid)
+
+        for p in path:
+            memo[p] = positive
+        return positive
+
     def _target(self) -> None:
         self._daemon_running.wait()
         while self._daemon_running.is_set():
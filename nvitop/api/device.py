@@ -103,19 +103,37 @@ Examples:
 
 from __future__ import annotations
 
+import array
+import atexit
+import concurrent.futures
 import contextlib
+import math
 import multiprocessing as mp
+import operator
 import os
 import re
 import threading
 from collections import OrderedDict
-from typing import Any, Callable, Iterable, NamedTuple
+from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple
 
-from cachetools.func import ttl_cache
+from cachetools.func import ttl_cache as _ttl_cache
 
-from nvitop.api import libcuda, libcudart, libnvml
+from nvitop.api import diskcache, libcuda, libcudart, libnvml
+from nvitop.api.caching import ttl_cache, ttl_cached_method
 from nvitop.api.process import GpuProcess
-from nvitop.api.utils import NA, NaType, Snapshot, boolify, bytes2human, memoize_when_activated
+from nvitop.api.utils import (
+    NA,
+    LazySnapshot,
+    NaType,
+    Snapshot,
+    boolify,
+    bytes2human,
+    memoize_when_activated,
+)
+
+
+if TYPE_CHECKING:
+    from nvitop.api.table import DeviceTable
 
 
 __all__ = [
@@ -126,6 +144,7 @@ __all__ = [
     'CudaMigDevice',
     'parse_cuda_visible_devices',
     'normalize_cuda_visible_devices',
+    'diff_snapshots',
 ]
 
 # Class definitions ################################################################################
@@ -156,8 +175,38 @@ class UtilizationRates(NamedTuple):  # in percentage # pylint: disable=missing-c
     decoder: int | NaType
 
 
+class Samples(NamedTuple):  # pylint: disable=missing-class-docstring
+    timestamps: array.array | NaType  # in microseconds since epoch
+    values: array.array | NaType
+
+
 _VALUE_OMITTED = object()
 
+# Pre-resolved NVML queries for the metrics that are polled periodically
+_QUERY_MEMORY_INFO = libnvml.nvmlBindQuery('nvmlDeviceGetMemoryInfo')
+_QUERY_BAR1_MEMORY_INFO = libnvml.nvmlBindQuery('nvmlDeviceGetBAR1MemoryInfo')
+_QUERY_UTILIZATION_RATES = libnvml.nvmlBindQuery('nvmlDeviceGetUtilizationRates')
+_QUERY_ENCODER_UTILIZATION = libnvml.nvmlBindQuery('nvmlDeviceGetEncoderUtilization')
+_QUERY_DECODER_UTILIZATION = libnvml.nvmlBindQuery('nvmlDeviceGetDecoderUtilization')
+_QUERY_CLOCK_INFO = libnvml.nvmlBindQuery('nvmlDeviceGetClockInfo')
+_QUERY_FAN_SPEED = libnvml.nvmlBindQuery('nvmlDeviceGetFanSpeed')
+_QUERY_TEMPERATURE = libnvml.nvmlBindQuery('nvmlDeviceGetTemperature')
+_QUERY_POWER_USAGE = libnvml.nvmlBindQuery('nvmlDeviceGetPowerUsage')
+_QUERY_PERFORMANCE_STATE = libnvml.nvmlBindQuery('nvmlDeviceGetPerformanceState')
+_QUERY_TOTAL_ECC_ERRORS = libnvml.nvmlBindQuery('nvmlDeviceGetTotalEccErrors')
+_QUERY_COMPUTE_RUNNING_PROCESSES = libnvml.nvmlBindQuery(
+    'nvmlDeviceGetComputeRunningProcesses',
+    default=(),
+)
+_QUERY_GRAPHICS_RUNNING_PROCESSES = libnvml.nvmlBindQuery(
+    'nvmlDeviceGetGraphicsRunningProcesses',
+    default=(),
+)
+_QUERY_PROCESS_UTILIZATION = libnvml.nvmlBindQuery(
+    'nvmlDeviceGetProcessUtilization',
+    default=(),
+)
+
 
 class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Live class of the GPU devices, different from the device snapshots.
@@ -655,12 +704,34 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
                 self._nvml_index = libnvml.nvmlQuery('nvmlDeviceGetIndex', self._handle)
 
         self._max_clock_infos = ClockInfos(graphics=NA, sm=NA, memory=NA, video=NA)
-        self._timestamp = 0
+        self._sample_timestamps = {}
         self._lock = threading.RLock()
 
+        if self._handle is not None and isinstance(self._nvml_index, int):
+            self._load_static_attrs()
+
         self._ident = (self.index, self.uuid())
         self._hash = None
 
+    def _load_static_attrs(self) -> None:
+        """Load the static attributes of the physical device from the on-disk cache if enabled."""
+        static_attrs = _get_cached_static_device_attrs(self._nvml_index, handle=self._handle)
+        if static_attrs is None:
+            return
+
+        for name in ('name', 'uuid', 'bus_id', 'memory_total'):
+            value = static_attrs.get(name)
+            if value is not None:
+                setattr(self, f'_{name}', value)
+        cuda_compute_capability = static_attrs.get('cuda_compute_capability')
+        if cuda_compute_capability is not None:
+            self._cuda_compute_capability = tuple(cuda_compute_capability)
+        max_clock_infos = static_attrs.get('max_clock_infos')
+        if max_clock_infos is not None:
+            self._max_clock_infos = ClockInfos(
+                *(NA if clock is None else clock for clock in max_clock_infos),
+            )
+
     def __repr__(self) -> str:
         """Return a string representation of the device."""
         return '{}(index={}, name="{}", total_memory={})'.format(
@@ -686,7 +757,8 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         """Get the object attribute.
 
         If the attribute is not defined, make a method from ``pynvml.nvmlDeviceGet<AttributeName>(handle)``.
-        The attribute name will be converted to PascalCase string.
+        The attribute name will be converted to PascalCase string. The results are cached for 1 second
+        by default, which can be changed by :func:`nvitop.caching.set_ttl` with the attribute name.
 
         Raises:
             AttributeError:
@@ -730,7 +802,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
                 )
                 func = getattr(libnvml, 'nvmlDeviceGet' + pascal_case + suffix)
 
-            @ttl_cache(ttl=1.0)
+            @ttl_cache(ttl=1.0, name=name)
             def attribute(*args: Any, **kwargs: Any) -> Any:
                 try:
                     return libnvml.nvmlQuery(
@@ -877,14 +949,14 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         return libnvml.nvmlQuery('nvmlDeviceGetSerial', self.handle)
 
     @memoize_when_activated
-    @ttl_cache(ttl=1.0)
+    @ttl_cached_method(ttl=1.0)
     def memory_info(self) -> MemoryInfo:  # in bytes
         """Return a named tuple with memory information (in bytes) for the device.
 
         Returns: MemoryInfo(total, free, used)
             A named tuple with memory information, the item could be :const:`nvitop.NA` when not applicable.
         """
-        memory_info = libnvml.nvmlQuery('nvmlDeviceGetMemoryInfo', self.handle)
+        memory_info = _QUERY_MEMORY_INFO(self.handle)
         if libnvml.nvmlCheckReturn(memory_info):
             return MemoryInfo(total=memory_info.total, free=memory_info.free, used=memory_info.used)
         return MemoryInfo(total=NA, free=NA, used=NA)
@@ -982,14 +1054,14 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         return f'{self.memory_used_human()} / {self.memory_total_human()}'
 
     @memoize_when_activated
-    @ttl_cache(ttl=1.0)
+    @ttl_cached_method(ttl=1.0)
     def bar1_memory_info(self) -> MemoryInfo:  # in bytes
         """Return a named tuple with BAR1 memory information (in bytes) for the device.
 
         Returns: MemoryInfo(total, free, used)
             A named tuple with BAR1 memory information, the item could be :const:`nvitop.NA` when not applicable.
         """  # pylint: disable=line-too-long
-        memory_info = libnvml.nvmlQuery('nvmlDeviceGetBAR1MemoryInfo', self.handle)
+        memory_info = _QUERY_BAR1_MEMORY_INFO(self.handle)
         if libnvml.nvmlCheckReturn(memory_info):
             return MemoryInfo(
                 total=memory_info.bar1Total,
@@ -1069,7 +1141,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         return f'{self.bar1_memory_used_human()} / {self.bar1_memory_total_human()}'
 
     @memoize_when_activated
-    @ttl_cache(ttl=1.0)
+    @ttl_cached_method(ttl=1.0)
     def utilization_rates(self) -> UtilizationRates:  # in percentage
         """Return a named tuple with GPU utilization rates (in percentage) for the device.
 
@@ -1078,15 +1150,15 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         """  # pylint: disable=line-too-long
         gpu, memory, encoder, decoder = NA, NA, NA, NA
 
-        utilization_rates = libnvml.nvmlQuery('nvmlDeviceGetUtilizationRates', self.handle)
+        utilization_rates = _QUERY_UTILIZATION_RATES(self.handle)
         if libnvml.nvmlCheckReturn(utilization_rates):
             gpu, memory = utilization_rates.gpu, utilization_rates.memory
 
-        encoder_utilization = libnvml.nvmlQuery('nvmlDeviceGetEncoderUtilization', self.handle)
+        encoder_utilization = _QUERY_ENCODER_UTILIZATION(self.handle)
         if libnvml.nvmlCheckReturn(encoder_utilization, list) and len(encoder_utilization) > 0:
             encoder = encoder_utilization[0]
 
-        decoder_utilization = libnvml.nvmlQuery('nvmlDeviceGetDecoderUtilization', self.handle)
+        decoder_utilization = _QUERY_DECODER_UTILIZATION(self.handle)
         if libnvml.nvmlCheckReturn(decoder_utilization, list) and len(decoder_utilization) > 0:
             decoder = decoder_utilization[0]
 
@@ -1142,8 +1214,66 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         """
         return self.utilization_rates().decoder
 
+    # The metrics that are sampled by the driver at a higher frequency in a ring buffer
+    SAMPLE_TYPES = {
+        'gpu_utilization': libnvml.NVML_GPU_UTILIZATION_SAMPLES,  # in percentage
+        'memory_utilization': libnvml.NVML_MEMORY_UTILIZATION_SAMPLES,  # in percentage
+        'encoder_utilization': libnvml.NVML_ENC_UTILIZATION_SAMPLES,  # in percentage
+        'decoder_utilization': libnvml.NVML_DEC_UTILIZATION_SAMPLES,  # in percentage
+        'power_usage': libnvml.NVML_TOTAL_POWER_SAMPLES,  # in milliwatts (mW)
+        'sm_clock': libnvml.NVML_PROCESSOR_CLK_SAMPLES,  # in MHz
+        'memory_clock': libnvml.NVML_MEMORY_CLK_SAMPLES,  # in MHz
+    }
+
+    def samples(self, sample_type: str, since: int | None = None) -> Samples:
+        """Return the samples of a metric buffered by the driver since the last call.
+
+        The driver samples the metrics in :attr:`SAMPLE_TYPES` at a higher frequency than the usual
+        polling interval (e.g., every 1/6 second for the utilization rates) and keeps the recent
+        samples in a ring buffer. This method drains the buffer, so calling it once per second gives
+        sub-second resolution without high-frequency polling.
+
+        Args:
+            sample_type (str):
+                The metric to sample, one of the keys in :attr:`SAMPLE_TYPES`.
+            since (Optional[int]):
+                Only return the samples newer than the timestamp (in microseconds since epoch). If not
+                given, return the samples newer than the latest one returned by the last call for the
+                same sample type, i.e., each sample is returned only once.
+
+        Returns: Samples(timestamps, values)
+            A named tuple with two compact arrays (:class:`array.array`): the timestamps (in microseconds since epoch) and the sample values. The arrays are empty if no new samples are available. The items will be :const:`nvitop.NA` when not applicable.
+
+        Raises:
+            ValueError:
+                If the sample type is unknown.
+        """  # pylint: disable=line-too-long
+        try:
+            sampling_type = self.SAMPLE_TYPES[sample_type]
+        except KeyError as ex:
+            raise ValueError(
+                f'Unknown sample type {sample_type!r}. '
+                f'Available sample types: {", ".join(map(repr, self.SAMPLE_TYPES))}.',
+            ) from ex
+
+        with self._lock:
+            if since is None:
+                since = self._sample_timestamps.get(sample_type, 0)
+                update_timestamp = True
+            else:
+                update_timestamp = False
+
+            samples = libnvml.nvmlQuerySamples(self.handle, sampling_type, since)
+            if not libnvml.nvmlCheckReturn(samples, tuple):
+                return Samples(timestamps=NA, values=NA)
+
+            timestamps, values = samples
+            if update_timestamp and len(timestamps) > 0:
+                self._sample_timestamps[sample_type] = max(timestamps)
+        return Samples(timestamps=timestamps, values=values)
+
     @memoize_when_activated
-    @ttl_cache(ttl=5.0)
+    @ttl_cached_method(ttl=5.0)
     def clock_infos(self) -> ClockInfos:  # in MHz
         """Return a named tuple with current clock speeds (in MHz) for the device.
 
@@ -1151,24 +1281,16 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             A named tuple with current clock speeds (in MHz) for the device, the item could be :const:`nvitop.NA` when not applicable.
         """  # pylint: disable=line-too-long
         return ClockInfos(
-            graphics=libnvml.nvmlQuery(
-                'nvmlDeviceGetClockInfo',
-                self.handle,
-                libnvml.NVML_CLOCK_GRAPHICS,
-            ),
-            sm=libnvml.nvmlQuery('nvmlDeviceGetClockInfo', self.handle, libnvml.NVML_CLOCK_SM),
-            memory=libnvml.nvmlQuery('nvmlDeviceGetClockInfo', self.handle, libnvml.NVML_CLOCK_MEM),
-            video=libnvml.nvmlQuery(
-                'nvmlDeviceGetClockInfo',
-                self.handle,
-                libnvml.NVML_CLOCK_VIDEO,
-            ),
+            graphics=_QUERY_CLOCK_INFO(self.handle, libnvml.NVML_CLOCK_GRAPHICS),
+            sm=_QUERY_CLOCK_INFO(self.handle, libnvml.NVML_CLOCK_SM),
+            memory=_QUERY_CLOCK_INFO(self.handle, libnvml.NVML_CLOCK_MEM),
+            video=_QUERY_CLOCK_INFO(self.handle, libnvml.NVML_CLOCK_VIDEO),
         )
 
     clocks = clock_infos
 
     @memoize_when_activated
-    @ttl_cache(ttl=5.0)
+    @ttl_cached_method(ttl=5.0)
     def max_clock_infos(self) -> ClockInfos:  # in MHz
         """Return a named tuple with maximum clock speeds (in MHz) for the device.
 
@@ -1309,7 +1431,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         """  # pylint: disable=line-too-long
         return self.max_clock_infos().video
 
-    @ttl_cache(ttl=5.0)
+    @ttl_cached_method(ttl=5.0)
     def fan_speed(self) -> int | NaType:  # in percentage
         """The fan speed value is the percent of the product's maximum noise tolerance fan speed that the device's fan is currently intended to run at.
 
@@ -1327,9 +1449,9 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
             nvidia-smi --id=<IDENTIFIER> --format=csv,noheader,nounits --query-gpu=fan.speed
         """  # pylint: disable=line-too-long
-        return libnvml.nvmlQuery('nvmlDeviceGetFanSpeed', self.handle)
+        return _QUERY_FAN_SPEED(self.handle)
 
-    @ttl_cache(ttl=5.0)
+    @ttl_cached_method(ttl=5.0)
     def temperature(self) -> int | NaType:  # in Celsius
         """Core GPU temperature in degrees C.
 
@@ -1342,14 +1464,10 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
             nvidia-smi --id=<IDENTIFIER> --format=csv,noheader,nounits --query-gpu=temperature.gpu
         """
-        return libnvml.nvmlQuery(
-            'nvmlDeviceGetTemperature',
-            self.handle,
-            libnvml.NVML_TEMPERATURE_GPU,
-        )
+        return _QUERY_TEMPERATURE(self.handle, libnvml.NVML_TEMPERATURE_GPU)
 
     @memoize_when_activated
-    @ttl_cache(ttl=5.0)
+    @ttl_cached_method(ttl=5.0)
     def power_usage(self) -> int | NaType:  # in milliwatts (mW)
         """The last measured power draw for the entire board in milliwatts.
 
@@ -1362,12 +1480,15 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
             $(( "$(nvidia-smi --id=<IDENTIFIER> --format=csv,noheader,nounits --query-gpu=power.draw)" * 1000 ))
         """
-        return libnvml.nvmlQuery('nvmlDeviceGetPowerUsage', self.handle)
+        power_usage = self._field_values()[libnvml.NVML_FI_DEV_POWER_AVERAGE]
+        if libnvml.nvmlCheckReturn(power_usage, int):
+            return power_usage
+        return _QUERY_POWER_USAGE(self.handle)
 
     power_draw = power_usage  # in milliwatts (mW)
 
     @memoize_when_activated
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def power_limit(self) -> int | NaType:  # in milliwatts (mW)
         """The software power limit in milliwatts.
 
@@ -1382,8 +1503,35 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
             $(( "$(nvidia-smi --id=<IDENTIFIER> --format=csv,noheader,nounits --query-gpu=power.limit)" * 1000 ))
         """
+        power_limit = self._field_values()[libnvml.NVML_FI_DEV_POWER_CURRENT_LIMIT]
+        if libnvml.nvmlCheckReturn(power_limit, int):
+            return power_limit
         return libnvml.nvmlQuery('nvmlDeviceGetPowerManagementLimit', self.handle)
 
+    # Scalar metrics that can be fetched together in one driver round-trip
+    FIELD_VALUE_IDS = (
+        libnvml.NVML_FI_DEV_POWER_AVERAGE,
+        libnvml.NVML_FI_DEV_POWER_CURRENT_LIMIT,
+        libnvml.NVML_FI_DEV_ECC_DBE_VOL_TOTAL,
+    )
+
+    @memoize_when_activated
+    @ttl_cached_method(ttl=1.0)
+    def _field_values(self) -> dict[int, int | float | NaType]:
+        """Return a dictionary of the scalar metrics defined in :attr:`FIELD_VALUE_IDS`.
+
+        The values are fetched by a single call of ``nvmlDeviceGetFieldValues``. The value will be
+        :const:`nvitop.NA` if the field is not supported or fails to query, the caller should
+        fallback to the dedicated NVML function. The unsupported fields are not requested again
+        until the capability cache is cleared (see :func:`libnvml.nvmlCapabilityCacheClear`).
+        """
+        return dict(
+            zip(
+                self.FIELD_VALUE_IDS,
+                libnvml.nvmlQueryFieldValues(self.handle, list(self.FIELD_VALUE_IDS)),
+            ),
+        )
+
     def power_status(self) -> str:  # string of power usage over power limit in watts (W)
         """The string of power usage over power limit in watts.
 
@@ -1398,7 +1546,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             power_limit = f'{round(power_limit / 1000.0)}W'
         return f'{power_usage} / {power_limit}'
 
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def display_active(self) -> str | NaType:
         """A flag that indicates whether a display is initialized on the GPU's (e.g. memory is allocated on the device for display).
 
@@ -1421,7 +1569,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             NA,
         )
 
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def display_mode(self) -> str | NaType:
         """A flag that indicates whether a physical display (e.g. monitor) is currently connected to any of the GPU's connectors.
 
@@ -1443,7 +1591,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             NA,
         )
 
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def current_driver_model(self) -> str | NaType:
         """The driver model currently in use.
 
@@ -1471,7 +1619,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
     driver_model = current_driver_model
 
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def persistence_mode(self) -> str | NaType:
         """A flag that indicates whether persistence mode is enabled for the GPU. Value is either "Enabled" or "Disabled".
 
@@ -1495,7 +1643,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             NA,
         )
 
-    @ttl_cache(ttl=5.0)
+    @ttl_cached_method(ttl=5.0)
     def performance_state(self) -> str | NaType:
         """The current performance state for the GPU. States range from P0 (maximum performance) to P12 (minimum performance).
 
@@ -1508,12 +1656,12 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
             nvidia-smi --id=<IDENTIFIER> --format=csv,noheader,nounits --query-gpu=pstate
         """  # pylint: disable=line-too-long
-        performance_state = libnvml.nvmlQuery('nvmlDeviceGetPerformanceState', self.handle)
+        performance_state = _QUERY_PERFORMANCE_STATE(self.handle)
         if libnvml.nvmlCheckReturn(performance_state, int):
             performance_state = 'P' + str(performance_state)
         return performance_state
 
-    @ttl_cache(ttl=5.0)
+    @ttl_cached_method(ttl=5.0)
     def total_volatile_uncorrected_ecc_errors(self) -> int | NaType:
         """Total errors detected across entire chip.
 
@@ -1526,14 +1674,16 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
             nvidia-smi --id=<IDENTIFIER> --format=csv,noheader,nounits --query-gpu=ecc.errors.uncorrected.volatile.total
         """  # pylint: disable=line-too-long
-        return libnvml.nvmlQuery(
-            'nvmlDeviceGetTotalEccErrors',
+        ecc_errors = self._field_values()[libnvml.NVML_FI_DEV_ECC_DBE_VOL_TOTAL]
+        if libnvml.nvmlCheckReturn(ecc_errors, int):
+            return ecc_errors
+        return _QUERY_TOTAL_ECC_ERRORS(
             self.handle,
             libnvml.NVML_MEMORY_ERROR_TYPE_UNCORRECTED,
             libnvml.NVML_VOLATILE_ECC,
         )
 
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def compute_mode(self) -> str | NaType:
         """The compute mode flag indicates whether individual or multiple compute applications may run on the GPU.
 
@@ -1588,7 +1738,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             self._is_mig_device = bool(is_mig_device)  # nvmlDeviceIsMigDeviceHandle returns c_uint
         return self._is_mig_device
 
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def mig_mode(self) -> str | NaType:
         """The MIG mode that the GPU is currently operating under.
 
@@ -1653,69 +1803,223 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             return [self]
         return self.mig_devices()
 
-    @ttl_cache(ttl=2.0)
+    @ttl_cached_method(ttl=2.0)
     def processes(self) -> dict[int, GpuProcess]:
         """Return a dictionary of processes running on the GPU.
 
+        The process lists and the process utilization samples are fetched by a sampler shared by all
+        :class:`Device` instances of the same GPU, at most once per ``'process_samples'`` TTL (see
+        :mod:`nvitop.caching`). So multiple consumers polling the same GPU (e.g., the TUI, the
+        metric collectors and user code) see the same sample window instead of moving each other's
+        cursor of ``nvmlDeviceGetProcessUtilization``.
+
         Returns: Dict[int, GpuProcess]
             A dictionary mapping PID to GPU process instance.
         """
         processes = {}
+        samples = _get_process_sampler(self).sample()
 
         found_na = False
-        for type, func in (  # pylint: disable=redefined-builtin
-            ('C', 'nvmlDeviceGetComputeRunningProcesses'),
-            ('G', 'nvmlDeviceGetGraphicsRunningProcesses'),
+        for type, running_processes in (  # pylint: disable=redefined-builtin
+            ('C', samples.compute_processes),
+            ('G', samples.graphics_processes),
         ):
-            for p in libnvml.nvmlQuery(func, self.handle, default=()):
-                if isinstance(p.usedGpuMemory, int):
-                    gpu_memory = p.usedGpuMemory
-                else:
-                    # Used GPU memory is `N/A` on Windows Display Driver Model (WDDM)
-                    # or on MIG-enabled GPUs
-                    gpu_memory = NA
-                    found_na = True
-                proc = processes[p.pid] = self.GPU_PROCESS_CLASS(
-                    pid=p.pid,
-                    device=self,
-                    gpu_memory=gpu_memory,
-                    gpu_instance_id=getattr(p, 'gpuInstanceId', 0xFFFFFFFF),
-                    compute_instance_id=getattr(p, 'computeInstanceId', 0xFFFFFFFF),
-                )
-                proc.type = proc.type + type
+            # Used GPU memory is `N/A` on Windows Display Driver Model (WDDM)
+            # or on MIG-enabled GPUs
+            found_na = found_na or any(
+                not isinstance(p.usedGpuMemory, int) for p in running_processes
+            )
+            processes.update(self.GPU_PROCESS_CLASS.from_nvml(self, running_processes, type=type))
 
         if len(processes) > 0:
-            samples = libnvml.nvmlQuery(
-                'nvmlDeviceGetProcessUtilization',
-                self.handle,
-                self._timestamp,
-                default=(),
-            )
-            self._timestamp = max(min((s.timeStamp for s in samples), default=0) - 2_000_000, 0)
-            for s in samples:
+            for s in samples.utilization:
                 try:
                     processes[s.pid].set_gpu_utilization(s.smUtil, s.memUtil, s.encUtil, s.decUtil)
                 except KeyError:
                     pass
             if not found_na:
-                for pid in set(processes).difference(s.pid for s in samples):
+                for pid in set(processes).difference(s.pid for s in samples.utilization):
                     processes[pid].set_gpu_utilization(0, 0, 0, 0)
 
         return processes
 
-    def as_snapshot(self) -> Snapshot:
+    def as_snapshot(
+        self,
+        keys: str | Iterable[str] | None = None,
+        *,
+        lazy: bool = False,
+    ) -> Snapshot:
         """Return a onetime snapshot of the device.
 
-        The attributes are defined in :attr:`SNAPSHOT_KEYS`.
+        The attributes are defined in :attr:`SNAPSHOT_KEYS`. The attributes that are not included in
+        the snapshot will be fetched from the device on first access.
+
+        Args:
+            keys (Optional[Union[str, Iterable[str]]]):
+                The attributes to include in the snapshot. Each item can be a key in
+                :attr:`SNAPSHOT_KEYS` or a preset name in :attr:`SNAPSHOT_PRESETS` (e.g.,
+                ``'memory'``, ``'utilization'``, ``'thermal'`` and ``'full'``). If not given, include
+                all attributes in :attr:`SNAPSHOT_KEYS`.
+            lazy (bool):
+                If :data:`True`, return a :class:`LazySnapshot` that fetches each attribute on first
+                access and then freezes it. The values share the results of the underlying queries
+                (e.g., :meth:`memory_info`) as if they were fetched in one :meth:`oneshot` context.
+
+        Raises:
+            ValueError:
+                If any of the given keys is neither a snapshot key nor a preset name.
+
+        Examples:
+            >>> device = Device(0)
+            >>> device.as_snapshot(keys='memory')
+            PhysicalDeviceSnapshot(
+                real=PhysicalDevice(index=0, ...),
+                index=0,
+                memory_free=8218152960,
+                memory_info=MemoryInfo(total=8589934592, free=8218152960, used=371781632),
+                ...
+            )
+            >>> device.as_snapshot(keys=('memory_used', 'gpu_utilization', 'thermal'))
+            PhysicalDeviceSnapshot(...)
         """
+        keys = self._resolve_snapshot_keys(keys)
+        if lazy:
+            return LazySnapshot(
+                real=self,
+                keys=keys,
+                index=self.index,
+                physical_index=self.physical_index,
+            )
         with self.oneshot():
             return Snapshot(
                 real=self,
                 index=self.index,
                 physical_index=self.physical_index,
-                **{key: getattr(self, key)() for key in self.SNAPSHOT_KEYS},
+                **{key: getattr(self, key)() for key in keys},
             )
 
+    def diff_snapshot(
+        self,
+        previous: Snapshot | None = None,
+        keys: str | Iterable[str] | None = None,
+    ) -> tuple[Snapshot, dict[str, Any]]:
+        """Take a new snapshot and return the attributes that changed since the previous snapshot.
+
+        Args:
+            previous (Optional[Snapshot]):
+                The previous snapshot of the device. If not given, all attributes are considered as
+                changed.
+            keys (Optional[Union[str, Iterable[str]]]):
+                The attributes to include in the snapshot. See also :meth:`as_snapshot`.
+
+        Returns: Tuple[Snapshot, Dict[str, Any]]
+            A tuple of the new snapshot (pass it as ``previous`` on the next call) and a dictionary
+            of the changed attributes with the new values.
+
+        Examples:
+            >>> device = Device(0)
+            >>> snapshot, changes = device.diff_snapshot()  # all attributes
+            >>> snapshot, changes = device.diff_snapshot(snapshot)
+            >>> changes
+            {'memory_used': 1073741824, 'memory_free': 7516192768, 'gpu_utilization': 17, ...}
+        """
+        snapshot = self.as_snapshot(keys=keys)
+        return snapshot, diff_snapshots(previous, snapshot)
+
+    @classmethod
+    def _resolve_snapshot_keys(cls, keys: str | Iterable[str] | None) -> list[str]:
+        if keys is None:
+            return cls.SNAPSHOT_KEYS
+        if isinstance(keys, str):
+            keys = (keys,)
+
+        selected = set()
+        for key in keys:
+            if key in cls.SNAPSHOT_PRESETS:
+                preset = cls.SNAPSHOT_PRESETS[key]
+                selected.update(cls.SNAPSHOT_KEYS if preset is None else preset)
+            elif key in cls.SNAPSHOT_KEYS:
+                selected.add(key)
+            else:
+                raise ValueError(
+                    f'Unknown snapshot key {key!r}. '
+                    f'Available presets: {", ".join(map(repr, cls.SNAPSHOT_PRESETS))}.',
+                )
+        return [key for key in cls.SNAPSHOT_KEYS if key in selected]
+
+    @classmethod
+    def take_snapshots(  # batched version of `as_snapshot`
+        cls,
+        devices: Iterable[Device],
+        *,
+        keys: str | Iterable[str] | None = None,
+        lazy: bool = False,
+        as_table: bool = False,
+        max_workers: int | None = None,
+    ) -> list[Snapshot] | DeviceTable:
+        """Take snapshots for a list of :class:`Device` instances.
+
+        The NVML calls release the GIL, so the snapshots are taken concurrently in a shared thread
+        pool. The order of the returned snapshots is the same as the given devices.
+
+        Args:
+            devices (Iterable[Device]):
+                The devices to take snapshots.
+            keys (Optional[Union[str, Iterable[str]]]):
+                The attributes to include in the snapshots. See also :meth:`as_snapshot`.
+            lazy (bool):
+                If :data:`True`, return lazy snapshots without querying the devices. The thread pool
+                will not be used. See also :meth:`as_snapshot`.
+            as_table (bool):
+                If :data:`True`, return a columnar :class:`DeviceTable` of the dynamic metrics
+                instead of a list of snapshots. Arguments ``keys`` and ``lazy`` are ignored.
+            max_workers (Optional[int]):
+                The maximum number of worker threads used by this call. If not given, use one thread
+                per device. The threads are taken from a shared pool with at most
+                :const:`SNAPSHOT_MAX_WORKERS` threads. The snapshots are taken serially in the
+                calling thread if it is less than 2.
+
+        Examples:
+            >>> Device.take_snapshots(Device.all())
+            [
+                PhysicalDeviceSnapshot(
+                    real=PhysicalDevice(index=0, ...),
+                    ...
+                ),
+                ...
+            ]
+        """
+        devices = list(devices)
+        if as_table:
+            from nvitop.api.table import DeviceTable  # pylint: disable=import-outside-toplevel
+
+            return DeviceTable.from_devices(devices, max_workers=max_workers)
+        if lazy:
+            return [device.as_snapshot(keys=keys, lazy=True) for device in devices]
+
+        as_snapshot = (
+            operator.methodcaller('as_snapshot')
+            if keys is None
+            else operator.methodcaller('as_snapshot', keys=keys)
+        )
+        if max_workers is None:
+            max_workers = SNAPSHOT_MAX_WORKERS
+        max_workers = min(len(devices), max_workers, SNAPSHOT_MAX_WORKERS)
+        if max_workers < 2 or threading.current_thread().name.startswith(
+            _SNAPSHOT_THREAD_NAME_PREFIX,  # avoid deadlock when called in the worker threads
+        ):
+            return list(map(as_snapshot, devices))
+
+        # Split the devices into `max_workers` chunks to limit the concurrency of this call
+        chunk_size = -(-len(devices) // max_workers)
+        chunks = [devices[i : i + chunk_size] for i in range(0, len(devices), chunk_size)]
+        executor = _get_snapshot_executor()
+        return [
+            snapshot
+            for snapshots in executor.map(lambda chunk: list(map(as_snapshot, chunk)), chunks)
+            for snapshot in snapshots
+        ]
+
     SNAPSHOT_KEYS = [
         'name',
         'uuid',
@@ -1755,6 +2059,44 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         'mig_mode',
     ]
 
+    SNAPSHOT_PRESETS = {
+        'memory': (
+            'memory_info',
+            'memory_used',
+            'memory_free',
+            'memory_total',
+            'memory_used_human',
+            'memory_free_human',
+            'memory_total_human',
+            'memory_percent',
+            'memory_usage',
+        ),
+        'utilization': (
+            'utilization_rates',
+            'gpu_utilization',
+            'memory_utilization',
+            'encoder_utilization',
+            'decoder_utilization',
+        ),
+        'thermal': (
+            'fan_speed',
+            'temperature',
+            'power_usage',
+            'power_limit',
+            'power_status',
+            'performance_state',
+        ),
+        'clock': (
+            'clock_infos',
+            'max_clock_infos',
+            'clock_speed_infos',
+            'sm_clock',
+            'memory_clock',
+        ),
+        'full': None,  # all keys in `SNAPSHOT_KEYS`
+    }
+    """Named groups of :attr:`SNAPSHOT_KEYS` for :meth:`as_snapshot`."""
+
     # Modified from psutil (https://github.com/giampaolo/psutil)
     @contextlib.contextmanager
     def oneshot(self) -> contextlib.AbstractContextManager:
@@ -1798,6 +2140,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
                 yield
             else:
                 try:
+                    self._field_values.cache_activate(self)
                     self.memory_info.cache_activate(self)
                     self.bar1_memory_info.cache_activate(self)
                     self.utilization_rates.cache_activate(self)
@@ -1807,6 +2150,7 @@ class Device:  # pylint: disable=too-many-instance-attributes,too-many-public-me
                     self.power_limit.cache_activate(self)
                     yield
                 finally:
+                    self._field_values.cache_deactivate(self)
                     self.memory_info.cache_deactivate(self)
                     self.bar1_memory_info.cache_deactivate(self)
                     self.utilization_rates.cache_deactivate(self)
@@ -1834,7 +2178,7 @@ class PhysicalDevice(Device):
         """
         return self._nvml_index
 
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def max_mig_device_count(self) -> int:
         """Return the maximum number of MIG instances the device supports.
 
@@ -1847,7 +2191,7 @@ class PhysicalDevice(Device):
             ignore_function_not_found=True,
         )
 
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def mig_device(self, mig_index: int) -> MigDevice:
         """Return a child MIG device of the given index.
 
@@ -1858,27 +2202,19 @@ class PhysicalDevice(Device):
         with _global_physical_device(self):
             return MigDevice(index=(self.index, mig_index))
 
-    @ttl_cache(ttl=60.0)
+    @ttl_cached_method(ttl=60.0)
     def mig_devices(self) -> list[MigDevice]:
         """Return a list of children MIG devices of the current device.
 
         This method will return an empty list if the MIG mode is disabled or the device does not
         support MIG mode.
-        """
-        mig_devices = []
 
-        if self.is_mig_mode_enabled():
-            max_mig_device_count = self.max_mig_device_count()
-            with _global_physical_device(self):
-                for mig_index in range(max_mig_device_count):
-                    try:
-                        mig_device = MigDevice(index=(self.index, mig_index))
-                    except libnvml.NVMLError:
-                        break
-                    else:
-                        mig_devices.append(mig_device)
-
-        return mig_devices
+        The MIG topology is refreshed incrementally. The :class:`MigDevice` instances of the
+        unchanged GPU/compute instances are reused across calls (and across the
+        :class:`PhysicalDevice` instances of the same GPU), only the new instances are created. See
+        also :meth:`MigDevice.add_topology_callback`.
+        """
+        return _MIG_TOPOLOGY_TRACKER.refresh(self)
 
 
 class MigDevice(Device):  # pylint: disable=too-many-instance-attributes
@@ -1897,6 +2233,31 @@ class MigDevice(Device):  # pylint: disable=too-many-instance-attributes
             mig_devices.extend(device.mig_devices())
         return mig_devices
 
+    @staticmethod
+    def add_topology_callback(
+        callback: Callable[[PhysicalDevice, list[MigDevice], list[MigDevice]], None],
+    ) -> None:
+        """Register a callback function to be called when the MIG topology changes.
+
+        The callback is called as ``callback(physical_device, added, removed)`` by
+        :meth:`PhysicalDevice.mig_devices` when it detects that GPU/compute instances were created or
+        destroyed on the physical device. The MIG devices found on the first refresh of each physical
+        device are reported as added.
+
+        Examples:
+            >>> def on_change(physical_device, added, removed):
+            ...     print(f'GPU {physical_device.index}: +{len(added)} -{len(removed)} MIG devices')
+            >>> MigDevice.add_topology_callback(on_change)
+        """
+        _MIG_TOPOLOGY_TRACKER.add_callback(callback)
+
+    @staticmethod
+    def remove_topology_callback(
+        callback: Callable[[PhysicalDevice, list[MigDevice], list[MigDevice]], None],
+    ) -> None:
+        """Unregister a callback function registered by :meth:`add_topology_callback`."""
+        _MIG_TOPOLOGY_TRACKER.remove_callback(callback)
+
     @classmethod
     def from_indices(  # pylint: disable=signature-differs
         cls,
@@ -2003,7 +2364,7 @@ class MigDevice(Device):  # pylint: disable=too-many-instance-attributes
                 raise libnvml.NVMLError_NotFound
 
         self._max_clock_infos = ClockInfos(graphics=NA, sm=NA, memory=NA, video=NA)
-        self._timestamp = 0
+        self._sample_timestamps = {}
         self._lock = threading.RLock()
 
         self._ident = (self.index, self.uuid())
@@ -2061,12 +2422,17 @@ class MigDevice(Device):  # pylint: disable=too-many-instance-attributes
                 self._compute_instance_id = NA
         return self._compute_instance_id
 
-    def as_snapshot(self) -> Snapshot:
+    def as_snapshot(
+        self,
+        keys: str | Iterable[str] | None = None,
+        *,
+        lazy: bool = False,
+    ) -> Snapshot:
         """Return a onetime snapshot of the device.
 
-        The attributes are defined in :attr:`SNAPSHOT_KEYS`.
+        The attributes are defined in :attr:`SNAPSHOT_KEYS`. See also :meth:`Device.as_snapshot`.
         """
-        snapshot = super().as_snapshot()
+        snapshot = super().as_snapshot(keys=keys, lazy=lazy)
         snapshot.mig_index = self.mig_index
 
         return snapshot
@@ -2293,12 +2659,17 @@ class CudaDevice(Device):
         """Return state information for pickling."""
         return self.__class__, (self._cuda_index,)
 
-    def as_snapshot(self) -> Snapshot:
+    def as_snapshot(
+        self,
+        keys: str | Iterable[str] | None = None,
+        *,
+        lazy: bool = False,
+    ) -> Snapshot:
         """Return a onetime snapshot of the device.
 
-        The attributes are defined in :attr:`SNAPSHOT_KEYS`.
+        The attributes are defined in :attr:`SNAPSHOT_KEYS`. See also :meth:`Device.as_snapshot`.
         """
-        snapshot = super().as_snapshot()
+        snapshot = super().as_snapshot(keys=keys, lazy=lazy)
         snapshot.cuda_index = self.cuda_index
 
         return snapshot
@@ -2436,6 +2807,21 @@ def normalize_cuda_visible_devices(cuda_visible_devices: str | None = _VALUE_OMI
     return ','.join(_parse_cuda_visible_devices(cuda_visible_devices, format='uuid'))
 
 
+def diff_snapshots(previous: Snapshot | None, current: Snapshot) -> dict[str, Any]:
+    """Return the attributes in the current snapshot that differ from the previous snapshot."""
+    if previous is None:
+        return {key: current[key] for key in current}
+
+    missing = object()
+    changes = {}
+    for key in current:
+        value = current[key]
+        previous_value = previous.__dict__.get(key, missing)
+        if previous_value is missing or not _same_value(previous_value, value):
+            changes[key] = value
+    return changes
+
+
 # Helper functions #################################################################################
 
 
@@ -2449,6 +2835,200 @@ class _PhysicalDeviceAttrs(NamedTuple):
 _PHYSICAL_DEVICE_ATTRS = None
 _GLOBAL_PHYSICAL_DEVICE = None
 _GLOBAL_PHYSICAL_DEVICE_LOCK = threading.RLock()
+_SNAPSHOT_EXECUTOR = None
+_SNAPSHOT_EXECUTOR_LOCK = threading.Lock()
+_SNAPSHOT_THREAD_NAME_PREFIX = 'device-snapshot'
+
+SNAPSHOT_MAX_WORKERS = 16
+"""The maximum number of worker threads of the shared pool for :meth:`Device.take_snapshots`."""
+
+
+def _get_snapshot_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _SNAPSHOT_EXECUTOR  # pylint: disable=global-statement
+
+    with _SNAPSHOT_EXECUTOR_LOCK:
+        if _SNAPSHOT_EXECUTOR is None:
+            _SNAPSHOT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=SNAPSHOT_MAX_WORKERS,
+                thread_name_prefix=_SNAPSHOT_THREAD_NAME_PREFIX,
+            )
+            atexit.register(_SNAPSHOT_EXECUTOR.shutdown, wait=False)
+        return _SNAPSHOT_EXECUTOR
+
+
+class _ProcessSamples(NamedTuple):
+    compute_processes: tuple[Any, ...]
+    graphics_processes: tuple[Any, ...]
+    utilization: tuple[Any, ...]
+
+
+class _ProcessSampler:
+    """Fetch the running processes and the process utilization samples of a GPU.
+
+    One sampler is shared by all :class:`Device` instances of the same GPU. It keeps the timestamp
+    cursor of ``nvmlDeviceGetProcessUtilization`` and fetches at most once per TTL, so all consumers
+    read the same results.
+    """
+
+    def __init__(self, handle: libnvml.c_nvmlDevice_t) -> None:
+        self.handle = handle
+        self._timestamp = 0
+        self._lock = threading.Lock()
+
+    def cache_clear(self) -> None:
+        """Invalidate the cached samples, so the next call of :meth:`sample` fetches new ones."""
+        type(self)._sample.cache_clear(self)
+
+    def sample(self) -> _ProcessSamples:
+        # Serialize the callers, so only the first one fetches and the others hit the cache
+        with self._lock:
+            return self._sample()
+
+    @ttl_cached_method(ttl=1.0, name='process_samples')
+    def _sample(self) -> _ProcessSamples:
+        compute_processes = tuple(_QUERY_COMPUTE_RUNNING_PROCESSES(self.handle))
+        graphics_processes = tuple(_QUERY_GRAPHICS_RUNNING_PROCESSES(self.handle))
+        utilization = ()
+        if len(compute_processes) > 0 or len(graphics_processes) > 0:
+            utilization = tuple(_QUERY_PROCESS_UTILIZATION(self.handle, self._timestamp))
+            self._timestamp = max(
+                min((s.timeStamp for s in utilization), default=0) - 2_000_000,
+                0,
+            )
+        return _ProcessSamples(compute_processes, graphics_processes, utilization)
+
+
+_PROCESS_SAMPLERS: dict[str, _ProcessSampler] = {}
+_PROCESS_SAMPLERS_LOCK = threading.Lock()
+
+
+def _get_process_sampler(device: Device) -> _ProcessSampler:
+    uuid = device.uuid()
+    if not libnvml.nvmlCheckReturn(uuid, str):  # `NA` is a `str` instance
+        return _ProcessSampler(device.handle)
+
+    with _PROCESS_SAMPLERS_LOCK:
+        try:
+            return _PROCESS_SAMPLERS[uuid]
+        except KeyError:
+            sampler = _PROCESS_SAMPLERS[uuid] = _ProcessSampler(device.handle)
+            return sampler
+
+
+class _MigTopologyTracker:
+    """Track the MIG devices of the physical devices and reuse the unchanged instances.
+
+    A MIG device is identified by its index on the parent device and its UUID. The UUID changes when
+    the GPU/compute instance is destroyed and created again, even with the same instance IDs.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._topologies: dict[str | int, dict[tuple[int, str], MigDevice]] = {}
+        self._callbacks: list[Callable[[PhysicalDevice, list[MigDevice], list[MigDevice]], None]] = []
+
+    def add_callback(
+        self,
+        callback: Callable[[PhysicalDevice, list[MigDevice], list[MigDevice]], None],
+    ) -> None:
+        with self._lock:
+            if callback not in self._callbacks:
+                self._callbacks.append(callback)
+
+    def remove_callback(
+        self,
+        callback: Callable[[PhysicalDevice, list[MigDevice], list[MigDevice]], None],
+    ) -> None:
+        with self._lock, contextlib.suppress(ValueError):
+            self._callbacks.remove(callback)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._topologies.clear()
+
+    def _probe(self, physical_device: PhysicalDevice) -> list[tuple[int, str]]:
+        keys = []
+        if physical_device.is_mig_mode_enabled():
+            for mig_index in range(physical_device.max_mig_device_count()):
+                try:
+                    handle = libnvml.nvmlQuery(
+                        'nvmlDeviceGetMigDeviceHandleByIndex',
+                        physical_device.handle,
+                        mig_index,
+                        ignore_errors=False,
+                    )
+                except libnvml.NVMLError:
+                    break
+                uuid = libnvml.nvmlQuery('nvmlDeviceGetUUID', handle)
+                keys.append((mig_index, uuid if libnvml.nvmlCheckReturn(uuid, str) else None))
+        return keys
+
+    def refresh(self, physical_device: PhysicalDevice) -> list[MigDevice]:
+        physical_key = physical_device.uuid()
+        if not libnvml.nvmlCheckReturn(physical_key, str):  # `NA` is a `str` instance
+            # The NVML index is unique among the physical devices during the NVML session
+            physical_key = physical_device.index
+        # Only two cheap NVML queries per MIG device to detect the changes
+        keys = self._probe(physical_device)
+
+        with self._lock:
+            previous = self._topologies.get(physical_key, {})
+            previous_by_index = {key[0]: (key, mig_device) for key, mig_device in previous.items()}
+            current = {}
+            added = []
+            for key in keys:
+                mig_device = previous.get(key)
+                if mig_device is None and key[1] is not None:
+                    try:
+                        with _global_physical_device(physical_device):
+                            mig_device = MigDevice(index=(physical_device.index, key[0]))
+                    except libnvml.NVMLError:
+                        pass
+                    else:
+                        added.append(mig_device)
+                        current[key] = mig_device
+                        continue
+                if mig_device is None:
+                    # Failed to get the UUID or to construct the MIG device, carry the previous entry
+                    # of the same index forward and retry on the next refresh rather than reporting a
+                    # topology change
+                    try:
+                        key, mig_device = previous_by_index[key[0]]
+                    except KeyError:
+                        continue
+                current[key] = mig_device
+            removed = [mig_device for key, mig_device in previous.items() if key not in current]
+            self._topologies[physical_key] = current
+            callbacks = list(self._callbacks) if added or removed else []
+
+        for callback in callbacks:
+            callback(physical_device, added, removed)
+        return list(current.values())
+
+
+_MIG_TOPOLOGY_TRACKER = _MigTopologyTracker()
+
+
+def _clear_handle_caches() -> None:
+    """Clear the caches that hold the NVML device handles, which are invalid after NVML shutdown."""
+    _MIG_TOPOLOGY_TRACKER.clear()
+    with _PROCESS_SAMPLERS_LOCK:
+        _PROCESS_SAMPLERS.clear()
+
+
+libnvml._register_shutdown_callback(_clear_handle_caches)  # pylint: disable=protected-access
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    try:
+        if a == b:
+            return True
+    except Exception:  # noqa: BLE001 # pylint: disable=broad-except
+        return False
+    # NaN values are considered as the same
+    return isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b)
 
 
 def _get_all_physical_device_attrs() -> dict[str, _PhysicalDeviceAttrs]:
@@ -2456,23 +3036,122 @@ def _get_all_physical_device_attrs() -> dict[str, _PhysicalDeviceAttrs]:
 
     with _GLOBAL_PHYSICAL_DEVICE_LOCK:
         if _PHYSICAL_DEVICE_ATTRS is None:
-            _PHYSICAL_DEVICE_ATTRS = OrderedDict(
-                [
-                    (
-                        device.uuid(),
-                        _PhysicalDeviceAttrs(
-                            device.index,
-                            device.name(),
+            static_device_attrs = _get_cached_static_device_attrs(validate=True)
+            if static_device_attrs is not None:
+                _PHYSICAL_DEVICE_ATTRS = OrderedDict(
+                    [
+                        (
+                            attrs['uuid'],
+                            _PhysicalDeviceAttrs(
+                                attrs['index'],
+                                attrs['name'],
+                                attrs['uuid'],
+                                attrs['support_mig_mode'],
+                            ),
+                        )
+                        for attrs in static_device_attrs
+                    ],
+                )
+            else:
+                physical_devices = PhysicalDevice.all()
+                _PHYSICAL_DEVICE_ATTRS = OrderedDict(
+                    [
+                        (
                             device.uuid(),
-                            libnvml.nvmlCheckReturn(device.mig_mode()),
-                        ),
-                    )
-                    for device in PhysicalDevice.all()
-                ],
-            )
+                            _PhysicalDeviceAttrs(
+                                device.index,
+                                device.name(),
+                                device.uuid(),
+                                libnvml.nvmlCheckReturn(device.mig_mode()),
+                            ),
+                        )
+                        for device in physical_devices
+                    ],
+                )
+                _store_static_device_attrs(physical_devices)
         return _PHYSICAL_DEVICE_ATTRS
 
 
+def _get_cached_static_device_attrs(
+    index: int | None = None,
+    *,
+    handle: libnvml.c_nvmlDevice_t | None = None,
+    validate: bool = False,
+) -> list[dict[str, Any]] | dict[str, Any] | None:
+    """Return the cached static attributes of all physical devices or the device of the given index.
+
+    The cache key does not cover the device identity (e.g., a GPU is replaced or disabled without a
+    driver change), so the cached UUIDs are checked against the live ones. The cached attributes of
+    the device of the given index are checked if ``handle`` is given, and all devices are checked if
+    ``validate`` is :data:`True`. The whole cache entry is dropped on mismatch.
+    """
+    static_device_attrs = diskcache.load('physical_devices')
+    if not isinstance(static_device_attrs, list):
+        return None
+    if index is None:
+        if validate and not (
+            libnvml.nvmlQuery('nvmlDeviceGetCount', default=-1) == len(static_device_attrs)
+            and all(
+                _match_static_device_attrs(
+                    attrs,
+                    libnvml.nvmlQuery('nvmlDeviceGetHandleByIndex', i, default=None),
+                )
+                for i, attrs in enumerate(static_device_attrs)
+            )
+        ):
+            diskcache.store('physical_devices', None)
+            return None
+        return static_device_attrs
+    try:
+        attrs = static_device_attrs[index]
+    except IndexError:
+        return None
+    if not isinstance(attrs, dict) or attrs.get('index') != index:
+        return None
+    if handle is not None and not _match_static_device_attrs(attrs, handle):
+        diskcache.store('physical_devices', None)
+        return None
+    return attrs
+
+
+def _match_static_device_attrs(attrs: Any, handle: libnvml.c_nvmlDevice_t | None) -> bool:
+    """Test whether the cached static attributes belong to the device of the given handle."""
+    if not isinstance(attrs, dict) or handle is None:
+        return False
+    uuid = libnvml.nvmlQuery('nvmlDeviceGetUUID', handle)
+    return libnvml.nvmlCheckReturn(uuid, str) and uuid == attrs.get('uuid')
+
+
+def _store_static_device_attrs(physical_devices: list[PhysicalDevice]) -> None:
+    """Store the static attributes of all physical devices to the on-disk cache if enabled.
+
+    Mutable attributes (e.g., the power limit) are not stored.
+    """
+    if not diskcache.is_enabled() or any(device.handle is None for device in physical_devices):
+        return
+
+    def jsonify(value: Any) -> Any:
+        if isinstance(value, tuple):
+            return list(map(jsonify, value))
+        return None if value is NA else value
+
+    static_device_attrs = [
+        {
+            'index': device.index,
+            'name': jsonify(device.name()),
+            'uuid': jsonify(device.uuid()),
+            'bus_id': jsonify(device.bus_id()),
+            'memory_total': jsonify(device.memory_total()),
+            'cuda_compute_capability': jsonify(device.cuda_compute_capability()),
+            'max_clock_infos': jsonify(tuple(device.max_clock_infos())),
+            'support_mig_mode': libnvml.nvmlCheckReturn(device.mig_mode()),
+        }
+        for device in physical_devices
+    ]
+    if all(attrs['uuid'] is not None for attrs in static_device_attrs):
+        diskcache.store('physical_devices', static_device_attrs)
+
+
 def _does_any_device_support_mig_mode(uuids: Iterable[str] | None = None) -> bool:
     physical_device_attrs = _get_all_physical_device_attrs()
     uuids = uuids or physical_device_attrs.keys()
@@ -2496,7 +3175,7 @@ def _get_global_physical_device() -> PhysicalDevice:
         return _GLOBAL_PHYSICAL_DEVICE
 
 
-@ttl_cache(ttl=300.0)
+@_ttl_cache(ttl=300.0)
 def _parse_cuda_visible_devices(  # pylint: disable=too-many-branches,too-many-statements
     cuda_visible_devices: str | None = None,
     format: str = 'index',  # pylint: disable=redefined-builtin
@@ -2510,16 +3189,41 @@ def _parse_cuda_visible_devices(  # pylint: disable=too-many-branches,too-many-s
         return []
     gpu_uuids = set(physical_device_attrs)
 
-    try:
-        raw_uuids = _parse_cuda_visible_devices_to_uuids(cuda_visible_devices, verbose=False)
-    except libcuda.CUDAError:
-        pass
-    else:
+    # Resolve unambiguous values with NVML only to avoid spawning a subprocess to initialize CUDA
+    uuids = _parse_cuda_visible_devices_in_process(cuda_visible_devices, physical_device_attrs)
+    if uuids is not None:
+        if format == 'uuid':
+            return uuids
+        return [
+            physical_device_attrs[uuid].index if uuid in gpu_uuids else Device(uuid=uuid).index
+            for uuid in uuids
+        ]
+
+    cache_key = '{}:{}'.format(
+        os.getenv('CUDA_DEVICE_ORDER', default='FASTEST_FIRST'),
+        '<unset>' if cuda_visible_devices is None else cuda_visible_devices,
+    )
+    cached_raw_uuids = diskcache.load('cuda_visible_devices')
+    if not isinstance(cached_raw_uuids, dict):
+        cached_raw_uuids = {}
+    raw_uuids = cached_raw_uuids.get(cache_key)
+    if raw_uuids is None:
+        try:
+            raw_uuids = _parse_cuda_visible_devices_to_uuids(cuda_visible_devices, verbose=False)
+        except libcuda.CUDAError:
+            pass
+    if raw_uuids is not None:
         uuids = [
             uuid if uuid in gpu_uuids else uuid.replace('GPU', 'MIG', 1)
             for uuid in map('GPU-{}'.format, raw_uuids)
         ]
         if gpu_uuids.issuperset(uuids) and not _does_any_device_support_mig_mode(uuids):
+            # MIG devices are not cached as they can be reconfigured without rebooting
+            if cache_key not in cached_raw_uuids:
+                diskcache.store(
+                    'cuda_visible_devices',
+                    {**cached_raw_uuids, cache_key: list(raw_uuids)},
+                )
             if format == 'uuid':
                 return uuids
             return [physical_device_attrs[uuid].index for uuid in uuids]
@@ -2599,6 +3303,73 @@ def _parse_cuda_visible_devices(  # pylint: disable=too-many-branches,too-many-s
     return [device.index for device in devices]
 
 
+def _parse_cuda_visible_devices_in_process(
+    cuda_visible_devices: str | None,
+    physical_device_attrs: dict[str, _PhysicalDeviceAttrs],
+) -> list[str] | None:
+    """Parse the given ``CUDA_VISIBLE_DEVICES`` value with NVML only and return a list of device UUIDs.
+
+    Only the unambiguous values are resolved, i.e., the values consist of distinct device indices, full
+    GPU UUIDs or a single full MIG UUID. The ``CUDA_VISIBLE_DEVICES`` environment variable is parsed
+    by the CUDA driver in the following cases, and :data:`None` will be returned:
+
+    - partial UUIDs, invalid or duplicate identifiers
+    - any device with MIG mode enabled is involved
+    - device indices with heterogeneous GPUs under ``CUDA_DEVICE_ORDER=FASTEST_FIRST`` (the default)
+    """  # pylint: disable=line-too-long
+    if cuda_visible_devices is not None:
+        identifiers = [identifier.strip() for identifier in cuda_visible_devices.split(',')]
+        if identifiers == ['']:
+            return []
+        if len(set(identifiers)) != len(identifiers):
+            return None
+    else:
+        identifiers = None
+
+    if identifiers is not None and len(identifiers) == 1 and identifiers[0].startswith('MIG-'):
+        match = Device.UUID_PATTERN.match(identifiers[0])
+        if match is None or match.group('GpuUuid') is not None:
+            return None
+        handle = libnvml.nvmlQuery('nvmlDeviceGetHandleByUUID', identifiers[0], default=None)
+        if handle is None:
+            return None
+        return identifiers
+
+    if identifiers is not None and all(
+        identifier.startswith('GPU-') for identifier in identifiers
+    ):
+        uuids = identifiers
+    elif identifiers is None or all(identifier.isdigit() for identifier in identifiers):
+        # The CUDA device order is the same as the NVML device order (sorted by PCI bus ID) only if
+        # `CUDA_DEVICE_ORDER=PCI_BUS_ID` or all devices are identical
+        if (
+            os.getenv('CUDA_DEVICE_ORDER', default='FASTEST_FIRST') != 'PCI_BUS_ID'
+            and len({attrs.name for attrs in physical_device_attrs.values()}) > 1
+        ):
+            return None
+        gpu_uuids = [
+            attrs.uuid
+            for attrs in sorted(physical_device_attrs.values(), key=lambda attrs: attrs.index)
+        ]
+        if identifiers is None:
+            uuids = gpu_uuids
+        else:
+            indices = list(map(int, identifiers))
+            if not all(0 <= index < len(gpu_uuids) for index in indices):
+                return None
+            uuids = [gpu_uuids[index] for index in indices]
+    else:
+        return None
+
+    if not set(physical_device_attrs).issuperset(uuids):
+        return None
+    for uuid in uuids:
+        # The MIG mode can be changed after a GPU reset, check the current mode
+        if physical_device_attrs[uuid].support_mig_mode and Device(uuid=uuid).mig_mode() != 'Disabled':
+            return None
+    return uuids
+
+
 def _parse_cuda_visible_devices_to_uuids(
     cuda_visible_devices: str | None = _VALUE_OMITTED,
     verbose: bool = True,
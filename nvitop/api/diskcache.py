@@ -0,0 +1,221 @@
+# This file is part of nvitop, the interactive NVIDIA-GPU process viewer.
+#
+# Copyright 2021-2023 Xuehai Pan. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""An opt-in persistent on-disk cache for the attributes that never change until reboot.
+
+Some device attributes (e.g., name, UUID, CUDA compute capability and maximum clock speeds) are
+fixed for a given NVIDIA driver and boot, but they are queried again in every new process. With the
+on-disk cache enabled, short-lived processes (e.g., the CLI and job launchers calling
+:func:`nvitop.select_devices`) can load these attributes from a cache file instead.
+
+The cache is keyed by the NVIDIA driver version and the boot ID of the system. The cache file is
+invalidated automatically after a driver upgrade or a reboot. Mutable attributes (e.g., the power
+limit, which can be changed by ``nvidia-smi --power-limit``) are never cached.
+
+The cache is disabled by default. It can be enabled by setting the environment variable
+``NVITOP_DISK_CACHE=1`` or by calling :func:`enable`. The cache directory defaults to
+``$XDG_CACHE_HOME/nvitop`` (``~/.cache/nvitop``) and can be changed by the environment variable
+``NVITOP_CACHE_DIR``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any
+
+import psutil
+
+from nvitop.api import libnvml
+from nvitop.api.utils import boolify
+
+
+__all__ = [
+    'is_enabled',
+    'enable',
+    'disable',
+    'cache_dir',
+    'cache_key',
+    'load',
+    'store',
+    'reset',
+    'clear',
+]
+
+
+CACHE_FILE_NAME = 'static-attrs.json'
+CACHE_FORMAT_VERSION = 1
+
+_LOCK = threading.RLock()
+_ENABLED = boolify(os.getenv('NVITOP_DISK_CACHE', default='0'), default=False)
+_CACHE_DIR = os.getenv('NVITOP_CACHE_DIR') or None
+_CACHE_KEY = None
+_CACHE_CONTENT = None
+
+
+def _default_cache_dir() -> str:
+    if os.name == 'nt':
+        root = os.getenv('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        root = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(root, 'nvitop')
+
+
+def _boot_id() -> str:
+    try:
+        with open('/proc/sys/kernel/random/boot_id', encoding='utf-8') as file:
+            return file.read().strip()
+    except OSError:
+        return f'boot-time-{psutil.boot_time():.0f}'
+
+
+def is_enabled() -> bool:
+    """Whether the on-disk cache is enabled."""
+    return _ENABLED
+
+
+def enable(directory: str | os.PathLike | None = None) -> None:
+    """Enable the on-disk cache.
+
+    Args:
+        directory (Optional[Union[str, os.PathLike]]):
+            The cache directory. If not given, use the environment variable ``NVITOP_CACHE_DIR`` or
+            the default cache directory.
+    """
+    global _ENABLED, _CACHE_DIR, _CACHE_CONTENT  # pylint: disable=global-statement
+
+    with _LOCK:
+        if directory is not None:
+            _CACHE_DIR = os.fspath(directory)
+            _CACHE_CONTENT = None
+        _ENABLED = True
+
+
+def disable() -> None:
+    """Disable the on-disk cache. The cache file will be kept."""
+    global _ENABLED  # pylint: disable=global-statement
+
+    with _LOCK:
+        _ENABLED = False
+
+
+def cache_dir() -> str:
+    """Return the cache directory."""
+    return _CACHE_DIR or _default_cache_dir()
+
+
+def cache_key() -> dict[str, str] | None:
+    """Return the key of the cache, or :data:`None` if the NVIDIA driver version is not available."""
+    global _CACHE_KEY  # pylint: disable=global-statement
+
+    with _LOCK:
+        if _CACHE_KEY is None:
+            driver_version = libnvml.nvmlQuery('nvmlSystemGetDriverVersion')
+            if not libnvml.nvmlCheckReturn(driver_version, str):
+                return None
+            _CACHE_KEY = {
+                'version': CACHE_FORMAT_VERSION,
+                'driver_version': driver_version,
+                'boot_id': _boot_id(),
+            }
+        return _CACHE_KEY
+
+
+def _load_content() -> dict[str, Any]:
+    global _CACHE_CONTENT  # pylint: disable=global-statement
+
+    if _CACHE_CONTENT is None:
+        key = cache_key()
+        content = {}
+        if key is not None:
+            try:
+                with open(
+                    os.path.join(cache_dir(), CACHE_FILE_NAME),
+                    encoding='utf-8',
+                ) as file:
+                    data = json.load(file)
+            except (OSError, ValueError):
+                pass
+            else:
+                if isinstance(data, dict) and data.get('key') == key:
+                    content = data.get('content') or {}
+        _CACHE_CONTENT = content
+    return _CACHE_CONTENT
+
+
+def load(namespace: str) -> Any:
+    """Load the cached data of the given namespace.
+
+    Returns: Any
+        The cached data, or :data:`None` if the cache is disabled, missing or outdated. The returned
+        object is shared, do not modify it in place.
+    """
+    if not _ENABLED:
+        return None
+    with _LOCK:
+        return _load_content().get(namespace)
+
+
+def store(namespace: str, data: Any) -> None:
+    """Store the data of the given namespace to the cache file.
+
+    The data should be JSON serializable. Any error on writing the cache file is ignored.
+    """
+    global _CACHE_CONTENT  # pylint: disable=global-statement
+
+    if not _ENABLED:
+        return
+    with _LOCK:
+        key = cache_key()
+        if key is None:
+            return
+        content = {**_load_content(), namespace: data}
+        directory = cache_dir()
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file and rename to the target to avoid partial writes
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.json')
+            try:
+                with os.fdopen(fd, mode='w', encoding='utf-8') as file:
+                    json.dump({'key': key, 'content': content}, file)
+                os.replace(temp_path, os.path.join(directory, CACHE_FILE_NAME))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            return
+        _CACHE_CONTENT = content
+
+
+def reset() -> None:
+    """Reset the in-memory states. The cache file will be reloaded on next access."""
+    global _CACHE_KEY, _CACHE_CONTENT  # pylint: disable=global-statement
+
+    with _LOCK:
+        _CACHE_KEY = None
+        _CACHE_CONTENT = None
+
+
+def clear() -> None:
+    """Remove the cache file and reset the in-memory states."""
+    with _LOCK:
+        reset()
+        try:
+            os.unlink(os.path.join(cache_dir(), CACHE_FILE_NAME))
+        except OSError:
+            pass
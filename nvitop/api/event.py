@@ -0,0 +1,365 @@
+# This file is part of nvitop, the interactive NVIDIA-GPU process viewer.
+#
+# Copyright 2021-2023 Xuehai Pan. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Event-driven device monitoring via NVML event sets.
+
+Instead of polling the device status periodically, the :class:`EventMonitor` registers the devices
+to an NVML event set and waits for the events (e.g., XID critical errors, clock changes, and
+performance state transitions) in a single background thread. The waiting thread blocks in the
+NVIDIA driver, so it costs nothing when idle, and the events are delivered immediately.
+
+Examples:
+    >>> from nvitop import Device, EventMonitor
+
+    >>> def on_event(event):
+    ...     print(event)
+
+    >>> with EventMonitor(Device.all(), ('xid_critical_error', 'pstate'), callback=on_event):
+    ...     ...  # events will be delivered to the callback in the background thread
+    DeviceEvent(device=PhysicalDevice(index=0, ...), type='pstate', event_type=4, data=0, ...)
+
+    >>> monitor = EventMonitor(Device.all()).start()  # events will be put to the queue
+    >>> monitor.get(timeout=10.0)  # block until an event is received
+    DeviceEvent(device=PhysicalDevice(index=1, ...), type='xid_critical_error', event_type=8, data=79, ...)
+    >>> monitor.stop()
+"""  # pylint: disable=line-too-long
+
+from __future__ import annotations
+
+import ctypes
+import queue as _queue
+import threading
+import time
+from typing import Any, Callable, Iterable, NamedTuple
+
+from nvitop.api import libnvml
+from nvitop.api.device import Device
+
+
+__all__ = ['EventMonitor', 'DeviceEvent', 'EVENT_TYPES', 'DEFAULT_EVENT_TYPES']
+
+
+EVENT_TYPES = {
+    'single_bit_ecc_error': libnvml.nvmlEventTypeSingleBitEccError,
+    'double_bit_ecc_error': libnvml.nvmlEventTypeDoubleBitEccError,
+    'pstate': libnvml.nvmlEventTypePState,
+    'xid_critical_error': libnvml.nvmlEventTypeXidCriticalError,
+    'clock': libnvml.nvmlEventTypeClock,
+    'power_source_change': getattr(libnvml, 'nvmlEventTypePowerSourceChange', 0x0080),
+    'mig_config_change': getattr(libnvml, 'nvmlEventMigConfigChange', 0x0100),
+}
+"""A dictionary mapping the event type names to the NVML event type bitmasks."""
+
+DEFAULT_EVENT_TYPES = ('xid_critical_error', 'double_bit_ecc_error', 'pstate', 'clock')
+"""The event types monitored by default."""
+
+_INVALID_INSTANCE_ID = 0xFFFFFFFF
+
+# Fallback to `nvmlEventSetWait` for the old `nvidia-ml-py` packages without the `_v2` version
+_QUERY_EVENT_SET_WAIT = libnvml.nvmlBindQuery('nvmlEventSetWait_v2', ignore_errors=False)
+
+
+class DeviceEvent(NamedTuple):
+    """An event received from the NVML event set."""
+
+    device: Device
+    """The device on which the event occurred."""
+    type: str
+    """The name of the event type, one of the keys in :data:`EVENT_TYPES`."""
+    event_type: int
+    """The NVML event type bitmask (``nvmlEventType*``)."""
+    data: int
+    """The event data, e.g., the XID error code for ``'xid_critical_error'`` events."""
+    timestamp: float
+    """The time (``time.time()``) when the event is received."""
+
+
+def _handle_key(handle: Any) -> Any:
+    if isinstance(handle, ctypes._Pointer):  # pylint: disable=protected-access
+        return ctypes.cast(handle, ctypes.c_void_p).value
+    return handle
+
+
+class EventMonitor:  # pylint: disable=too-many-instance-attributes
+    """Monitor device events in a background thread via NVML event sets.
+
+    Only physical devices can be registered to NVML event sets. The parent devices will be registered
+    for the given MIG devices, and the events will be delivered with the MIG device if the event
+    carries a matching GPU instance ID, otherwise with the parent device.
+
+    Args:
+        devices (Optional[Iterable[Device]]):
+            The devices to monitor. If not given, all physical devices on board will be used.
+        event_types (Union[int, Iterable[str]]):
+            The event types to monitor, either a bitmask of ``nvmlEventType*`` or an iterable of the
+            names in :data:`EVENT_TYPES`. The event types that are not supported by a device will be
+            ignored for that device.
+        callback (Optional[Callable[[DeviceEvent], Any]]):
+            A function to call with each event in the waiting thread. If not given, the events will
+            be put into :attr:`queue`.
+        queue (Optional[queue.Queue]):
+            The queue to put the events into if ``callback`` is not given. If not given, a new
+            unbounded queue will be created.
+        interval (float):
+            The maximum time in seconds to block in one wait call. It bounds the latency of
+            :meth:`stop`, not the latency of the event delivery.
+        name (str):
+            The name of the waiting thread.
+
+    Raises:
+        ValueError:
+            If any of the given event type names is unknown.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        devices: Iterable[Device] | None = None,
+        event_types: int | Iterable[str] = DEFAULT_EVENT_TYPES,
+        *,
+        callback: Callable[[DeviceEvent], Any] | None = None,
+        queue: _queue.Queue | None = None,
+        interval: float = 0.5,
+        name: str = 'event-monitor',
+    ) -> None:
+        """Initialize the event monitor."""
+        if devices is None:
+            devices = Device.all()
+
+        if isinstance(event_types, int):
+            event_mask = event_types
+        else:
+            if isinstance(event_types, str):
+                event_types = (event_types,)
+            event_mask = 0
+            for event_type in event_types:
+                try:
+                    event_mask |= EVENT_TYPES[event_type]
+                except KeyError as ex:
+                    raise ValueError(
+                        f'Unknown event type {event_type!r}. '
+                        f'Available event types: {", ".join(map(repr, EVENT_TYPES))}.',
+                    ) from ex
+
+        self.devices = list(devices)
+        self.event_mask = event_mask
+        self.callback = callback
+        self.queue = queue if queue is not None or callback is not None else _queue.Queue()
+        self.interval = float(interval)
+        self.name = name
+        self.registered = {}
+        """A dictionary mapping the registered physical devices to the registered event masks."""
+        self.error = None
+        """The NVML error that stopped the waiting thread if any."""
+
+        self._event_set = None
+        self._physical_devices = {}
+        self._mig_devices = {}
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the event monitor."""
+        return '{}(devices={}, event_mask=0x{:08X}, alive={})'.format(
+            self.__class__.__name__,
+            len(self.devices),
+            self.event_mask,
+            self.is_alive(),
+        )
+
+    def __enter__(self) -> EventMonitor:
+        """Start the waiting thread."""
+        return self.start()
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        """Stop the waiting thread."""
+        self.stop()
+
+    def is_alive(self) -> bool:
+        """Whether the waiting thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> EventMonitor:
+        """Register the devices to a new NVML event set and start the waiting thread.
+
+        Returns: EventMonitor
+            The event monitor itself.
+
+        Raises:
+            RuntimeError:
+                If the event monitor is already started.
+            NVMLError:
+                If failed to create the NVML event set.
+        """
+        with self._lock:
+            if self.is_alive():
+                raise RuntimeError(f'{self!r} is already started.')
+
+            event_set, registered, physical_devices, mig_devices = self._register()
+            # Swap in the new mappings rather than refilling the old ones, which may still be read
+            # by a thread that outlives `stop(timeout=...)`
+            self.registered = registered
+            self._physical_devices = physical_devices
+            self._mig_devices = mig_devices
+            self._event_set = event_set
+            self._stop_event = stop_event = threading.Event()
+            self.error = None
+            # Pass the event set, the stop event and the mappings to the thread, so a thread that
+            # outlives `stop(timeout=...)` frees its own event set rather than the one of a restarted
+            # monitor
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(event_set, stop_event, physical_devices, mig_devices),
+                name=self.name,
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the waiting thread and free the NVML event set.
+
+        Args:
+            timeout (Optional[float]):
+                The timeout in seconds to wait for the waiting thread to exit. The thread exits after
+                at most :attr:`interval` seconds.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop_event.set()
+            if thread is not None:
+                thread.join(timeout)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> DeviceEvent:
+        """Remove and return an event from the queue.
+
+        Raises:
+            RuntimeError:
+                If the events are delivered to the callback rather than the queue.
+            queue.Empty:
+                If no event is available before the timeout.
+        """
+        if self.queue is None:
+            raise RuntimeError('The events are delivered to the callback function.')
+        return self.queue.get(block=block, timeout=timeout)
+
+    def _register(self) -> tuple[Any, dict[Device, int], dict[Any, Device], dict[Any, Device]]:
+        event_set = libnvml.nvmlQuery('nvmlEventSetCreate', ignore_errors=False)
+        try:
+            return (event_set, *self._register_devices(event_set))
+        except BaseException:
+            libnvml.nvmlQuery('nvmlEventSetFree', event_set)
+            raise
+
+    def _register_devices(
+        self,
+        event_set: Any,
+    ) -> tuple[dict[Device, int], dict[Any, Device], dict[Any, Device]]:
+        registered = {}
+        physical_devices = {}
+        mig_devices = {}
+        for device in self.devices:
+            physical_device = device.parent if device.is_mig_device() else device
+            key = _handle_key(physical_device.handle)
+            if device.is_mig_device():
+                mig_devices[key, device.gpu_instance_id()] = device
+            if key in physical_devices:
+                continue
+            physical_devices[key] = physical_device
+
+            supported = libnvml.nvmlQuery(
+                'nvmlDeviceGetSupportedEventTypes',
+                physical_device.handle,
+                default=0,
+            )
+            event_mask = self.event_mask & supported
+            if event_mask == 0:
+                continue
+            retval = libnvml.nvmlQuery(
+                'nvmlDeviceRegisterEvents',
+                physical_device.handle,
+                event_mask,
+                event_set,
+                default=False,
+            )
+            if retval is not False:
+                registered[physical_device] = event_mask
+
+        return registered, physical_devices, mig_devices
+
+    def _run(
+        self,
+        event_set: Any,
+        stop_event: threading.Event,
+        physical_devices: dict[Any, Device],
+        mig_devices: dict[Any, Device],
+    ) -> None:
+        timeout_ms = max(1, round(1000.0 * self.interval))
+        try:
+            while not stop_event.is_set():
+                try:
+                    data = _QUERY_EVENT_SET_WAIT(event_set, timeout_ms)
+                except libnvml.NVMLError_Timeout:
+                    continue
+                except libnvml.NVMLError as ex:
+                    self.error = ex
+                    libnvml.LOGGER.error('%r stopped due to an NVML error: %s', self, ex)
+                    break
+
+                if stop_event.is_set():  # do not deliver the events after `stop()`
+                    break
+                event = self._make_event(data, physical_devices, mig_devices)
+                if event is None:
+                    continue
+                if self.callback is not None:
+                    try:
+                        self.callback(event)
+                    except Exception:  # noqa: BLE001 # pylint: disable=broad-except
+                        libnvml.LOGGER.exception('Error in the callback of %r.', self)
+                else:
+                    self.queue.put(event)
+        finally:
+            if self._event_set is event_set:
+                self._event_set = None
+            libnvml.nvmlQuery('nvmlEventSetFree', event_set)
+
+    @staticmethod
+    def _make_event(
+        data: Any,
+        physical_devices: dict[Any, Device],
+        mig_devices: dict[Any, Device],
+    ) -> DeviceEvent | None:
+        key = _handle_key(data.device)
+        device = physical_devices.get(key)
+        if device is None:
+            return None
+
+        gpu_instance_id = getattr(data, 'gpuInstanceId', _INVALID_INSTANCE_ID)
+        if gpu_instance_id != _INVALID_INSTANCE_ID:
+            device = mig_devices.get((key, gpu_instance_id), device)
+
+        event_type = data.eventType
+        name = next(
+            (name for name, mask in EVENT_TYPES.items() if event_type & mask),
+            f'0x{event_type:08X}',
+        )
+        return DeviceEvent(
+            device=device,
+            type=name,
+            event_type=event_type,
+            data=data.eventData,
+            timestamp=time.time(),
+        )
@@ -20,6 +20,9 @@
 
 from __future__ import annotations
 
+import array as _array
+import bisect as _bisect
+import collections as _collections
 import ctypes as _ctypes
 import functools as _functools
 import inspect as _inspect
@@ -28,24 +31,36 @@ import os as _os
 import re as _re
 import sys as _sys
 import threading as _threading
+import time as _time
 from types import FunctionType as _FunctionType
 from types import ModuleType as _ModuleType
 from typing import Any as _Any
 from typing import Callable as _Callable
+from typing import NamedTuple as _NamedTuple
 
 # Python Bindings for the NVIDIA Management Library (NVML)
 # https://pypi.org/project/nvidia-ml-py
 import pynvml as _pynvml
 from pynvml import *  # noqa: F403 # pylint: disable=wildcard-import,unused-wildcard-import
 
-from nvitop.api.utils import NA
+from nvitop.api.utils import NA, NaType, boolify
 from nvitop.api.utils import colored as __colored
 
 
 __all__ = [  # will be updated in below
     'NA',
+    'nvmlBindQuery',
+    'nvmlCapabilityCacheClear',
     'nvmlCheckReturn',
     'nvmlQuery',
+    'nvmlQueryFieldValues',
+    'nvmlQuerySamples',
+    'nvmlQueryStats',
+    'nvmlQueryStatsEnable',
+    'nvmlQueryStatsReset',
+    'NVMLQueryStats',
+    'nvmlResolveFunction',
+    'nvmlResolveCacheClear',
     'nvmlInit',
     'nvmlInitWithFlags',
     'nvmlShutdown',
@@ -173,11 +188,18 @@ NVMLError_NotSupported = _pynvml.NVMLError_NotSupported
 NVMLError_Unknown = _pynvml.NVMLError_Unknown
 # pylint: enable=no-member
 
+# 6. Add field IDs missing in legacy versions of `nvidia-ml-py`
+NVML_FI_DEV_ECC_DBE_VOL_TOTAL = getattr(_pynvml, 'NVML_FI_DEV_ECC_DBE_VOL_TOTAL', 4)
+NVML_FI_DEV_POWER_AVERAGE = getattr(_pynvml, 'NVML_FI_DEV_POWER_AVERAGE', 185)
+NVML_FI_DEV_POWER_CURRENT_LIMIT = getattr(_pynvml, 'NVML_FI_DEV_POWER_CURRENT_LIMIT', 190)
+
 # New members in `libnvml` #########################################################################
 
 __flags = []
 __initialized = False
-__lock = _threading.Lock()
+__lock = _threading.Lock()  # for the NVML context
+__unknown_functions_lock = _threading.Lock()
+__memory_info_v2_lock = _threading.Lock()
 
 LOGGER = _logging.getLogger(__name__)
 try:
@@ -200,6 +222,33 @@ UNKNOWN_FUNCTIONS = {}
 UNKNOWN_FUNCTIONS_CACHE_SIZE = 1024
 VERSIONED_PATTERN = _re.compile(r'^(?P<name>\w+)(?P<suffix>_v(\d)+)$')
 
+QUERY_LATENCY_BUCKETS = (10e-6, 100e-6, 1e-3, 10e-3, 100e-3, float('inf'))  # in seconds
+__query_stats_enabled = boolify(_os.getenv('NVITOP_NVML_QUERY_STATS', default='0'), default=False)
+__query_stats = {}
+__query_stats_lock = _threading.Lock()
+
+__resolved_functions = {}
+__resolver_generation = 0
+
+__shutdown_callbacks = []
+
+CAPABILITY_CACHE_SIZE = 4096
+__capability_cache = _collections.OrderedDict()
+__capability_cache_lock = _threading.Lock()
+# The number of leading arguments that identify the capability for the NVML functions with volatile
+# arguments (e.g., the timestamps of the last seen samples and the process IDs)
+__capability_key_nargs = {
+    'nvmlDeviceGetSamples': 2,  # (handle, samplingType, lastSeenTimeStamp)
+    'nvmlDeviceGetProcessUtilization': 1,  # (handle, lastSeenTimeStamp)
+    'nvmlDeviceGetProcessesUtilizationInfo': 1,  # (handle, lastSeenTimeStamp)
+    'nvmlDeviceGetVgpuUtilization': 1,  # (handle, lastSeenTimeStamp)
+    'nvmlDeviceGetVgpuProcessUtilization': 1,  # (handle, lastSeenTimeStamp)
+    'nvmlDeviceGetAccountingStats': 1,  # (handle, pid)
+}
+# The pseudo function name for the capabilities of the individual fields of
+# `nvmlDeviceGetFieldValues`, keyed by `(handle, fieldId)`
+__FIELD_VALUE = 'nvmlDeviceGetFieldValues[fieldId]'
+
 
 def _lazy_init() -> None:
     """Lazily initialize the NVML context.
@@ -216,9 +265,8 @@ def _lazy_init() -> None:
             If cannot find function :func:`pynvml.nvmlInitWithFlags`, usually the :mod:`pynvml` module
             is overridden by other modules. Need to reinstall package ``nvidia-ml-py``.
     """
-    with __lock:
-        if __initialized:
-            return
+    if __initialized:  # fast path without locking after the NVML context is initialized
+        return
     nvmlInit()
 
 
@@ -330,6 +378,21 @@ def nvmlShutdown() -> None:  # pylint: disable=function-redefined
         except IndexError:
             pass
         __initialized = len(__flags) > 0
+        callbacks = list(__shutdown_callbacks) if not __initialized else []
+
+    nvmlCapabilityCacheClear()
+    for callback in callbacks:
+        callback()
+
+
+def _register_shutdown_callback(callback: _Callable[[], None]) -> None:
+    """Register a function to be called when the NVML context is fully shut down.
+
+    It is used to clear the caches that hold the device handles, which are invalid after shutdown.
+    """
+    with __lock:
+        if callback not in __shutdown_callbacks:
+            __shutdown_callbacks.append(callback)
 
 
 def nvmlQuery(
@@ -347,7 +410,7 @@ def nvmlQuery(
     Args:
         func (Union[Callable[..., Any], str]):
             The function to call. If it is given by string, lookup for the function first from
-            module :mod:`pynvml`.
+            module :mod:`pynvml` by :func:`nvmlResolveFunction`.
         default (Any):
             The default value if the query fails.
         ignore_errors (bool):
@@ -376,22 +439,159 @@ def nvmlQuery(
         NVMLError_InvalidArgument:
             If passed with an invalid argument.
     """
+    if isinstance(func, str):
+        name = func
+        try:
+            func = __resolved_functions[name]
+        except KeyError:
+            func = nvmlResolveFunction(name)
+    else:
+        name = None
+
+    return __query(func, name, args, kwargs, default, ignore_errors, ignore_function_not_found)
+
+
+def nvmlResolveFunction(name: str) -> _Callable[..., _Any]:
+    """Resolve an NVML function by name and cache the result.
+
+    If the function is not found and the name has a version suffix (e.g., ``_v3``), fallback to the
+    lower versions and the unversioned name. If still not found, return a function that raises
+    :class:`NVMLError_FunctionNotFound` when called.
+
+    Args:
+        name (str):
+            The name of the NVML function, e.g., ``'nvmlDeviceGetComputeRunningProcesses_v3'``.
+
+    Returns: Callable[..., Any]
+        The resolved NVML function.
+    """
+    try:
+        return __resolved_functions[name]
+    except KeyError:
+        pass
+
+    candidates = [name]
+    match = VERSIONED_PATTERN.match(name)
+    if match is not None:
+        unversioned_name = match.group('name')
+        version = int(match.group('suffix')[2:])
+        candidates.extend(f'{unversioned_name}_v{v}' for v in range(version - 1, 1, -1))
+        candidates.append(unversioned_name)
+
+    for candidate in candidates:
+        func = getattr(__modself, candidate, None)
+        if callable(func):
+            break
+    else:
+
+        def func(*args: _Any, **kwargs: _Any) -> _Any:  # pylint: disable=unused-argument
+            raise NVMLError_FunctionNotFound
+
+        func.__name__ = func.__qualname__ = name
+
+    __resolved_functions[name] = func
+    return func
+
+
+def nvmlResolveCacheClear() -> None:
+    """Clear the cache of the resolved NVML functions.
+
+    Call this function after replacing the NVML functions in this module at runtime (e.g., patching
+    them for testing). The queries bound by :func:`nvmlBindQuery` will be re-resolved on next call.
+    """
+    global __resolver_generation  # pylint: disable=global-statement
+
+    __resolved_functions.clear()
+    __resolver_generation += 1
+
+
+def nvmlBindQuery(
+    name: str,
+    *,
+    default: _Any = NA,
+    ignore_errors: bool = True,
+    ignore_function_not_found: bool = False,
+) -> _Callable[..., _Any]:
+    """Bind an NVML function and the error handling options into a query callable.
+
+    This is equivalent to ``functools.partial(nvmlQuery, name, default=..., ...)`` but the function
+    is resolved only once by :func:`nvmlResolveFunction`. It is suitable for the hot paths that make
+    the same query repeatedly.
+
+    Examples:
+        >>> nvmlDeviceGetMemoryInfo = nvmlBindQuery('nvmlDeviceGetMemoryInfo')
+        >>> nvmlDeviceGetMemoryInfo(handle)  # equivalent to nvmlQuery('nvmlDeviceGetMemoryInfo', handle)
+        c_nvmlMemory_t(total: 25769803776 B, free: 25420939264 B, used: 348864512 B)
+
+    Args:
+        name (str):
+            The name of the NVML function.
+        default (Any):
+            The default value if the query fails.
+        ignore_errors (bool):
+            Whether to ignore errors and return the default value.
+        ignore_function_not_found (bool):
+            Whether to ignore function not found errors and return the default value. If set to
+            :data:`False`, an error message will be logged to the logger.
+
+    Returns: Callable[..., Any]
+        A callable that accepts the positional and keyword arguments for the NVML function.
+    """  # pylint: disable=line-too-long
+    binding = (None, -1)
+
+    def query(*args: _Any, **kwargs: _Any) -> _Any:
+        nonlocal binding
+
+        func, generation = binding
+        if generation != __resolver_generation:
+            generation = __resolver_generation
+            func = nvmlResolveFunction(name)
+            binding = (func, generation)
+        return __query(func, name, args, kwargs, default, ignore_errors, ignore_function_not_found)
+
+    query.__name__ = query.__qualname__ = name
+    return query
+
+
+# pylint: disable-next=too-many-arguments
+def __query(
+    func: _Callable[..., _Any],
+    name: str | None,
+    args: tuple[_Any, ...],
+    kwargs: dict[str, _Any],
+    default: _Any,
+    ignore_errors: bool,
+    ignore_function_not_found: bool,
+) -> _Any:
     global UNKNOWN_FUNCTIONS  # pylint: disable=global-statement,global-variable-not-assigned
 
     _lazy_init()
 
     try:
-        if isinstance(func, str):
-            try:
-                func = getattr(__modself, func)
-            except AttributeError as e1:
-                raise NVMLError_FunctionNotFound from e1
+        if __capability_cache:
+            unsupported = __capability_cache_get(name or func, args)
+            if unsupported is not None:
+                if ignore_errors or (
+                    ignore_function_not_found and unsupported is NVMLError_FunctionNotFound
+                ):
+                    return default
+                raise unsupported()
 
-        retval = func(*args, **kwargs)
+        if __query_stats_enabled:
+            start = _time.perf_counter()
+            try:
+                retval = func(*args, **kwargs)
+            except NVMLError as ex:
+                __record_query(name or func, _time.perf_counter() - start, ex)
+                raise
+            __record_query(name or func, _time.perf_counter() - start)
+        else:
+            retval = func(*args, **kwargs)
     except NVMLError_FunctionNotFound as e2:
+        __capability_cache_add(name or func, args, NVMLError_FunctionNotFound)
         if not ignore_function_not_found:
             identifier = _inspect.getsource(func) if func.__name__ == '<lambda>' else repr(func)
-            with __lock:
+            with __unknown_functions_lock:
                 if (
                     identifier not in UNKNOWN_FUNCTIONS
                     and len(UNKNOWN_FUNCTIONS) < UNKNOWN_FUNCTIONS_CACHE_SIZE
@@ -408,6 +608,11 @@ def nvmlQuery(
         if ignore_errors or ignore_function_not_found:
             return default
         raise
+    except NVMLError_NotSupported:
+        __capability_cache_add(name or func, args, NVMLError_NotSupported)
+        if ignore_errors:
+            return default
+        raise
     except NVMLError:
         if ignore_errors:
             return default
@@ -418,6 +623,307 @@ def nvmlQuery(
     return retval
 
 
+def __capability_cache_key(
+    func: _Callable[..., _Any] | str,
+    args: tuple[_Any, ...],
+) -> tuple[_Any, ...] | None:
+    if isinstance(func, str):
+        name = func
+    else:
+        name = getattr(func, '__name__', None)
+        # The lambdas and the closures may capture different arguments (e.g., the device handles)
+        # with the same name, do not cache them
+        if name is None or name == '<lambda>' or getattr(func, '__closure__', None) is not None:
+            return None
+
+    # Use the pointer address as the key for the device handles because a new handle object will be
+    # created for each call of `nvmlDeviceGetHandleBy*` functions
+    key = (
+        func,
+        *(
+            _ctypes.cast(arg, _ctypes.c_void_p).value
+            if isinstance(arg, _ctypes._Pointer)
+            else tuple(arg)
+            if isinstance(arg, list)
+            else arg
+            for arg in args[: __capability_key_nargs.get(name, len(args))]
+        ),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def __capability_cache_get(
+    func: _Callable[..., _Any] | str,
+    args: tuple[_Any, ...],
+) -> type[NVMLError] | None:
+    key = __capability_cache_key(func, args)
+    if key is None:
+        return None
+    error_class = __capability_cache.get(key)
+    if error_class is not None:
+        with __capability_cache_lock:
+            if key in __capability_cache:
+                __capability_cache.move_to_end(key)
+    return error_class
+
+
+def __capability_cache_add(
+    func: _Callable[..., _Any] | str,
+    args: tuple[_Any, ...],
+    error_class: type[NVMLError],
+) -> None:
+    key = __capability_cache_key(func, args)
+    if key is None:
+        return
+    with __capability_cache_lock:
+        __capability_cache[key] = error_class
+        __capability_cache.move_to_end(key)
+        while len(__capability_cache) > CAPABILITY_CACHE_SIZE:
+            __capability_cache.popitem(last=False)  # evict the least recently used entry
+
+
+def nvmlCapabilityCacheClear() -> None:
+    """Clear the cache of unsupported NVML queries.
+
+    When a query made by :func:`nvmlQuery` raises :class:`NVMLError_NotSupported` or
+    :class:`NVMLError_FunctionNotFound`, the failure is cached for the given function and arguments
+    (e.g., the device handle), excluding the volatile ones such as the timestamps of the last seen
+    samples. The subsequent queries with the same arguments will return the default value (or raise
+    the same error) immediately without calling into the NVML library. The unsupported fields of
+    :func:`nvmlQueryFieldValues` are cached per device as well. The queries of lambdas and closures
+    are not cached. At most :data:`CAPABILITY_CACHE_SIZE` entries are kept, and the least
+    recently used one is evicted when the cache is full.
+
+    The cache is cleared automatically on :func:`nvmlShutdown`. Call this function manually if the
+    capabilities of the devices may change while the NVML context is alive (e.g., after reloading
+    the NVIDIA driver or changing the MIG mode).
+    """
+    with __capability_cache_lock:
+        __capability_cache.clear()
+
+
+class NVMLQueryStats(_NamedTuple):
+    """Statistics of the NVML queries of a function made by :func:`nvmlQuery`."""
+
+    calls: int
+    """The number of calls."""
+    errors: dict[str, int]
+    """A dictionary mapping the name of the error class to the number of raised errors."""
+    total_time: float
+    """The total time spent in seconds."""
+    max_time: float
+    """The maximum latency of a single call in seconds."""
+    histogram: tuple[int, ...]
+    """The number of calls for each latency bucket defined in :data:`QUERY_LATENCY_BUCKETS`."""
+
+    @property
+    def error_count(self) -> int:
+        """The total number of raised errors."""
+        return sum(self.errors.values())
+
+    @property
+    def mean_time(self) -> float:
+        """The average latency of a single call in seconds."""
+        return self.total_time / self.calls if self.calls > 0 else 0.0
+
+
+def __record_query(
+    func: _Callable[..., _Any] | str,
+    elapsed: float,
+    error: NVMLError | None = None,
+) -> None:
+    if isinstance(func, str):
+        name = func
+    else:
+        name = getattr(func, '__name__', None) or repr(func)
+        if name == '<lambda>':
+            name = getattr(func, '__qualname__', name)
+
+    bucket = _bisect.bisect_right(QUERY_LATENCY_BUCKETS, elapsed)
+    bucket = min(bucket, len(QUERY_LATENCY_BUCKETS) - 1)
+
+    with __query_stats_lock:
+        try:
+            record = __query_stats[name]
+        except KeyError:
+            record = __query_stats[name] = [0, {}, 0.0, 0.0, [0] * len(QUERY_LATENCY_BUCKETS)]
+        record[0] += 1
+        if error is not None:
+            error_name = type(error).__name__
+            record[1][error_name] = record[1].get(error_name, 0) + 1
+        record[2] += elapsed
+        record[3] = max(record[3], elapsed)
+        record[4][bucket] += 1
+
+
+def nvmlQueryStatsEnable(enabled: bool = True) -> None:
+    """Enable or disable the statistics of the NVML queries made by :func:`nvmlQuery`.
+
+    The statistics are disabled by default. They can also be enabled by setting the environment
+    variable ``NVITOP_NVML_QUERY_STATS=1``.
+    """
+    global __query_stats_enabled  # pylint: disable=global-statement
+
+    __query_stats_enabled = bool(enabled)
+
+
+def nvmlQueryStats(reset: bool = False) -> dict[str, NVMLQueryStats]:
+    """Return the statistics of the NVML queries made by :func:`nvmlQuery`.
+
+    The statistics are recorded only if enabled by :func:`nvmlQueryStatsEnable`.
+
+    Args:
+        reset (bool):
+            Whether to clear the statistics after retrieving.
+
+    Returns: Dict[str, NVMLQueryStats]
+        A dictionary mapping the NVML function name to the query statistics.
+    """
+    with __query_stats_lock:
+        stats = {
+            name: NVMLQueryStats(
+                calls=calls,
+                errors=dict(errors),
+                total_time=total_time,
+                max_time=max_time,
+                histogram=tuple(histogram),
+            )
+            for name, (calls, errors, total_time, max_time, histogram) in __query_stats.items()
+        }
+        if reset:
+            __query_stats.clear()
+    return stats
+
+
+def nvmlQueryStatsReset() -> None:
+    """Clear the statistics of the NVML queries."""
+    with __query_stats_lock:
+        __query_stats.clear()
+
+
+def nvmlQueryFieldValues(
+    handle: c_nvmlDevice_t,
+    field_ids: list[int | tuple[int, int]],
+) -> list[int | float | NaType]:
+    """Query multiple field values from NVML in one driver round-trip.
+
+    Args:
+        handle (c_nvmlDevice_t):
+            The device handle.
+        field_ids (List[Union[int, Tuple[int, int]]]):
+            The field IDs (``NVML_FI_*``) to query. Each item can be a field ID or a tuple of the field
+            ID and the scope ID.
+
+    Returns: List[Union[int, float, NaType]]
+        A list of values in the same order of the given field IDs. An item will be
+        :const:`nvitop.NA` if the field is not supported by the device or fails to query, or all
+        items will be :const:`nvitop.NA` if the query fails.
+
+    The fields not supported by the device (:data:`NVML_ERROR_NOT_SUPPORTED`) are recorded in the
+    capability cache and are not requested again until :func:`nvmlCapabilityCacheClear`. The
+    transient failures are not recorded.
+    """
+    field_ids = list(field_ids)
+    values = [NA] * len(field_ids)
+    queried = [
+        i
+        for i, field_id in enumerate(field_ids)
+        if __capability_cache_get(__FIELD_VALUE, (handle, field_id)) is None
+    ]
+    if len(queried) == 0:
+        return values
+
+    field_values = nvmlQuery(
+        'nvmlDeviceGetFieldValues',
+        handle,
+        [field_ids[i] for i in queried],
+        ignore_function_not_found=True,
+    )
+    if not nvmlCheckReturn(field_values):
+        return values
+
+    for i, field_value in zip(queried, field_values):
+        if field_value.nvmlReturn == _pynvml.NVML_ERROR_NOT_SUPPORTED:
+            __capability_cache_add(__FIELD_VALUE, (handle, field_ids[i]), NVMLError_NotSupported)
+            continue
+        if field_value.nvmlReturn != _pynvml.NVML_SUCCESS:
+            continue
+        try:
+            values[i] = getattr(field_value.value, __field_value_members[field_value.valueType])
+        except (KeyError, AttributeError):
+            pass
+    return values
+
+
+def nvmlQuerySamples(
+    handle: c_nvmlDevice_t,
+    sampling_type: int,
+    last_seen_timestamp: int = 0,
+) -> tuple[_array.array, _array.array] | NaType:
+    """Drain the samples of the given type from the driver's internal sample buffer.
+
+    Args:
+        handle (c_nvmlDevice_t):
+            The device handle.
+        sampling_type (int):
+            The sampling type (``NVML_*_SAMPLES``), e.g., :const:`NVML_GPU_UTILIZATION_SAMPLES`.
+        last_seen_timestamp (int):
+            Only return the samples newer than the timestamp (in microseconds since epoch). Return all
+            samples in the buffer if set to :const:`0`.
+
+    Returns: Union[Tuple[array.array, array.array], NaType]
+        A tuple of two compact arrays: the timestamps (in microseconds since epoch) and the sample
+        values in the same order. The arrays are empty if no new samples are available. Returns
+        :const:`nvitop.NA` if the query fails.
+    """
+    try:
+        value_type, samples = nvmlQuery(
+            'nvmlDeviceGetSamples',
+            handle,
+            sampling_type,
+            last_seen_timestamp,
+            ignore_errors=False,
+        )
+    except NVMLError_NotFound:  # no new samples since the last seen timestamp
+        return _array.array('Q'), _array.array('I')
+    except NVMLError:
+        return NA
+
+    try:
+        member = __field_value_members[value_type]
+        typecode = __value_type_codes[value_type]
+    except KeyError:
+        return NA
+    return (
+        _array.array('Q', [sample.timeStamp for sample in samples]),
+        _array.array(typecode, [getattr(sample.sampleValue, member) for sample in samples]),
+    )
+
+
+__field_value_members = {
+    _pynvml.NVML_VALUE_TYPE_DOUBLE: 'dVal',
+    _pynvml.NVML_VALUE_TYPE_UNSIGNED_INT: 'uiVal',
+    _pynvml.NVML_VALUE_TYPE_UNSIGNED_LONG: 'ulVal',
+    _pynvml.NVML_VALUE_TYPE_UNSIGNED_LONG_LONG: 'ullVal',
+    _pynvml.NVML_VALUE_TYPE_SIGNED_LONG_LONG: 'sllVal',
+    getattr(_pynvml, 'NVML_VALUE_TYPE_SIGNED_INT', 5): 'siVal',
+    getattr(_pynvml, 'NVML_VALUE_TYPE_UNSIGNED_SHORT', 6): 'usVal',
+}
+__value_type_codes = {
+    _pynvml.NVML_VALUE_TYPE_DOUBLE: 'd',
+    _pynvml.NVML_VALUE_TYPE_UNSIGNED_INT: 'I',
+    _pynvml.NVML_VALUE_TYPE_UNSIGNED_LONG: 'L',
+    _pynvml.NVML_VALUE_TYPE_UNSIGNED_LONG_LONG: 'Q',
+    _pynvml.NVML_VALUE_TYPE_SIGNED_LONG_LONG: 'q',
+    getattr(_pynvml, 'NVML_VALUE_TYPE_SIGNED_INT', 5): 'i',
+    getattr(_pynvml, 'NVML_VALUE_TYPE_UNSIGNED_SHORT', 6): 'H',
+}
+
+
 def nvmlCheckReturn(
     retval: _Any,
     types: type | tuple[type, ...] | None = None,
@@ -612,11 +1118,11 @@ def nvmlDeviceGetMemoryInfo(handle: c_nvmlDevice_t) -> _pynvml.c_nvmlMemory_t:
             # pylint: disable-next=protected-access,no-member
             _pynvml._nvmlGetFunctionPointer('nvmlDeviceGetMemoryInfo_v2')
         except NVMLError_FunctionNotFound:
-            with __lock:
+            with __memory_info_v2_lock:
                 _driver_get_memory_info_v2_available = False
                 _pynvml_get_memory_info_v2_available = False
         else:
-            with __lock:
+            with __memory_info_v2_lock:
                 _driver_get_memory_info_v2_available = True
 
         if _driver_get_memory_info_v2_available:
@@ -628,7 +1134,7 @@ def nvmlDeviceGetMemoryInfo(handle: c_nvmlDevice_t) -> _pynvml.c_nvmlMemory_t:
                 except TypeError as ex:
                     if 'unexpected keyword argument' in str(ex).lower():
                         # driver ✔ pynvml ✘
-                        with __lock:
+                        with __memory_info_v2_lock:
                             _pynvml_get_memory_info_v2_available = False
                         LOGGER.debug(
                             'NVML memory info version 2 is not available '
@@ -636,14 +1142,14 @@ def nvmlDeviceGetMemoryInfo(handle: c_nvmlDevice_t) -> _pynvml.c_nvmlMemory_t:
                         )
                     else:
                         # driver ✔ pynvml ? user ✘
-                        with __lock:
+                        with __memory_info_v2_lock:
                             _driver_get_memory_info_v2_available = (
                                 None  # unset the flag for user exceptions
                             )
                         raise
                 except (NVMLError_FunctionNotFound, NVMLError_Unknown):
                     # driver ✔ pynvml ✘
-                    with __lock:
+                    with __memory_info_v2_lock:
                         _pynvml_get_memory_info_v2_available = False
                     LOGGER.debug(
                         'NVML memory info version 2 is not available '
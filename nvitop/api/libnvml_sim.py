@@ -0,0 +1,1378 @@
+# This file is part of nvitop, the interactive NVIDIA-GPU process viewer.
+#
+# Copyright 2021-2023 Xuehai Pan. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""A simulated NVML backend for benchmarking and load testing on machines without NVIDIA GPUs.
+
+The simulated backend replaces the NVML functions behind :mod:`nvitop.api.libnvml` with pure Python
+implementations. The device topology (physical devices, MIG devices and GPU processes) can be either
+generated randomly or replayed from a configuration captured on a real machine. Dynamic metrics
+(e.g., memory usage, utilization rates, temperature) perform a bounded random walk on each query.
+Each NVML call can be delayed with a configurable latency to mimic the driver round-trip time.
+
+Examples:
+    >>> from nvitop import Device, ResourceMetricCollector, take_snapshots
+    >>> from nvitop.api.libnvml_sim import SimulatedBackend
+
+    >>> backend = SimulatedBackend.generate(num_devices=8, processes_per_device=128, latency=50E-6)
+    >>> with backend:  # install the simulated backend
+    ...     devices = Device.all()
+    ...     snapshots = take_snapshots(devices)
+    ...     print(len(snapshots.gpu_processes))
+    1024
+
+    >>> config = backend.to_config()  # JSON serializable
+    >>> replayed = SimulatedBackend.from_config(config, noise=0.0)  # replay with constant metrics
+
+    >>> captured = SimulatedBackend.capture()  # capture the topology on a machine with NVIDIA GPUs
+"""
+
+# pylint: disable=invalid-name,too-many-public-methods
+
+from __future__ import annotations
+
+import functools
+import random
+import threading
+import time
+import uuid as _uuid
+from collections import deque
+from types import FunctionType, ModuleType, SimpleNamespace
+from typing import Any, Callable, Iterable
+
+import psutil
+import pynvml as _pynvml
+
+from nvitop.api import diskcache, libnvml
+from nvitop.api.utils import NA, GiB, MiB
+
+
+__all__ = ['SimulatedProcess', 'SimulatedDevice', 'SimulatedBackend']
+
+
+_INSTALL_LOCK = threading.RLock()
+_ACTIVE_BACKEND = None
+_MISSING = object()
+
+# The wrappers defined in `libnvml` itself, they will call the simulated functions via `_pynvml`
+_LIBNVML_WRAPPERS = ('nvmlInit', 'nvmlInitWithFlags', 'nvmlShutdown', 'nvmlDeviceGetMemoryInfo')
+
+_FI_DEV_POWER_INSTANT = getattr(_pynvml, 'NVML_FI_DEV_POWER_INSTANT', 186)
+_FI_DEV_POWER_REQUESTED_LIMIT = getattr(_pynvml, 'NVML_FI_DEV_POWER_REQUESTED_LIMIT', 192)
+
+# sampling type -> metric name
+_SAMPLE_METRICS = {
+    _pynvml.NVML_TOTAL_POWER_SAMPLES: 'power_usage',
+    _pynvml.NVML_GPU_UTILIZATION_SAMPLES: 'gpu_utilization',
+    _pynvml.NVML_MEMORY_UTILIZATION_SAMPLES: 'memory_utilization',
+    _pynvml.NVML_ENC_UTILIZATION_SAMPLES: 'encoder_utilization',
+    _pynvml.NVML_DEC_UTILIZATION_SAMPLES: 'decoder_utilization',
+    _pynvml.NVML_PROCESSOR_CLK_SAMPLES: 'sm_clock',
+    _pynvml.NVML_MEMORY_CLK_SAMPLES: 'memory_clock',
+}
+_SAMPLE_PERIOD = 166_667  # in microseconds
+_SAMPLE_BUFFER_SIZE = 120
+
+DEFAULT_SUPPORTED_EVENT_TYPES = (
+    _pynvml.nvmlEventTypeSingleBitEccError
+    | _pynvml.nvmlEventTypeDoubleBitEccError
+    | _pynvml.nvmlEventTypePState
+    | _pynvml.nvmlEventTypeXidCriticalError
+    | _pynvml.nvmlEventTypeClock
+)
+
+
+class SimulatedProcess:  # pylint: disable=too-many-instance-attributes
+    """A simulated process running on a simulated device.
+
+    Args:
+        pid (int):
+            The process ID. Use a real PID on the host to make the host information available.
+        gpu_memory (int):
+            The used GPU memory in bytes.
+        type (str):
+            The process type, :const:`'C'` for compute processes and :const:`'G'` for graphics
+            processes.
+        sm_utilization (int):
+            The initial SM utilization rate in percentage.
+        memory_utilization (int):
+            The initial memory bandwidth utilization rate in percentage.
+        encoder_utilization (int):
+            The initial encoder utilization rate in percentage.
+        decoder_utilization (int):
+            The initial decoder utilization rate in percentage.
+    """
+
+    CONFIG_KEYS = (
+        'pid',
+        'gpu_memory',
+        'type',
+        'sm_utilization',
+        'memory_utilization',
+        'encoder_utilization',
+        'decoder_utilization',
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pid: int,
+        gpu_memory: int = 0,
+        type: str = 'C',  # pylint: disable=redefined-builtin
+        sm_utilization: int = 0,
+        memory_utilization: int = 0,
+        encoder_utilization: int = 0,
+        decoder_utilization: int = 0,
+    ) -> None:
+        """Initialize the simulated process."""
+        self.pid = int(pid)
+        self.gpu_memory = int(gpu_memory)
+        self.type = type
+        self.sm_utilization = sm_utilization
+        self.memory_utilization = memory_utilization
+        self.encoder_utilization = encoder_utilization
+        self.decoder_utilization = decoder_utilization
+        self.device = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the simulated process."""
+        return '{}(pid={}, gpu_memory={}, type={!r})'.format(
+            self.__class__.__name__,
+            self.pid,
+            self.gpu_memory,
+            self.type,
+        )
+
+    def to_config(self) -> dict[str, Any]:
+        """Return a JSON serializable configuration of the simulated process."""
+        return {key: getattr(self, key) for key in self.CONFIG_KEYS}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> SimulatedProcess:
+        """Create a simulated process from the configuration."""
+        return cls(**{key: config[key] for key in cls.CONFIG_KEYS if key in config})
+
+
+class SimulatedDevice:  # pylint: disable=too-many-instance-attributes
+    """A simulated physical device or MIG device. The instance is used as the NVML device handle.
+
+    Static attributes are given as keyword arguments. Dynamic metrics are given by argument
+    ``metrics``, a metric with value :data:`None` is treated as not supported by the device
+    (raises :class:`libnvml.NVMLError_NotSupported` on query).
+    """
+
+    STATIC_KEYS = (
+        'name',
+        'uuid',
+        'bus_id',
+        'serial',
+        'memory_total',
+        'bar1_memory_total',
+        'cuda_compute_capability',
+        'max_clock_infos',
+        'power_limit',
+        'display_active',
+        'display_mode',
+        'persistence_mode',
+        'compute_mode',
+        'mig_mode',
+        'max_mig_device_count',
+        'gpu_instance_id',
+        'compute_instance_id',
+        'supported_event_types',
+    )
+
+    # name -> (default value, lower bound, upper bound)
+    METRICS = {
+        'memory_used': (0, 0, None),  # the upper bound is `memory_total`
+        'bar1_memory_used': (0, 0, None),  # the upper bound is `bar1_memory_total`
+        'gpu_utilization': (0, 0, 100),
+        'memory_utilization': (0, 0, 100),
+        'encoder_utilization': (0, 0, 100),
+        'decoder_utilization': (0, 0, 100),
+        'graphics_clock': (210, 210, None),  # the upper bounds are from `max_clock_infos`
+        'sm_clock': (210, 210, None),
+        'memory_clock': (405, 405, None),
+        'video_clock': (555, 555, None),
+        'fan_speed': (30, 0, 100),
+        'temperature': (35, 20, 95),
+        'power_usage': (60_000, 10_000, None),  # the upper bound is `power_limit`
+        'performance_state': (8, 0, 15),
+        'total_volatile_uncorrected_ecc_errors': (0, 0, None),
+    }
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        *,
+        name: str = 'NVIDIA A100-SXM4-80GB',
+        uuid: str | None = None,
+        bus_id: str | None = None,
+        serial: str | None = None,
+        memory_total: int = 80 * GiB,
+        bar1_memory_total: int = 128 * GiB,
+        cuda_compute_capability: tuple[int, int] = (8, 0),
+        max_clock_infos: tuple[int, int, int, int] = (1410, 1410, 1593, 1275),
+        power_limit: int | None = 400_000,
+        display_active: int = 0,
+        display_mode: int = 0,
+        persistence_mode: int = 1,
+        compute_mode: int = 0,
+        mig_mode: int | None = None,
+        max_mig_device_count: int = 0,
+        gpu_instance_id: int | None = None,
+        compute_instance_id: int | None = None,
+        supported_event_types: int = DEFAULT_SUPPORTED_EVENT_TYPES,
+        metrics: dict[str, int | None] | None = None,
+        processes: Iterable[SimulatedProcess] = (),
+        mig_devices: Iterable[SimulatedDevice] = (),
+    ) -> None:
+        """Initialize the simulated device."""
+        self.name = name
+        self.uuid = uuid
+        self.bus_id = bus_id
+        self.serial = serial
+        self.memory_total = memory_total
+        self.bar1_memory_total = bar1_memory_total
+        self.cuda_compute_capability = tuple(cuda_compute_capability)
+        self.max_clock_infos = tuple(max_clock_infos)
+        self.power_limit = power_limit
+        self.display_active = display_active
+        self.display_mode = display_mode
+        self.persistence_mode = persistence_mode
+        self.compute_mode = compute_mode
+        self.mig_mode = mig_mode
+        self.max_mig_device_count = max_mig_device_count
+        self.gpu_instance_id = gpu_instance_id
+        self.compute_instance_id = compute_instance_id
+        self.supported_event_types = supported_event_types
+
+        self.metrics = {key: default for key, (default, *_) in self.METRICS.items()}
+        if metrics is not None:
+            self.metrics.update(metrics)
+
+        self.index = None
+        self.parent = None
+        self.backend = None
+        self.processes = []
+        self.mig_devices = []
+        self._rng = random.Random()  # noqa: S311
+        for process in processes:
+            self.add_process(process)
+        for mig_device in mig_devices:
+            self.add_mig_device(mig_device)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the simulated device."""
+        return (
+            f'{self.__class__.__name__}(index={self.index}, name={self.name!r}, uuid={self.uuid!r})'
+        )
+
+    @property
+    def is_mig_device(self) -> bool:
+        """Whether the simulated device is a MIG device."""
+        return self.parent is not None
+
+    def add_process(self, process: SimulatedProcess) -> SimulatedProcess:
+        """Attach a simulated process to the device."""
+        process.device = self
+        self.processes.append(process)
+        return process
+
+    def add_mig_device(self, mig_device: SimulatedDevice) -> SimulatedDevice:
+        """Attach a simulated MIG device to the device."""
+        mig_device.parent = self
+        mig_device.index = (self.index, len(self.mig_devices))
+        mig_device.backend = self.backend
+        self.mig_devices.append(mig_device)
+        return mig_device
+
+    def all_processes(self) -> list[SimulatedProcess]:
+        """Return the processes on the device, including the processes on its MIG devices."""
+        processes = list(self.processes)
+        for mig_device in self.mig_devices:
+            processes.extend(mig_device.processes)
+        return processes
+
+    def metric(self, name: str) -> int:
+        """Return the current value of a dynamic metric, the value performs a bounded random walk.
+
+        Raises:
+            libnvml.NVMLError_NotSupported:
+                If the metric is not supported by the device.
+        """
+        value = self.metrics.get(name)
+        if value is None:
+            raise libnvml.NVMLError_NotSupported
+
+        noise = self.backend.noise if self.backend is not None else 0.0
+        if noise > 0.0:
+            _, lower, upper = self.METRICS[name]
+            upper = self._upper_bound(name, upper)
+            if upper is not None and upper > lower:
+                value += self._rng.gauss(0.0, noise * (upper - lower))
+                value = round(min(max(value, lower), upper))
+                self.metrics[name] = value
+        return value
+
+    def _upper_bound(self, name: str, default: int | None) -> int | None:
+        if name == 'memory_used':
+            return self.memory_total
+        if name == 'bar1_memory_used':
+            return self.bar1_memory_total
+        if name == 'power_usage':
+            return self.power_limit
+        if name.endswith('_clock'):
+            return self.max_clock_infos[('graphics', 'sm', 'memory', 'video').index(name[:-6])]
+        return default
+
+    def to_config(self) -> dict[str, Any]:
+        """Return a JSON serializable configuration of the simulated device."""
+        config = {key: getattr(self, key) for key in self.STATIC_KEYS}
+        config['cuda_compute_capability'] = list(self.cuda_compute_capability)
+        config['max_clock_infos'] = list(self.max_clock_infos)
+        config['metrics'] = dict(self.metrics)
+        config['processes'] = [process.to_config() for process in self.processes]
+        config['mig_devices'] = [mig_device.to_config() for mig_device in self.mig_devices]
+        return config
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> SimulatedDevice:
+        """Create a simulated device from the configuration."""
+        kwargs = {key: config[key] for key in cls.STATIC_KEYS if key in config}
+        return cls(
+            **kwargs,
+            metrics=config.get('metrics'),
+            processes=map(SimulatedProcess.from_config, config.get('processes', ())),
+            mig_devices=map(cls.from_config, config.get('mig_devices', ())),
+        )
+
+
+class _SimulatedEventSet:
+    """A simulated NVML event set."""
+
+    def __init__(self) -> None:
+        """Initialize the simulated event set."""
+        self.registered = {}
+        self.events = deque()
+        self.condition = threading.Condition()
+
+    def put(self, event: SimpleNamespace, device: SimulatedDevice) -> None:
+        if self.registered.get(device, 0) & event.eventType:
+            with self.condition:
+                self.events.append(event)
+                self.condition.notify()
+
+    def wait(self, timeout: float) -> SimpleNamespace:
+        with self.condition:
+            if not self.condition.wait_for(lambda: len(self.events) > 0, timeout=timeout):
+                raise libnvml.NVMLError_Timeout  # pylint: disable=no-member
+            return self.events.popleft()
+
+
+class _PynvmlProxy(ModuleType):
+    """A proxy of module :mod:`pynvml` with simulated functions, fallback to :mod:`pynvml`."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_pynvml, name)
+
+
+class SimulatedBackend:  # pylint: disable=too-many-instance-attributes
+    """A simulated NVML backend for :mod:`nvitop.api.libnvml`.
+
+    Args:
+        devices (Iterable[SimulatedDevice]):
+            The simulated physical devices.
+        latency (Union[float, Dict[str, float]]):
+            The latency in seconds for each NVML call. It can be a mapping from the NVML function
+            name to the latency, and the key :const:`'*'` specifies the default latency.
+        noise (float):
+            The relative standard deviation of the random walk of dynamic metrics in each query. Set
+            to :const:`0.0` to replay constant metrics.
+        seed (Optional[int]):
+            The random seed for the dynamic metrics.
+        driver_version (str):
+            The simulated version of the NVIDIA display driver.
+        cuda_driver_version (int):
+            The simulated version of the CUDA driver, e.g., :const:`12020` for CUDA 12.2.
+
+    The backend can be used as a context manager, or by calling :meth:`install` and
+    :meth:`uninstall` explicitly. Only one backend can be installed at a time.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        devices: Iterable[SimulatedDevice],
+        *,
+        latency: float | dict[str, float] = 0.0,
+        noise: float = 0.01,
+        seed: int | None = None,
+        driver_version: str = '535.104.05',
+        cuda_driver_version: int = 12020,
+    ) -> None:
+        """Initialize the simulated backend."""
+        self.devices = []
+        self.latency = latency
+        self.noise = float(noise)
+        self.seed = seed
+        self.driver_version = driver_version
+        self.cuda_driver_version = int(cuda_driver_version)
+
+        rng = random.Random(seed)  # noqa: S311
+        for index, device in enumerate(devices):
+            device.index = index
+            device.backend = self
+            device._rng.seed(rng.getrandbits(64))  # pylint: disable=protected-access
+            for mig_index, mig_device in enumerate(device.mig_devices):
+                mig_device.index = (index, mig_index)
+                mig_device.backend = self
+                mig_device._rng.seed(rng.getrandbits(64))  # pylint: disable=protected-access
+            self.devices.append(device)
+
+        self._handles_by_uuid = {}
+        self._handles_by_bus_id = {}
+        for device in self.devices:
+            if device.uuid is None:
+                device.uuid = 'GPU-{}'.format(_uuid.UUID(int=rng.getrandbits(128)))
+            if device.bus_id is None:
+                device.bus_id = f'00000000:{0x10 + 0x10 * device.index:02X}:00.0'
+            if device.serial is None:
+                device.serial = f'{1320000000000 + rng.randrange(10_000_000_000)}'
+            self._handles_by_uuid[device.uuid] = device
+            self._handles_by_bus_id[device.bus_id] = device
+            for mig_device in device.mig_devices:
+                if mig_device.uuid is None:
+                    mig_device.uuid = 'MIG-{}'.format(_uuid.UUID(int=rng.getrandbits(128)))
+                self._handles_by_uuid[mig_device.uuid] = mig_device
+                self._handles_by_uuid[
+                    'MIG-{}/{}/{}'.format(
+                        device.uuid,
+                        mig_device.gpu_instance_id,
+                        mig_device.compute_instance_id,
+                    )
+                ] = mig_device
+
+        self._init_count = 0
+        self._saved = None
+        self._disk_cache_enabled = False
+        self._event_sets = []
+        self._sample_buffers = {}
+
+    def __repr__(self) -> str:
+        """Return a string representation of the simulated backend."""
+        return '{}(devices={}, mig_devices={}, processes={})'.format(
+            self.__class__.__name__,
+            len(self.devices),
+            sum(len(device.mig_devices) for device in self.devices),
+            sum(len(device.all_processes()) for device in self.devices),
+        )
+
+    @classmethod
+    def generate(  # pylint: disable=too-many-arguments,too-many-locals
+        cls,
+        num_devices: int = 8,
+        *,
+        mig_devices_per_device: int = 0,
+        processes_per_device: int = 16,
+        use_host_pids: bool = True,
+        name: str = 'NVIDIA A100-SXM4-80GB',
+        memory_total: int = 80 * GiB,
+        latency: float | dict[str, float] = 0.0,
+        noise: float = 0.01,
+        seed: int | None = 0,
+    ) -> SimulatedBackend:
+        """Generate a simulated backend with a random topology.
+
+        Args:
+            num_devices (int):
+                The number of physical devices.
+            mig_devices_per_device (int):
+                The number of MIG devices on each physical device. The MIG mode will be enabled on
+                all physical devices if it is positive.
+            processes_per_device (int):
+                The number of GPU processes on each physical device. For MIG-enabled devices, the
+                processes are distributed over the MIG devices.
+            use_host_pids (bool):
+                Whether to use the PIDs of the processes running on the host, which makes the host
+                information (e.g., the command line) of the GPU processes available. The PIDs will
+                be reused across devices if there are not enough host processes. Otherwise, use
+                nonexistent PIDs.
+            name (str):
+                The product name of the physical devices.
+            memory_total (int):
+                The total memory in bytes of each physical device.
+            latency (Union[float, Dict[str, float]]):
+                The latency in seconds for each NVML call. See :class:`SimulatedBackend`.
+            noise (float):
+                The relative standard deviation of the random walk of dynamic metrics in each query.
+            seed (Optional[int]):
+                The random seed for the topology and the dynamic metrics.
+        """
+        rng = random.Random(seed)  # noqa: S311
+
+        if use_host_pids:
+            pids = sorted(psutil.pids())
+        else:
+            pids = list(range(4_000_000, 4_000_000 + max(processes_per_device, 1)))
+        offset = 0
+
+        def make_processes(count: int, memory: int) -> list[SimulatedProcess]:
+            nonlocal offset
+
+            processes = []
+            count = min(count, len(pids))
+            for i in range(count):
+                processes.append(
+                    SimulatedProcess(
+                        pid=pids[(offset + i) % len(pids)],
+                        gpu_memory=rng.randrange(256, max(memory // MiB // max(count, 1), 257))
+                        * MiB,
+                        type='C' if rng.random() < 0.95 else 'G',
+                        sm_utilization=rng.randrange(0, 101),
+                        memory_utilization=rng.randrange(0, 101),
+                    ),
+                )
+            offset += count
+            return processes
+
+        def make_metrics(memory_total: int, processes: list[SimulatedProcess]) -> dict[str, int]:
+            memory_used = min(sum(p.gpu_memory for p in processes) + 512 * MiB, memory_total)
+            return {
+                'memory_used': memory_used,
+                'bar1_memory_used': rng.randrange(2, 64) * MiB,
+                'gpu_utilization': rng.randrange(0, 101),
+                'memory_utilization': rng.randrange(0, 101),
+                'graphics_clock': rng.randrange(210, 1411),
+                'sm_clock': rng.randrange(210, 1411),
+                'memory_clock': 1593,
+                'video_clock': rng.randrange(555, 1276),
+                'fan_speed': None,  # datacenter GPUs do not have fans
+                'temperature': rng.randrange(30, 80),
+                'power_usage': rng.randrange(60_000, 400_001),
+                'performance_state': 0,
+            }
+
+        devices = []
+        for _ in range(num_devices):
+            if mig_devices_per_device > 0:
+                mig_memory_total = memory_total // mig_devices_per_device
+                mig_devices = []
+                for mig_index in range(mig_devices_per_device):
+                    processes = make_processes(
+                        processes_per_device // mig_devices_per_device
+                        + int(mig_index < processes_per_device % mig_devices_per_device),
+                        mig_memory_total,
+                    )
+                    mig_devices.append(
+                        SimulatedDevice(
+                            name=f'{name} MIG 1g.{mig_memory_total // GiB}gb',
+                            memory_total=mig_memory_total,
+                            bar1_memory_total=32 * GiB,
+                            gpu_instance_id=7 + mig_index,
+                            compute_instance_id=0,
+                            metrics={
+                                **make_metrics(mig_memory_total, processes),
+                                **dict.fromkeys(
+                                    (
+                                        'gpu_utilization',
+                                        'memory_utilization',
+                                        'encoder_utilization',
+                                        'decoder_utilization',
+                                        'fan_speed',
+                                        'temperature',
+                                        'power_usage',
+                                        'performance_state',
+                                    ),
+                                ),
+                            },
+                            processes=processes,
+                        ),
+                    )
+                device = SimulatedDevice(
+                    name=name,
+                    memory_total=memory_total,
+                    mig_mode=1,
+                    max_mig_device_count=7,
+                    mig_devices=mig_devices,
+                    metrics=make_metrics(memory_total, []),
+                )
+                device.metrics['memory_used'] = sum(
+                    mig_device.metrics['memory_used'] for mig_device in mig_devices
+                )
+            else:
+                processes = make_processes(processes_per_device, memory_total)
+                device = SimulatedDevice(
+                    name=name,
+                    memory_total=memory_total,
+                    mig_mode=0,
+                    max_mig_device_count=7,
+                    metrics=make_metrics(memory_total, processes),
+                    processes=processes,
+                )
+            devices.append(device)
+
+        return cls(devices, latency=latency, noise=noise, seed=seed)
+
+    def to_config(self) -> dict[str, Any]:
+        """Return a JSON serializable configuration of the backend for replaying."""
+        return {
+            'driver_version': self.driver_version,
+            'cuda_driver_version': self.cuda_driver_version,
+            'devices': [device.to_config() for device in self.devices],
+        }
+
+    @classmethod
+    def from_config(
+        cls,
+        config: dict[str, Any],
+        *,
+        latency: float | dict[str, float] = 0.0,
+        noise: float = 0.0,
+        seed: int | None = None,
+    ) -> SimulatedBackend:
+        """Create a simulated backend from the configuration returned by :meth:`to_config`."""
+        return cls(
+            map(SimulatedDevice.from_config, config.get('devices', ())),
+            latency=latency,
+            noise=noise,
+            seed=seed,
+            driver_version=config.get('driver_version', '535.104.05'),
+            cuda_driver_version=config.get('cuda_driver_version', 12020),
+        )
+
+    @classmethod
+    def capture(cls, **kwargs: Any) -> SimulatedBackend:
+        """Capture the device topology and the GPU processes from the real NVML library.
+
+        The keyword arguments are passed to the constructor of :class:`SimulatedBackend`.
+
+        Raises:
+            RuntimeError:
+                If a simulated backend is already installed.
+            libnvml.NVMLError:
+                If failed to query the NVML library.
+        """
+        from nvitop.api.device import PhysicalDevice  # pylint: disable=import-outside-toplevel
+
+        if _ACTIVE_BACKEND is not None:
+            raise RuntimeError('Cannot capture from a simulated NVML backend.')
+
+        def capture_device(real: Any, **extra: Any) -> SimulatedDevice:
+            snapshot = real.as_snapshot()
+            max_clock_infos = real.max_clock_infos()
+            return SimulatedDevice(
+                name=snapshot.name,
+                uuid=snapshot.uuid,
+                bus_id=snapshot.bus_id if snapshot.bus_id is not NA else None,
+                memory_total=snapshot.memory_total,
+                bar1_memory_total=snapshot.bar1_memory_total,
+                cuda_compute_capability=(
+                    real.cuda_compute_capability()
+                    if libnvml.nvmlCheckReturn(real.cuda_compute_capability(), tuple)
+                    else (8, 0)
+                ),
+                max_clock_infos=tuple(
+                    clock if isinstance(clock, int) else 0 for clock in max_clock_infos
+                ),
+                power_limit=_int_or_none(snapshot.power_limit),
+                metrics={
+                    'memory_used': _int_or_none(snapshot.memory_used),
+                    'bar1_memory_used': _int_or_none(snapshot.bar1_memory_used),
+                    'gpu_utilization': _int_or_none(snapshot.gpu_utilization),
+                    'memory_utilization': _int_or_none(snapshot.memory_utilization),
+                    'encoder_utilization': _int_or_none(snapshot.encoder_utilization),
+                    'decoder_utilization': _int_or_none(snapshot.decoder_utilization),
+                    'graphics_clock': _int_or_none(snapshot.clock_infos.graphics),
+                    'sm_clock': _int_or_none(snapshot.clock_infos.sm),
+                    'memory_clock': _int_or_none(snapshot.clock_infos.memory),
+                    'video_clock': _int_or_none(snapshot.clock_infos.video),
+                    'fan_speed': _int_or_none(snapshot.fan_speed),
+                    'temperature': _int_or_none(snapshot.temperature),
+                    'power_usage': _int_or_none(snapshot.power_usage),
+                    'performance_state': _int_or_none(
+                        snapshot.performance_state[1:] if snapshot.performance_state else NA,
+                    ),
+                    'total_volatile_uncorrected_ecc_errors': _int_or_none(
+                        snapshot.total_volatile_uncorrected_ecc_errors,
+                    ),
+                },
+                processes=[
+                    SimulatedProcess(
+                        pid=process.pid,
+                        gpu_memory=_int_or_none(process.gpu_memory()) or 0,
+                        type=process.type[:1] or 'C',
+                        sm_utilization=_int_or_none(process.gpu_sm_utilization()) or 0,
+                        memory_utilization=_int_or_none(process.gpu_memory_utilization()) or 0,
+                        encoder_utilization=_int_or_none(process.gpu_encoder_utilization()) or 0,
+                        decoder_utilization=_int_or_none(process.gpu_decoder_utilization()) or 0,
+                    )
+                    for process in real.processes().values()
+                    if not real.is_mig_mode_enabled()
+                ],
+                **extra,
+            )
+
+        devices = []
+        for physical_device in PhysicalDevice.all():
+            mig_mode = {'Disabled': 0, 'Enabled': 1}.get(physical_device.mig_mode())
+            devices.append(
+                capture_device(
+                    physical_device,
+                    mig_mode=mig_mode,
+                    max_mig_device_count=physical_device.max_mig_device_count(),
+                    mig_devices=[
+                        capture_device(
+                            mig_device,
+                            gpu_instance_id=mig_device.gpu_instance_id(),
+                            compute_instance_id=mig_device.compute_instance_id(),
+                        )
+                        for mig_device in physical_device.mig_devices()
+                    ],
+                ),
+            )
+
+        cuda_driver_version = libnvml.nvmlQuery('nvmlSystemGetCudaDriverVersion')
+        kwargs.setdefault('driver_version', PhysicalDevice.driver_version())
+        if libnvml.nvmlCheckReturn(cuda_driver_version, int):
+            kwargs.setdefault('cuda_driver_version', cuda_driver_version)
+        return cls(devices, **kwargs)
+
+    def emit_event(
+        self,
+        device: int | tuple[int, int] | SimulatedDevice,
+        event_type: int,
+        event_data: int = 0,
+    ) -> None:
+        """Emit an event to the event sets that registered the device for the event type.
+
+        Args:
+            device (Union[int, Tuple[int, int], SimulatedDevice]):
+                The device (or its index) on which the event occurs. The events of MIG devices are
+                emitted on the parent device with the GPU and compute instance IDs.
+            event_type (int):
+                The NVML event type bitmask (``nvmlEventType*``).
+            event_data (int):
+                The event data, e.g., the XID error code for XID critical errors.
+        """
+        if isinstance(device, int):
+            device = self.devices[device]
+        elif isinstance(device, tuple):
+            device = self.devices[device[0]].mig_devices[device[1]]
+
+        if device.is_mig_device:
+            physical_device = device.parent
+            gpu_instance_id, compute_instance_id = (
+                device.gpu_instance_id,
+                device.compute_instance_id,
+            )
+        else:
+            physical_device = device
+            gpu_instance_id = compute_instance_id = 0xFFFFFFFF
+
+        event = SimpleNamespace(
+            device=physical_device,
+            eventType=event_type,
+            eventData=event_data,
+            gpuInstanceId=gpu_instance_id,
+            computeInstanceId=compute_instance_id,
+        )
+        for event_set in tuple(self._event_sets):
+            event_set.put(event, physical_device)
+
+    # Installation #################################################################################
+
+    @property
+    def installed(self) -> bool:
+        """Whether the simulated backend is installed."""
+        return self._saved is not None
+
+    def install(self) -> None:
+        """Install the simulated backend into module :mod:`nvitop.api.libnvml`.
+
+        The NVML context and the cached device attributes will be reset. The on-disk cache will be
+        disabled until the simulated backend is uninstalled.
+
+        Raises:
+            RuntimeError:
+                If a simulated backend is already installed.
+        """
+        global _ACTIVE_BACKEND  # pylint: disable=global-statement
+
+        with _INSTALL_LOCK:
+            if _ACTIVE_BACKEND is not None:
+                raise RuntimeError(
+                    f'A simulated NVML backend is already installed: {_ACTIVE_BACKEND!r}.'
+                )
+
+            functions = self._functions()
+            proxy = _PynvmlProxy(_pynvml.__name__)
+            proxy.__dict__.update(functions)
+            proxy.__dict__['_nvmlGetFunctionPointer'] = self._nvmlGetFunctionPointer
+
+            namespace = vars(libnvml)
+            replacements = {
+                '_pynvml': proxy,
+                '__flags': [],
+                '__initialized': False,
+                '_pynvml_installation_corrupted': False,
+                '_driver_get_memory_info_v2_available': None,
+                '_pynvml_get_memory_info_v2_available': namespace['_pynvml_memory_v2_available'],
+            }
+            for name, attr in vars(_pynvml).items():
+                if (
+                    name.startswith('nvml')
+                    and isinstance(attr, FunctionType)
+                    and name not in _LIBNVML_WRAPPERS
+                    and namespace.get(name) is attr
+                ):
+                    replacements[name] = functions.get(name, _not_supported(name))
+
+            self._saved = {name: namespace.get(name, _MISSING) for name in replacements}
+            namespace.update(replacements)
+            # Never persist the attributes of the simulated devices to the on-disk cache
+            self._disk_cache_enabled = diskcache.is_enabled()
+            diskcache.disable()
+            self._init_count = 0
+            _ACTIVE_BACKEND = self
+
+        _reset_device_caches()
+
+    def uninstall(self) -> None:
+        """Uninstall the simulated backend and restore the original NVML functions.
+
+        Raises:
+            RuntimeError:
+                If the simulated backend is not installed.
+        """
+        global _ACTIVE_BACKEND  # pylint: disable=global-statement
+
+        with _INSTALL_LOCK:
+            if _ACTIVE_BACKEND is not self:
+                raise RuntimeError('The simulated NVML backend is not installed.')
+
+            namespace = vars(libnvml)
+            for name, attr in self._saved.items():
+                if attr is _MISSING:
+                    namespace.pop(name, None)
+                else:
+                    namespace[name] = attr
+            self._saved = None
+            if self._disk_cache_enabled:
+                diskcache.enable()
+            else:
+                diskcache.disable()
+            _ACTIVE_BACKEND = None
+
+        _reset_device_caches()
+
+    def __enter__(self) -> SimulatedBackend:
+        """Install the simulated backend."""
+        self.install()
+        return self
+
+    def __exit__(self, *args: Any, **kwargs: Any) -> None:
+        """Uninstall the simulated backend."""
+        self.uninstall()
+
+    def _functions(self) -> dict[str, Callable[..., Any]]:
+        """Return the simulated NVML functions wrapped with latency."""
+        functions = {}
+        for name in dir(type(self)):
+            if name.startswith('nvml'):
+                functions[name] = self._with_latency(name, getattr(self, name))
+        return functions
+
+    def _latency_of(self, name: str) -> float:
+        if isinstance(self.latency, dict):
+            return self.latency.get(name, self.latency.get('*', 0.0))
+        return self.latency
+
+    def _with_latency(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        latency = self._latency_of(name)
+        if latency <= 0.0:
+            return func
+
+        @functools.wraps(func)
+        def wrapped(*args: Any, **kwargs: Any) -> Any:
+            time.sleep(latency)
+            return func(*args, **kwargs)
+
+        return wrapped
+
+    # Simulated NVML functions #####################################################################
+
+    def _check_initialized(self) -> None:
+        if self._init_count <= 0:
+            raise libnvml.NVMLError_Uninitialized  # pylint: disable=no-member
+
+    def _nvmlGetFunctionPointer(self, name: str) -> Callable[..., Any]:
+        self._check_initialized()
+        try:
+            return getattr(self, name)
+        except AttributeError as ex:
+            raise libnvml.NVMLError_FunctionNotFound from ex
+
+    def nvmlInitWithFlags(self, flags: int) -> None:  # pylint: disable=unused-argument
+        self._init_count += 1
+
+    def nvmlInit(self) -> None:
+        self.nvmlInitWithFlags(0)
+
+    def nvmlShutdown(self) -> None:
+        self._check_initialized()
+        self._init_count -= 1
+
+    def nvmlSystemGetDriverVersion(self) -> str:
+        self._check_initialized()
+        return self.driver_version
+
+    def nvmlSystemGetCudaDriverVersion(self) -> int:
+        self._check_initialized()
+        return self.cuda_driver_version
+
+    nvmlSystemGetCudaDriverVersion_v2 = nvmlSystemGetCudaDriverVersion
+
+    def nvmlDeviceGetCount(self) -> int:
+        self._check_initialized()
+        return len(self.devices)
+
+    def nvmlDeviceGetHandleByIndex(self, index: int) -> SimulatedDevice:
+        self._check_initialized()
+        if isinstance(index, bytes):
+            index = index.decode('UTF-8')
+        try:
+            index = int(index)
+            if index < 0:
+                raise IndexError(index)
+            return self.devices[index]
+        except (ValueError, IndexError) as ex:
+            raise libnvml.NVMLError_InvalidArgument from ex
+
+    def nvmlDeviceGetHandleByUUID(self, uuid: str | bytes) -> SimulatedDevice:
+        self._check_initialized()
+        if isinstance(uuid, bytes):
+            uuid = uuid.decode('UTF-8')
+        try:
+            return self._handles_by_uuid[uuid]
+        except KeyError as ex:
+            raise libnvml.NVMLError_NotFound from ex
+
+    def nvmlDeviceGetHandleByPciBusId(self, bus_id: str | bytes) -> SimulatedDevice:
+        self._check_initialized()
+        if isinstance(bus_id, bytes):
+            bus_id = bus_id.decode('UTF-8')
+        try:
+            return self._handles_by_bus_id[bus_id.upper()]
+        except KeyError as ex:
+            raise libnvml.NVMLError_NotFound from ex
+
+    def _device(self, handle: SimulatedDevice, physical: bool | None = None) -> SimulatedDevice:
+        self._check_initialized()
+        if not isinstance(handle, SimulatedDevice) or handle.backend is not self:
+            raise libnvml.NVMLError_InvalidArgument
+        if physical is not None and handle.is_mig_device == physical:
+            raise libnvml.NVMLError_NotSupported
+        return handle
+
+    def nvmlDeviceGetIndex(self, handle: SimulatedDevice) -> int:
+        return self._device(handle, physical=True).index
+
+    def nvmlDeviceGetName(self, handle: SimulatedDevice) -> str:
+        return self._device(handle).name
+
+    def nvmlDeviceGetUUID(self, handle: SimulatedDevice) -> str:
+        return self._device(handle).uuid
+
+    def nvmlDeviceGetSerial(self, handle: SimulatedDevice) -> str:
+        return self._device(handle, physical=True).serial
+
+    def nvmlDeviceGetPciInfo(self, handle: SimulatedDevice) -> SimpleNamespace:
+        device = self._device(handle)
+        if device.is_mig_device:
+            device = device.parent
+        return SimpleNamespace(busId=device.bus_id, busIdLegacy=device.bus_id[4:])
+
+    def nvmlDeviceGetMemoryInfo(
+        self,
+        handle: SimulatedDevice,
+        version: int | None = None,
+    ) -> SimpleNamespace:
+        device = self._device(handle)
+        if device.mig_devices:
+            used = sum(mig_device.metric('memory_used') for mig_device in device.mig_devices)
+        else:
+            used = device.metric('memory_used')
+        reserved = 0 if version is None else min(512 * MiB, device.memory_total - used)
+        return SimpleNamespace(
+            total=device.memory_total,
+            reserved=reserved,
+            free=device.memory_total - used - reserved,
+            used=used,
+        )
+
+    def nvmlDeviceGetBAR1MemoryInfo(self, handle: SimulatedDevice) -> SimpleNamespace:
+        device = self._device(handle)
+        used = device.metric('bar1_memory_used')
+        return SimpleNamespace(
+            bar1Total=device.bar1_memory_total,
+            bar1Free=device.bar1_memory_total - used,
+            bar1Used=used,
+        )
+
+    def nvmlDeviceGetUtilizationRates(self, handle: SimulatedDevice) -> SimpleNamespace:
+        device = self._device(handle)
+        return SimpleNamespace(
+            gpu=device.metric('gpu_utilization'),
+            memory=device.metric('memory_utilization'),
+        )
+
+    def nvmlDeviceGetEncoderUtilization(self, handle: SimulatedDevice) -> list[int]:
+        return [self._device(handle).metric('encoder_utilization'), 167_000]
+
+    def nvmlDeviceGetDecoderUtilization(self, handle: SimulatedDevice) -> list[int]:
+        return [self._device(handle).metric('decoder_utilization'), 167_000]
+
+    _CLOCK_METRICS = ('graphics_clock', 'sm_clock', 'memory_clock', 'video_clock')
+
+    def nvmlDeviceGetClockInfo(
+        self, handle: SimulatedDevice, type: int
+    ) -> int:  # pylint: disable=redefined-builtin
+        device = self._device(handle)
+        try:
+            return device.metric(self._CLOCK_METRICS[type])
+        except (IndexError, TypeError) as ex:
+            raise libnvml.NVMLError_InvalidArgument from ex
+
+    def nvmlDeviceGetMaxClockInfo(
+        self, handle: SimulatedDevice, type: int
+    ) -> int:  # pylint: disable=redefined-builtin
+        device = self._device(handle)
+        try:
+            return device.max_clock_infos[type]
+        except (IndexError, TypeError) as ex:
+            raise libnvml.NVMLError_InvalidArgument from ex
+
+    def nvmlDeviceGetFanSpeed(self, handle: SimulatedDevice) -> int:
+        return self._device(handle).metric('fan_speed')
+
+    def nvmlDeviceGetTemperature(self, handle: SimulatedDevice, sensor: int) -> int:
+        if sensor != libnvml.NVML_TEMPERATURE_GPU:
+            raise libnvml.NVMLError_InvalidArgument
+        return self._device(handle).metric('temperature')
+
+    def nvmlDeviceGetPowerUsage(self, handle: SimulatedDevice) -> int:
+        return self._device(handle).metric('power_usage')
+
+    def nvmlDeviceGetPowerManagementLimit(self, handle: SimulatedDevice) -> int:
+        power_limit = self._device(handle, physical=True).power_limit
+        if power_limit is None:
+            raise libnvml.NVMLError_NotSupported
+        return power_limit
+
+    nvmlDeviceGetEnforcedPowerLimit = nvmlDeviceGetPowerManagementLimit
+
+    def nvmlDeviceGetDisplayActive(self, handle: SimulatedDevice) -> int:
+        return self._device(handle, physical=True).display_active
+
+    def nvmlDeviceGetDisplayMode(self, handle: SimulatedDevice) -> int:
+        return self._device(handle, physical=True).display_mode
+
+    def nvmlDeviceGetCurrentDriverModel(self, handle: SimulatedDevice) -> int:
+        self._device(handle)
+        raise libnvml.NVMLError_NotSupported  # Windows only
+
+    def nvmlDeviceGetPersistenceMode(self, handle: SimulatedDevice) -> int:
+        return self._device(handle, physical=True).persistence_mode
+
+    def nvmlDeviceGetPerformanceState(self, handle: SimulatedDevice) -> int:
+        return self._device(handle).metric('performance_state')
+
+    def nvmlDeviceGetTotalEccErrors(
+        self,
+        handle: SimulatedDevice,
+        errorType: int,  # pylint: disable=unused-argument
+        counterType: int,  # pylint: disable=unused-argument
+    ) -> int:
+        return self._device(handle).metric('total_volatile_uncorrected_ecc_errors')
+
+    def nvmlDeviceGetComputeMode(self, handle: SimulatedDevice) -> int:
+        return self._device(handle, physical=True).compute_mode
+
+    def nvmlDeviceGetFieldValues(
+        self,
+        handle: SimulatedDevice,
+        fieldIds: list[int | tuple[int, int]],
+    ) -> list[SimpleNamespace]:
+        device = self._device(handle)
+        timestamp = int(time.time() * 1e6)
+        field_values = []
+        for field_id in fieldIds:
+            try:
+                field_id, scope_id = field_id
+            except TypeError:
+                scope_id = 0
+
+            field_value = SimpleNamespace(
+                fieldId=field_id,
+                scopeId=scope_id,
+                timestamp=timestamp,
+                latencyUsec=0,
+                valueType=_pynvml.NVML_VALUE_TYPE_UNSIGNED_LONG_LONG,
+                nvmlReturn=_pynvml.NVML_SUCCESS,
+                value=SimpleNamespace(),
+            )
+            try:
+                if field_id == libnvml.NVML_FI_DEV_ECC_DBE_VOL_TOTAL:
+                    value = device.metric('total_volatile_uncorrected_ecc_errors')
+                elif field_id in (libnvml.NVML_FI_DEV_POWER_AVERAGE, _FI_DEV_POWER_INSTANT):
+                    value = device.metric('power_usage')
+                elif field_id in (
+                    libnvml.NVML_FI_DEV_POWER_CURRENT_LIMIT,
+                    _FI_DEV_POWER_REQUESTED_LIMIT,
+                ):
+                    value = device.power_limit if not device.is_mig_device else None
+                    if value is None:
+                        raise libnvml.NVMLError_NotSupported
+                else:
+                    raise libnvml.NVMLError_NotSupported
+            except libnvml.NVMLError as ex:
+                field_value.nvmlReturn = ex.value
+            else:
+                field_value.value.ullVal = value
+            field_values.append(field_value)
+        return field_values
+
+    def nvmlDeviceGetCudaComputeCapability(self, handle: SimulatedDevice) -> tuple[int, int]:
+        return self._device(handle).cuda_compute_capability
+
+    def nvmlDeviceIsMigDeviceHandle(self, handle: SimulatedDevice) -> int:
+        return int(self._device(handle).is_mig_device)
+
+    def nvmlDeviceGetMigMode(self, handle: SimulatedDevice) -> list[int]:
+        device = self._device(handle, physical=True)
+        if device.mig_mode is None:
+            raise libnvml.NVMLError_NotSupported
+        return [device.mig_mode, device.mig_mode]
+
+    def nvmlDeviceGetMaxMigDeviceCount(self, handle: SimulatedDevice) -> int:
+        return self._device(handle, physical=True).max_mig_device_count
+
+    def nvmlDeviceGetMigDeviceHandleByIndex(
+        self,
+        handle: SimulatedDevice,
+        index: int,
+    ) -> SimulatedDevice:
+        device = self._device(handle, physical=True)
+        if not device.mig_mode:
+            raise libnvml.NVMLError_InvalidArgument
+        try:
+            return device.mig_devices[index]
+        except IndexError as ex:
+            raise libnvml.NVMLError_NotFound from ex
+
+    def nvmlDeviceGetDeviceHandleFromMigDeviceHandle(
+        self,
+        handle: SimulatedDevice,
+    ) -> SimulatedDevice:
+        return self._device(handle, physical=False).parent
+
+    def nvmlDeviceGetGpuInstanceId(self, handle: SimulatedDevice) -> int:
+        return self._device(handle, physical=False).gpu_instance_id
+
+    def nvmlDeviceGetComputeInstanceId(self, handle: SimulatedDevice) -> int:
+        return self._device(handle, physical=False).compute_instance_id
+
+    def _running_processes(
+        self, handle: SimulatedDevice, type: str
+    ) -> list[SimpleNamespace]:  # pylint: disable=redefined-builtin
+        device = self._device(handle)
+        processes = []
+        for process in device.all_processes():
+            if process.type != type:
+                continue
+            if process.device.is_mig_device:
+                gpu_instance_id = process.device.gpu_instance_id
+                compute_instance_id = process.device.compute_instance_id
+            else:
+                gpu_instance_id = compute_instance_id = 0xFFFFFFFF
+            processes.append(
+                SimpleNamespace(
+                    pid=process.pid,
+                    usedGpuMemory=process.gpu_memory,
+                    gpuInstanceId=gpu_instance_id,
+                    computeInstanceId=compute_instance_id,
+                ),
+            )
+        return processes
+
+    def nvmlDeviceGetComputeRunningProcesses(
+        self, handle: SimulatedDevice
+    ) -> list[SimpleNamespace]:
+        return self._running_processes(handle, type='C')
+
+    def nvmlDeviceGetGraphicsRunningProcesses(
+        self, handle: SimulatedDevice
+    ) -> list[SimpleNamespace]:
+        return self._running_processes(handle, type='G')
+
+    def nvmlDeviceGetMPSComputeRunningProcesses(
+        self, handle: SimulatedDevice
+    ) -> list[SimpleNamespace]:
+        self._device(handle)
+        return []
+
+    def nvmlDeviceGetProcessUtilization(
+        self,
+        handle: SimulatedDevice,
+        timeStamp: int,
+    ) -> list[SimpleNamespace]:
+        device = self._device(handle, physical=True)
+        if device.mig_mode:
+            raise libnvml.NVMLError_NotSupported
+
+        now = int(time.time() * 1e6)
+        if timeStamp >= now or len(device.processes) == 0:
+            raise libnvml.NVMLError_NotFound
+        noise = self.noise * 100.0
+        samples = []
+        for process in device.processes:
+            if noise > 0.0:
+                process.sm_utilization = _clamp_percentage(
+                    process.sm_utilization
+                    + device._rng.gauss(0.0, noise),  # pylint: disable=protected-access
+                )
+                process.memory_utilization = _clamp_percentage(
+                    process.memory_utilization
+                    + device._rng.gauss(0.0, noise),  # pylint: disable=protected-access
+                )
+            samples.append(
+                SimpleNamespace(
+                    pid=process.pid,
+                    timeStamp=now,
+                    smUtil=process.sm_utilization,
+                    memUtil=process.memory_utilization,
+                    encUtil=process.encoder_utilization,
+                    decUtil=process.decoder_utilization,
+                ),
+            )
+        return samples
+
+    def nvmlDeviceGetSamples(
+        self,
+        handle: SimulatedDevice,
+        sampling_type: int,
+        timeStamp: int,
+    ) -> tuple[int, list[SimpleNamespace]]:
+        device = self._device(handle, physical=True)
+        try:
+            metric = _SAMPLE_METRICS[sampling_type]
+        except KeyError as ex:
+            raise libnvml.NVMLError_NotSupported from ex
+        if device.metrics.get(metric) is None:
+            raise libnvml.NVMLError_NotSupported
+
+        # Fill the ring buffer with the samples taken since the last query
+        now = int(time.time() * 1e6)
+        buffer = self._sample_buffers.setdefault(
+            (device, sampling_type),
+            deque(maxlen=_SAMPLE_BUFFER_SIZE),
+        )
+        next_timestamp = max(
+            buffer[-1][0] + _SAMPLE_PERIOD if buffer else 0,
+            now - _SAMPLE_PERIOD * (_SAMPLE_BUFFER_SIZE - 1),
+        )
+        while next_timestamp <= now:
+            buffer.append((next_timestamp, device.metric(metric)))
+            next_timestamp += _SAMPLE_PERIOD
+
+        samples = [
+            SimpleNamespace(timeStamp=timestamp, sampleValue=SimpleNamespace(uiVal=value))
+            for timestamp, value in buffer
+            if timestamp > timeStamp
+        ]
+        if len(samples) == 0:
+            raise libnvml.NVMLError_NotFound
+        return _pynvml.NVML_VALUE_TYPE_UNSIGNED_INT, samples
+
+    def nvmlEventSetCreate(self) -> _SimulatedEventSet:
+        self._check_initialized()
+        event_set = _SimulatedEventSet()
+        self._event_sets.append(event_set)
+        return event_set
+
+    def nvmlEventSetFree(self, eventSet: _SimulatedEventSet) -> None:
+        self._check_initialized()
+        try:
+            self._event_sets.remove(eventSet)
+        except ValueError as ex:
+            raise libnvml.NVMLError_InvalidArgument from ex
+
+    def nvmlDeviceGetSupportedEventTypes(self, handle: SimulatedDevice) -> int:
+        return self._device(handle, physical=True).supported_event_types
+
+    def nvmlDeviceRegisterEvents(
+        self,
+        handle: SimulatedDevice,
+        eventTypes: int,
+        eventSet: _SimulatedEventSet,
+    ) -> None:
+        device = self._device(handle, physical=True)
+        if eventSet not in self._event_sets:
+            raise libnvml.NVMLError_InvalidArgument
+        if eventTypes & ~device.supported_event_types:
+            raise libnvml.NVMLError_NotSupported
+        eventSet.registered[device] = eventSet.registered.get(device, 0) | eventTypes
+
+    def nvmlEventSetWait_v2(
+        self,
+        eventSet: _SimulatedEventSet,
+        timeoutms: int,
+    ) -> SimpleNamespace:
+        self._check_initialized()
+        if eventSet not in self._event_sets:
+            raise libnvml.NVMLError_InvalidArgument
+        return eventSet.wait(timeoutms / 1000.0)
+
+    nvmlEventSetWait = nvmlEventSetWait_v2
+
+
+def _int_or_none(value: Any) -> int | None:
+    try:
+        return int(value) if value is not NA else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _clamp_percentage(value: float) -> int:
+    return round(min(max(value, 0.0), 100.0))
+
+
+def _not_supported(name: str) -> Callable[..., Any]:
+    def not_supported(*args: Any, **kwargs: Any) -> Any:  # pylint: disable=unused-argument
+        raise libnvml.NVMLError_NotSupported
+
+    not_supported.__name__ = not_supported.__qualname__ = name
+    return not_supported
+
+
+def _reset_device_caches() -> None:
+    # pylint: disable-next=import-outside-toplevel
+    from nvitop.api import device as device_module
+
+    with device_module._GLOBAL_PHYSICAL_DEVICE_LOCK:  # pylint: disable=protected-access
+        device_module._PHYSICAL_DEVICE_ATTRS = None  # pylint: disable=protected-access
+    device_module._parse_cuda_visible_devices.cache_clear()  # pylint: disable=protected-access
+    device_module._clear_handle_caches()  # pylint: disable=protected-access
+    libnvml.nvmlResolveCacheClear()
+    libnvml.nvmlCapabilityCacheClear()
+    diskcache.reset()
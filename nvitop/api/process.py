@@ -20,19 +20,26 @@
 
 from __future__ import annotations
 
+import atexit
+import collections
+import concurrent.futures
 import contextlib
 import datetime
 import functools
 import os
 import threading
+import time
+import weakref
 from abc import ABCMeta
 from types import FunctionType
-from typing import TYPE_CHECKING, Any, Callable, Iterable
-from weakref import WeakValueDictionary
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Iterator, NamedTuple
 
-from nvitop.api import host, libnvml
+from cachetools import LRUCache
+
+from nvitop.api import host, libnvml, procfs
 from nvitop.api.utils import (
     NA,
+    LazySnapshot,
     NaType,
     Snapshot,
     bytes2human,
@@ -45,7 +52,7 @@ if TYPE_CHECKING:
     from nvitop.api.device import Device
 
 
-__all__ = ['HostProcess', 'GpuProcess', 'command_join']
+__all__ = ['HostProcess', 'GpuProcess', 'command_join', 'cmdline_cache_clear']
 
 
 if host.POSIX:
@@ -118,15 +125,10 @@ def auto_garbage_clean(
                 return func(self, *args, **kwargs)
             except host.PsutilError as ex:
                 try:
-                    with GpuProcess.INSTANCE_LOCK:
-                        del GpuProcess.INSTANCES[(self.pid, self.device)]
-                except (KeyError, AttributeError):
-                    pass
-                try:
-                    with HostProcess.INSTANCE_LOCK:
-                        del HostProcess.INSTANCES[self.pid]
-                except KeyError:
+                    type(self).INSTANCES.pop((self.pid, self.device), None)
+                except AttributeError:
                     pass
+                HostProcess.INSTANCES.pop(self.pid, None)
                 # See also `GpuProcess.failsafe`
                 if fallback is _RAISE or not getattr(_USE_FALLBACK_WHEN_RAISE, 'value', False):
                     raise ex
@@ -136,16 +138,237 @@ def auto_garbage_clean(
                     return list(fallback)
                 return fallback
 
+        wrapped.fallback = fallback
         return wrapped
 
     return wrapper
 
 
+INSTANCE_CACHE_SIZE = 65536
+"""The number of the cached :class:`HostProcess` and :class:`GpuProcess` instances to keep the entries
+of the garbage collected ones. The live instances are never evicted."""
+
+INSTANCE_CACHE_SHARDS = 16
+"""The number of the independently locked shards of the instance caches."""
+
+
+class InstanceCacheInfo(NamedTuple):  # pylint: disable=missing-class-docstring
+    hits: int
+    misses: int  # including the cached instances of the terminated processes
+    evictions: int  # the entries of the garbage collected instances discarded due to the size limit
+    maxsize: int
+    currsize: int
+
+
+class _InstanceCacheShard:  # pylint: disable=too-few-public-methods
+    __slots__ = ('lock', 'entries', 'pending_removals', 'hits', 'misses', 'evictions')
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()  # key -> weakref.ref(instance)
+        # The weak reference callbacks may be called by the garbage collector at any time (even in
+        # the critical section of the same thread), so the removals are deferred to `purge()`
+        self.pending_removals = []
+        self.hits = self.misses = self.evictions = 0
+
+    def make_ref(self, key: Hashable, instance: Any) -> weakref.ref:
+        pending_removals = self.pending_removals
+        return weakref.ref(instance, lambda ref: pending_removals.append((key, ref)))
+
+    def purge(self) -> None:  # the lock should be held
+        while self.pending_removals:
+            key, ref = self.pending_removals.pop()
+            if self.entries.get(key) is ref:
+                del self.entries[key]
+
+    def evict(self, maxsize: int) -> None:  # the lock should be held
+        # Only discard the dead entries, the live instances are kept during the lifetime of the
+        # processes (e.g., to preserve the states of `cpu_percent()`)
+        if len(self.entries) <= maxsize:
+            return
+        for key, ref in list(self.entries.items()):  # from the least recently used
+            if ref() is None:
+                del self.entries[key]
+                self.evictions += 1
+                if len(self.entries) <= maxsize:
+                    break
+
+
+class _InstanceCache:
+    """A cache of the process instances with weak references and sharded locks.
+
+    The entries are removed when the instances are garbage collected. The live instances are never
+    evicted, so the size limit of a shard only applies to the entries of the garbage collected
+    instances whose removals are pending. The keys are distributed to the shards by ``shard_key(key)``,
+    and the shards are locked independently. The bulk lookup :meth:`get_or_create` locks each shard
+    only once for all keys in it.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = INSTANCE_CACHE_SIZE,
+        shards: int = INSTANCE_CACHE_SHARDS,
+        shard_key: Callable[[Hashable], Hashable] | None = None,
+    ) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self._shard_maxsize = max(1, -(-maxsize // shards))
+        self._shards = tuple(_InstanceCacheShard() for _ in range(shards))
+        self._shard_key = shard_key
+
+    def _shard(self, key: Hashable) -> _InstanceCacheShard:
+        if self._shard_key is not None:
+            key = self._shard_key(key)
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get_or_create(
+        self,
+        keys: Iterable[Hashable],
+        create: Callable[[Hashable], Any],
+        validate: Callable[[Any], bool],
+    ) -> list[Any]:
+        """Return the cached instances of the keys, or create new ones if missing or invalid.
+
+        The validation and the creation are done outside the locks. If another thread creates an
+        instance for the same key concurrently, the one stored first is returned.
+        """
+        keys = list(keys)
+        groups = collections.defaultdict(list)
+        for i, key in enumerate(keys):
+            groups[self._shard(key)].append(i)
+
+        instances = [None] * len(keys)
+        for shard, indices in groups.items():
+            with shard.lock:
+                shard.purge()
+                for i in indices:
+                    ref = shard.entries.get(keys[i])
+                    if ref is not None:
+                        instances[i] = ref()
+
+        stale = {}
+        for i, key in enumerate(keys):
+            instance = instances[i]
+            if instance is None or not validate(instance):
+                stale[i] = instance
+                instances[i] = create(key)
+
+        for shard, indices in groups.items():
+            with shard.lock:
+                shard.purge()
+                for i in indices:
+                    key = keys[i]
+                    if i not in stale:
+                        shard.hits += 1
+                        if key in shard.entries:
+                            shard.entries.move_to_end(key)
+                        continue
+
+                    shard.misses += 1
+                    ref = shard.entries.get(key)
+                    current = ref() if ref is not None else None
+                    if current is not None and current is not stale[i]:
+                        instances[i] = current  # created by another thread
+                        shard.entries.move_to_end(key)
+                    else:
+                        shard.entries[key] = shard.make_ref(key, instances[i])
+                        shard.entries.move_to_end(key)
+                shard.evict(self._shard_maxsize)
+
+        return instances
+
+    def cache_info(self) -> InstanceCacheInfo:
+        """Return the statistics of the cache."""
+        hits = misses = evictions = currsize = 0
+        for shard in self._shards:
+            with shard.lock:
+                shard.purge()
+                hits += shard.hits
+                misses += shard.misses
+                evictions += shard.evictions
+                currsize += len(shard.entries)
+        return InstanceCacheInfo(hits, misses, evictions, self.maxsize, currsize)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.pending_removals.clear()
+                shard.hits = shard.misses = shard.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached instance of the key, or the default value if missing."""
+        shard = self._shard(key)
+        with shard.lock:
+            shard.purge()
+            ref = shard.entries.get(key)
+        instance = ref() if ref is not None else None
+        return instance if instance is not None else default
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove the key and return the cached instance, or the default value if missing."""
+        shard = self._shard(key)
+        with shard.lock:
+            shard.purge()
+            ref = shard.entries.pop(key, None)
+        instance = ref() if ref is not None else None
+        return instance if instance is not None else default
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """Return the cached instance of the key."""
+        instance = self.get(key)
+        if instance is None:
+            raise KeyError(key)
+        return instance
+
+    def __setitem__(self, key: Hashable, instance: Any) -> None:
+        """Store the instance of the key."""
+        shard = self._shard(key)
+        with shard.lock:
+            shard.purge()
+            shard.entries[key] = shard.make_ref(key, instance)
+            shard.entries.move_to_end(key)
+            shard.evict(self._shard_maxsize)
+
+    def __delitem__(self, key: Hashable) -> None:
+        """Remove the key."""
+        if self.pop(key) is None:
+            raise KeyError(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Test whether the key has a live instance."""
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        """Return the number of the cached instances."""
+        return self.cache_info().currsize
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the keys of the live instances."""
+        return iter([key for key, _ in self.items()])
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """Return the keys and the live instances."""
+        items = []
+        for shard in self._shards:
+            with shard.lock:
+                shard.purge()
+                refs = list(shard.entries.items())
+            items.extend((key, ref()) for key, ref in refs)
+        return [(key, instance) for key, instance in items if instance is not None]
+
+    def values(self) -> list[Any]:
+        """Return the live instances."""
+        return [instance for _, instance in self.items()]
+
+
 class HostProcess(host.Process, metaclass=ABCMeta):
     """Represent an OS process with the given PID.
 
     If PID is omitted current process PID (:func:`os.getpid`) is used. The instance will be cache
-    during the lifetime of the process.
+    during the lifetime of the process. The statistics of the instance cache are available via
+    ``HostProcess.INSTANCES.cache_info()``.
 
     Examples:
         >>> HostProcess()  # the current process
@@ -181,35 +404,34 @@ class HostProcess(host.Process, metaclass=ABCMeta):
         )
     """
 
+    INSTANCES = _InstanceCache()
+    # Deprecated: the instance cache is locked internally by shards, this lock is no longer used
     INSTANCE_LOCK = threading.RLock()
-    INSTANCES = WeakValueDictionary()
 
     def __new__(cls, pid: int | None = None) -> HostProcess:
         """Return the cached instance of :class:`HostProcess`."""
         if pid is None:
             pid = os.getpid()
 
-        with cls.INSTANCE_LOCK:
-            try:
-                instance = cls.INSTANCES[pid]
-                if instance.is_running():
-                    return instance
-            except KeyError:
-                pass
-
-            instance = super().__new__(cls)
+        return cls.INSTANCES.get_or_create(
+            [pid],
+            create=cls._new_instance,
+            validate=lambda instance: instance.is_running(),
+        )[0]
 
-            instance._super_gone = False
-            instance._username = None
-            host.Process._init(instance, pid, True)
-            try:
-                host.Process.cpu_percent(instance)
-            except host.PsutilError:
-                pass
+    @classmethod
+    def _new_instance(cls, pid: int) -> HostProcess:
+        instance = super().__new__(cls)
 
-            cls.INSTANCES[pid] = instance
+        instance._super_gone = False
+        instance._username = None
+        host.Process._init(instance, pid, True)
+        try:
+            host.Process.cpu_percent(instance)
+        except host.PsutilError:
+            pass
 
-            return instance
+        return instance
 
     # pylint: disable-next=unused-argument,super-init-not-called
     def __init__(self, pid: int | None = None) -> None:
@@ -222,11 +444,7 @@ class HostProcess(host.Process, metaclass=ABCMeta):
     @_gone.setter
     def _gone(self, value: bool) -> None:
         if value:
-            with self.INSTANCE_LOCK:
-                try:
-                    del self.INSTANCES[self.pid]
-                except KeyError:
-                    pass
+            self.INSTANCES.pop(self.pid, None)
         self._super_gone = value
 
     def __repr__(self) -> str:
@@ -261,7 +479,7 @@ class HostProcess(host.Process, metaclass=ABCMeta):
         def username(self) -> str:
             """The name of the user that owns the process.
 
-            On UNIX this is calculated by using *real* process uid.
+            On UNIX this is calculated by using *real* process uid. The user names are cached by uid.
 
             Raises:
                 host.NoSuchProcess:
@@ -271,7 +489,7 @@ class HostProcess(host.Process, metaclass=ABCMeta):
             """
             if self._username is None:  # pylint: disable=access-member-before-definition
                 self._username = (  # pylint: disable=attribute-defined-outside-init
-                    super().username()
+                    _username_of_uid(self.uids().real)
                 )
             return self._username
 
@@ -279,15 +497,27 @@ class HostProcess(host.Process, metaclass=ABCMeta):
     def cmdline(self) -> list[str]:
         """The command line this process has been called with.
 
+        The non-empty command lines are cached by the process identity (PID and creation time) and
+        reused while the process name is unchanged. See also :func:`cmdline_cache_clear`.
+
         Raises:
             host.NoSuchProcess:
                 If the process is gone.
             host.AccessDenied:
                 If the user do not have read privilege to the process' status file.
         """
+        key = (self.pid, self.create_time())
+        # Use the untruncated name from the platform implementation, `psutil.Process.name()` calls
+        # `cmdline()` to extend the truncated names
+        name = self._proc.name()
+        cached = _get_cached_cmdline(key)
+        if cached is not None and cached[0] == name:
+            return list(cached[1])
+
         cmdline = super().cmdline()
         if len(cmdline) > 1:
             cmdline = '\0'.join(cmdline).rstrip('\0').split('\0')
+        _cache_cmdline(key, name, cmdline)
         return cmdline
 
     def command(self) -> str:
@@ -299,7 +529,7 @@ class HostProcess(host.Process, metaclass=ABCMeta):
             host.AccessDenied:
                 If the user do not have read privilege to the process' status file.
         """
-        return command_join(self.cmdline())
+        return _cached_command(self, self.cmdline())
 
     @memoize_when_activated
     def running_time(self) -> datetime.timedelta:
@@ -439,10 +669,23 @@ class GpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
 
     The same host process can use multiple GPU devices. The :class:`GpuProcess` instances
     representing the same PID on the host but different GPU devices are different.
+
+    The instances of the same device are stored in the same shard of the instance cache, so the
+    processes of a device can be looked up in bulk with one lock acquisition by :meth:`from_nvml`.
+    The statistics of the instance cache are available via ``GpuProcess.INSTANCES.cache_info()``.
+    Each subclass has its own instance cache, so the cached instances are always of the requested
+    class.
     """
 
+    INSTANCES = _InstanceCache(shard_key=lambda key: key[1])  # sharded by the device
+    # Deprecated: the instance cache is locked internally by shards, this lock is no longer used
     INSTANCE_LOCK = threading.RLock()
-    INSTANCES = WeakValueDictionary()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Create a separate instance cache for the subclass if it does not define one."""
+        super().__init_subclass__(**kwargs)
+        if 'INSTANCES' not in cls.__dict__:
+            cls.INSTANCES = _InstanceCache(shard_key=lambda key: key[1])
 
     # pylint: disable-next=too-many-arguments
     def __new__(
@@ -460,27 +703,82 @@ class GpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
         if pid is None:
             pid = os.getpid()
 
-        with cls.INSTANCE_LOCK:
-            try:
-                instance = cls.INSTANCES[(pid, device)]
-                if instance.is_running():
-                    return instance
-            except KeyError:
-                pass
+        return cls.INSTANCES.get_or_create(
+            [(pid, device)],
+            create=cls._new_instance,
+            validate=lambda instance: instance.is_running(),
+        )[0]
 
-            instance = super().__new__(cls)
+    @classmethod
+    def _new_instance(cls, key: tuple[int, Device]) -> GpuProcess:
+        pid, device = key
+        instance = super().__new__(cls)
 
-            instance._pid = pid
-            instance._host = HostProcess(pid)
-            instance._ident = (*instance._host._ident, device.index)
-            instance._device = device
+        instance._pid = pid
+        instance._host = HostProcess(pid)
+        instance._ident = (*instance._host._ident, device.index)
+        instance._device = device
 
-            instance._hash = None
-            instance._username = None
+        instance._hash = None
+        instance._username = None
 
-            cls.INSTANCES[(pid, device)] = instance
+        return instance
 
-            return instance
+    @classmethod
+    def from_nvml(
+        cls,
+        device: Device,
+        infos: Iterable[Any],
+        type: str | NaType | None = None,  # pylint: disable=redefined-builtin
+    ) -> dict[int, GpuProcess]:
+        """Return the GPU process instances of the process information structures from NVML.
+
+        This is the bulk version of the constructor. The cached instances are looked up and refreshed
+        with the shard lock of the device acquired only once, instead of once per process. The
+        instances are initialized by :meth:`__init__` as ``cls(pid, device, ...)`` does. For the
+        subclasses overriding :meth:`__new__`, the instances are constructed by ``cls(...)`` one by
+        one instead.
+
+        Args:
+            device (Device):
+                The device the processes are running on.
+            infos (Iterable[c_nvmlProcessInfo_t]):
+                The process information structures returned by NVML functions (e.g.,
+                :func:`nvmlDeviceGetComputeRunningProcesses`).
+            type (Optional[str]):
+                The type of the GPU context (``'C'`` or ``'G'``) to be merged to the existing type.
+
+        Returns: Dict[int, GpuProcess]
+            A dictionary mapping PID to GPU process instance.
+        """
+        infos = list(infos)
+        if cls.__new__ is GpuProcess.__new__:
+            instances = cls.INSTANCES.get_or_create(
+                [(info.pid, device) for info in infos],
+                create=cls._new_instance,
+                validate=lambda instance: instance.is_running(),
+            )
+        else:
+            instances = [None] * len(infos)
+
+        processes = {}
+        for info, instance in zip(infos, instances):
+            # Used GPU memory is `N/A` on Windows Display Driver Model (WDDM) or on MIG-enabled GPUs
+            gpu_memory = info.usedGpuMemory if isinstance(info.usedGpuMemory, int) else NA
+            kwargs = {
+                'gpu_memory': gpu_memory,
+                'gpu_instance_id': getattr(info, 'gpuInstanceId', 0xFFFFFFFF),
+                'compute_instance_id': getattr(info, 'computeInstanceId', 0xFFFFFFFF),
+            }
+            if instance is None:
+                instance = cls(info.pid, device, **kwargs)
+            else:
+                # The same as `cls(pid, device, ...)` with the instance returned by `__new__()`
+                instance.__init__(info.pid, device, **kwargs)
+            if type is not None:
+                instance.type = instance.type + type
+            processes[info.pid] = instance
+        return processes
 
     # pylint: disable-next=too-many-arguments
     def __init__(
@@ -541,6 +839,10 @@ class GpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
             self._hash = hash(self._ident)  # pylint: disable=attribute-defined-outside-init
         return self._hash
 
+    def __reduce__(self) -> tuple[type[GpuProcess], tuple[int, Device]]:
+        """Return state information for pickling."""
+        return self.__class__, (self.pid, self.device)
+
     def __getattr__(self, name: str) -> Any | Callable[..., Any]:
         """Get a member from the instance or fallback to the host process instance if missing.
 
@@ -650,9 +952,14 @@ class GpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
 
     def update_gpu_status(self) -> int | NaType:
         """Update the GPU consumption status from a new NVML query."""
+        # pylint: disable-next=import-outside-toplevel
+        from nvitop.api.device import _get_process_sampler
+
         self.set_gpu_memory(NA)
         self.set_gpu_utilization(NA, NA, NA, NA)
-        self.device.processes.cache_clear()
+        # The process samples are shared by all device instances of the same GPU
+        _get_process_sampler(self.device).cache_clear()
+        self.device.processes.cache_clear(self.device)
         self.device.processes()
         return self.gpu_memory()
 
@@ -903,44 +1210,80 @@ class GpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
             To return the fallback value rather than raise an exception, please use the context
             manager :meth:`GpuProcess.failsafe`. See also :meth:`take_snapshots` and :meth:`failsafe`.
         """
-        return command_join(self.cmdline())
+        return _cached_command(self.host, self.cmdline())
 
     @auto_garbage_clean(fallback=_RAISE)
     def host_snapshot(self) -> Snapshot:
         """Return a onetime snapshot of the host process."""
         with self.host.oneshot():
-            return Snapshot(
-                real=self.host,
-                is_running=self.is_running(),
-                status=self.status(),
-                username=self.username(),
-                name=self.name(),
-                cmdline=self.cmdline(),
-                command=self.command(),
-                cpu_percent=self.cpu_percent(),
-                memory_percent=self.memory_percent(),
-                host_memory=self.host_memory(),
-                host_memory_human=self.host_memory_human(),
-                running_time=self.running_time(),
-                running_time_human=self.running_time_human(),
-                running_time_in_seconds=self.running_time_in_seconds(),
+            return self._finish_host_snapshot(
+                Snapshot(
+                    real=self.host,
+                    is_running=self.is_running(),
+                    status=self.status(),
+                    username=self.username(),
+                    name=self.name(),
+                    cmdline=self.cmdline(),
+                    command=self.command(),
+                    cpu_percent=self.cpu_percent(),
+                    memory_percent=self.memory_percent(),
+                    host_memory=self.host_memory(),
+                    host_memory_human=self.host_memory_human(),
+                    running_time=self.running_time(),
+                    running_time_human=self.running_time_human(),
+                    running_time_in_seconds=self.running_time_in_seconds(),
+                ),
             )
 
+    def _finish_host_snapshot(self, host_snapshot: Snapshot) -> Snapshot:
+        """Add the extra attributes to a host process snapshot.
+
+        This is called for the snapshots returned by :meth:`host_snapshot` and the ones taken in
+        batch by :meth:`take_snapshots`. Subclasses should override this method rather than
+        :meth:`host_snapshot` to add attributes to all host process snapshots.
+        """
+        return host_snapshot
+
     @auto_garbage_clean(fallback=_RAISE)
     def as_snapshot(
         self,
         *,
         host_process_snapshot_cache: dict[int, Snapshot] | None = None,
+        lazy: bool = False,
     ) -> Snapshot:
         """Return a onetime snapshot of the process on the GPU device.
 
+        If *lazy* is :data:`True`, return a :class:`LazySnapshot` that fetches the host process
+        information (e.g., ``cmdline``, ``cpu_percent``) on first access. The fallback behavior of
+        :meth:`GpuProcess.failsafe` at creation is kept for the lazy accesses.
+
         Note:
             To return the fallback value rather than raise an exception, please use the context
             manager :meth:`GpuProcess.failsafe`. Also, consider using the batched version to take
             snapshots with :meth:`GpuProcess.take_snapshots`, which caches the results and reduces
             redundant queries. See also :meth:`take_snapshots` and :meth:`failsafe`.
         """
-        host_process_snapshot_cache = host_process_snapshot_cache or {}
+        if lazy:
+            return LazySnapshot(
+                real=self,
+                keys={'host': 'host_snapshot', **{key: key for key in self.HOST_SNAPSHOT_KEYS}},
+                window=self._lazy_snapshot_window(),
+                pid=self.pid,
+                device=self.device,
+                type=self.type,
+                gpu_instance_id=self.gpu_instance_id(),
+                compute_instance_id=self.compute_instance_id(),
+                gpu_memory=self.gpu_memory(),
+                gpu_memory_human=self.gpu_memory_human(),
+                gpu_memory_percent=self.gpu_memory_percent(),
+                gpu_sm_utilization=self.gpu_sm_utilization(),
+                gpu_memory_utilization=self.gpu_memory_utilization(),
+                gpu_encoder_utilization=self.gpu_encoder_utilization(),
+                gpu_decoder_utilization=self.gpu_decoder_utilization(),
+            )
+
+        if host_process_snapshot_cache is None:
+            host_process_snapshot_cache = {}
         try:
             host_snapshot = host_process_snapshot_cache[self.pid]
         except KeyError:
@@ -978,23 +1321,97 @@ class GpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
             gpu_decoder_utilization=self.gpu_decoder_utilization(),
         )
 
+    HOST_SNAPSHOT_KEYS = [
+        'is_running',
+        'status',
+        'username',
+        'name',
+        'cmdline',
+        'command',
+        'cpu_percent',
+        'memory_percent',
+        'host_memory',
+        'host_memory_human',
+        'running_time',
+        'running_time_human',
+        'running_time_in_seconds',
+    ]
+
+    def _lazy_snapshot_window(self) -> Callable[[], contextlib.AbstractContextManager]:
+        use_fallback = getattr(_USE_FALLBACK_WHEN_RAISE, 'value', False)
+
+        @contextlib.contextmanager
+        def window() -> contextlib.AbstractContextManager:
+            with contextlib.ExitStack() as stack:
+                if use_fallback:
+                    stack.enter_context(self.failsafe())
+                stack.enter_context(self.oneshot())
+                yield
+
+        return window
+
     @classmethod
     def take_snapshots(  # batched version of `as_snapshot`
         cls,
         gpu_processes: Iterable[GpuProcess],
         *,
         failsafe: bool = False,
+        lazy: bool = False,
+        timeout: float | None = None,
+        max_workers: int | None = None,
     ) -> list[Snapshot]:
         """Take snapshots for a list of :class:`GpuProcess` instances.
 
         If *failsafe* is :data:`True`, then if any method fails, the fallback value in
-        :func:`auto_garbage_clean` will be used.
+        :func:`auto_garbage_clean` will be used. If *lazy* is :data:`True`, the host process
+        information will be fetched on first access. See also :meth:`as_snapshot`.
+
+        On Linux, the host process information of all processes is read from ``/proc`` in one pass
+        (see :mod:`nvitop.api.procfs`). The processes that cannot be read in batch, or whose classes
+        override :meth:`host_snapshot`, fall back to :meth:`host_snapshot`.
+
+        If *timeout* is given, the host process snapshots are taken concurrently in a shared thread
+        pool instead, and the call returns within the given latency budget. Reading the files in
+        ``/proc/<pid>`` (e.g., ``cmdline``) may block in the kernel for processes under memory
+        pressure. The processes that do not finish in time use their last host process snapshots if
+        available, otherwise the fallback values in :func:`auto_garbage_clean`, regardless of
+        *failsafe*. A process that is still blocked from a previous call is not submitted again.
+
+        Args:
+            gpu_processes (Iterable[GpuProcess]):
+                The GPU processes to take snapshots.
+            failsafe (bool):
+                Whether to use the fallback values for the methods that fail.
+            lazy (bool):
+                Whether to fetch the host process information on first access. Arguments *timeout*
+                and *max_workers* are ignored.
+            timeout (Optional[float]):
+                The latency budget in seconds for the host process snapshots of all processes.
+            max_workers (Optional[int]):
+                The maximum number of processes snapshotted concurrently by this call when *timeout*
+                is given. The threads are taken from a shared pool with at most
+                :const:`HOST_SNAPSHOT_MAX_WORKERS` threads. If not given, use the pool size.
         """
         cache = {}
+        if not lazy:
+            gpu_processes = list(gpu_processes)
+            if timeout is not None:
+                cache.update(
+                    _take_host_snapshots_with_timeout(
+                        gpu_processes,
+                        timeout=timeout,
+                        failsafe=failsafe,
+                        max_workers=max_workers,
+                    ),
+                )
+            elif procfs.is_supported():
+                cache.update(_take_host_snapshots_from_procfs(gpu_processes))
+
         context = cls.failsafe if failsafe else contextlib.nullcontext
         with context():
             return [
-                process.as_snapshot(host_process_snapshot_cache=cache) for process in gpu_processes
+                process.as_snapshot(host_process_snapshot_cache=cache, lazy=lazy)
+                for process in gpu_processes
             ]
 
     @classmethod
@@ -1028,3 +1445,306 @@ class GpuProcess:  # pylint: disable=too-many-instance-attributes,too-many-publi
             yield
         finally:
             _USE_FALLBACK_WHEN_RAISE.value = prev_value
+
+
+class _CpuTimes(NamedTuple):  # the same fields used by `psutil.Process.cpu_percent`
+    user: float
+    system: float
+
+
+@functools.lru_cache(maxsize=1024)
+def _username_of_uid(uid: int) -> str:
+    import pwd  # pylint: disable=import-outside-toplevel
+
+    # The same as `psutil.Process.username()` on UNIX
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+CMDLINE_CACHE_SIZE = 4096
+"""The maximum number of processes to cache the command lines."""
+
+# Map the process identities `(pid, create_time)` to `(name, tuple(cmdline), command)`. The process
+# name from `/proc/<pid>/stat` changes on `exec()`, which keeps the PID and the creation time.
+_CMDLINE_CACHE = LRUCache(maxsize=CMDLINE_CACHE_SIZE)
+_CMDLINE_CACHE_LOCK = threading.Lock()
+
+
+def cmdline_cache_clear() -> None:
+    """Clear the caches of the process command lines and the user names.
+
+    The caches are keyed by the process identity (PID and creation time) and the uid, respectively.
+    The cached command line is dropped if the process name changes (e.g., on ``exec()``). Clear them
+    if a process changes its command line only (e.g., via ``setproctitle``) or the user database is
+    updated.
+    """
+    with _CMDLINE_CACHE_LOCK:
+        _CMDLINE_CACHE.clear()
+    _username_of_uid.cache_clear()
+
+
+def _get_cached_cmdline(key: tuple[int, float]) -> tuple[str, tuple[str, ...], str] | None:
+    with _CMDLINE_CACHE_LOCK:
+        return _CMDLINE_CACHE.get(key)
+
+
+def _cache_cmdline(key: tuple[int, float], name: str, cmdline: list[str]) -> str:
+    command = command_join(cmdline)
+    # Do not cache the empty command lines of the zombie processes and the kernel threads
+    if len(cmdline) > 0:
+        with _CMDLINE_CACHE_LOCK:
+            _CMDLINE_CACHE[key] = (name, tuple(cmdline), command)
+    return command
+
+
+def _cached_command(process: HostProcess, cmdline: list[str]) -> str:
+    try:
+        cached = _get_cached_cmdline((process.pid, process.create_time()))
+    except host.PsutilError:
+        cached = None
+    if cached is not None and list(cached[1]) == cmdline:
+        return cached[2]
+    return command_join(cmdline)
+
+
+# pylint: disable-next=too-many-locals
+def _take_host_snapshots_from_procfs(gpu_processes: list[GpuProcess]) -> dict[int, Snapshot]:
+    """Take the host process snapshots of the GPU processes with one pass over ``/proc``.
+
+    The snapshots have the same attributes as :meth:`GpuProcess.host_snapshot`. The processes that
+    are gone, not accessible or have their PIDs reused are omitted. The command lines of the
+    processes seen before are not read again.
+    """
+    host_processes = {}
+    create_times = {}
+    cached_cmdlines = {}
+    for process in gpu_processes:
+        if process.pid in host_processes:
+            continue
+        if type(process).host_snapshot is not GpuProcess.host_snapshot:
+            continue  # the subclass snapshot is not reproducible here
+        host_processes[process.pid] = process
+        try:
+            create_times[process.pid] = create_time = process.host.create_time()
+        except host.PsutilError:
+            continue
+        cached = _get_cached_cmdline((process.pid, create_time))
+        if cached is not None:
+            cached_cmdlines[process.pid] = cached
+    infos = procfs.read_processes(
+        create_times,
+        skip_cmdline={pid: cached[0] for pid, cached in cached_cmdlines.items()},
+    )
+
+    total_memory = host.virtual_memory().total
+    num_cpus = host.cpu_count() or 1
+    snapshots = {}
+    for pid, info in infos.items():
+        process = host_processes[pid]
+        host_process = process.host
+        create_time = create_times[pid]
+        if abs(info.create_time - create_time) > 0.01:  # the PID is reused
+            continue
+
+        # Update the states of `psutil.Process.cpu_percent` with the same formula
+        # pylint: disable=protected-access
+        timestamp = time.monotonic() * num_cpus
+        cpu_times = _CpuTimes(user=info.cpu_user, system=info.cpu_system)
+        last_timestamp = host_process._last_sys_cpu_times
+        last_cpu_times = host_process._last_proc_cpu_times
+        host_process._last_sys_cpu_times = timestamp
+        host_process._last_proc_cpu_times = cpu_times
+        if last_timestamp is None or last_cpu_times is None or timestamp <= last_timestamp:
+            cpu_percent = 0.0
+        else:
+            delta_cpu_times = (cpu_times.user - last_cpu_times.user) + (
+                cpu_times.system - last_cpu_times.system
+            )
+            cpu_percent = round(delta_cpu_times / (timestamp - last_timestamp) * 100 * num_cpus, 1)
+
+        if process._username is None:
+            process._username = _username_of_uid(info.uid)
+        # pylint: enable=protected-access
+
+        if info.cmdline is None:
+            _, cmdline, command = cached_cmdlines[pid]
+            cmdline = list(cmdline)
+        else:
+            cmdline = info.cmdline
+            if len(cmdline) > 1:
+                cmdline = '\0'.join(cmdline).rstrip('\0').split('\0')
+            command = _cache_cmdline((pid, create_time), info.name, cmdline)
+        name = info.name
+        if len(name) >= 15 and len(cmdline) > 0:  # the name is truncated by the kernel
+            extended_name = os.path.basename(cmdline[0])
+            if extended_name.startswith(name):
+                name = extended_name
+        if len(cmdline) == 0:
+            cmdline = ['Zombie Process']
+            command = command_join(cmdline)
+
+        running_time = datetime.datetime.now() - datetime.datetime.fromtimestamp(create_time)
+        snapshots[pid] = process._finish_host_snapshot(  # pylint: disable=protected-access
+            Snapshot(
+                real=host_process,
+                is_running=True,
+                status=info.status,
+                username=process.username(),
+                name=name,
+                cmdline=cmdline,
+                command=command,
+                cpu_percent=cpu_percent,
+                memory_percent=info.rss / total_memory * 100.0,
+                host_memory=info.rss,
+                host_memory_human=bytes2human(info.rss),
+                running_time=running_time,
+                running_time_human=timedelta2human(running_time),
+                running_time_in_seconds=running_time.total_seconds(),
+            ),
+        )
+
+    return snapshots
+
+
+HOST_SNAPSHOT_MAX_WORKERS = 16
+"""The maximum number of worker threads of the shared pool for :meth:`GpuProcess.take_snapshots`."""
+
+_HOST_SNAPSHOT_EXECUTOR = None
+_HOST_SNAPSHOT_LOCK = threading.Lock()
+# The pending snapshots keyed by the process identities `(pid, create_time)`. A process blocked in
+# the kernel keeps its worker thread busy, so do not submit it again until the snapshot is done.
+_HOST_SNAPSHOT_FUTURES: dict[tuple[int, float | None], concurrent.futures.Future] = {}
+# The last host process snapshots to use for the processes that do not finish in time
+_LAST_HOST_SNAPSHOTS = LRUCache(maxsize=1024)
+
+
+def _get_host_snapshot_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _HOST_SNAPSHOT_EXECUTOR  # pylint: disable=global-statement
+
+    with _HOST_SNAPSHOT_LOCK:
+        if _HOST_SNAPSHOT_EXECUTOR is None:
+            _HOST_SNAPSHOT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=HOST_SNAPSHOT_MAX_WORKERS,
+                thread_name_prefix='host-snapshot',
+            )
+            atexit.register(_HOST_SNAPSHOT_EXECUTOR.shutdown, wait=False)
+        return _HOST_SNAPSHOT_EXECUTOR
+
+
+def _host_snapshot_done(key: tuple[int, float | None], future: concurrent.futures.Future) -> None:
+    with _HOST_SNAPSHOT_LOCK:
+        if _HOST_SNAPSHOT_FUTURES.get(key) is future:
+            del _HOST_SNAPSHOT_FUTURES[key]
+        if not future.cancelled() and future.exception() is None:
+            _LAST_HOST_SNAPSHOTS[key] = future.result()
+
+
+def _fallback_host_snapshot(process: GpuProcess) -> Snapshot:
+    """Return a host process snapshot with the fallback values in :func:`auto_garbage_clean`."""
+
+    def fallback(method: Callable[..., Any]) -> Any:
+        value = method.fallback
+        return list(value) if isinstance(value, tuple) else value
+
+    cmdline = fallback(GpuProcess.cmdline)
+    return process._finish_host_snapshot(  # pylint: disable=protected-access
+        Snapshot(
+            real=process.host,
+            is_running=False,
+            status=fallback(GpuProcess.status),
+            username=process._username or fallback(GpuProcess.username),  # pylint: disable=protected-access
+            name=fallback(GpuProcess.name),
+            cmdline=cmdline,
+            command=command_join(cmdline),
+            cpu_percent=fallback(GpuProcess.cpu_percent),
+            memory_percent=fallback(GpuProcess.memory_percent),
+            host_memory=fallback(GpuProcess.host_memory),
+            host_memory_human=bytes2human(fallback(GpuProcess.host_memory)),
+            running_time=fallback(GpuProcess.running_time),
+            running_time_human=timedelta2human(fallback(GpuProcess.running_time)),
+            running_time_in_seconds=NA,
+        ),
+    )
+
+
+def _take_host_snapshots_with_timeout(
+    gpu_processes: list[GpuProcess],
+    *,
+    timeout: float,
+    failsafe: bool = False,
+    max_workers: int | None = None,
+) -> dict[int, Snapshot]:
+    """Take the host process snapshots of the GPU processes concurrently within the timeout.
+
+    At most *max_workers* processes are submitted at the same time. The processes that are not done
+    before the deadline of the call, or are still blocked since a previous call, use their last
+    snapshots or the fallback values in :func:`auto_garbage_clean`. The pending submissions of this
+    call are cancelled at the deadline.
+    """
+    processes = {}
+    for process in gpu_processes:
+        processes.setdefault(process.pid, process)
+    if len(processes) == 0:
+        return {}
+
+    executor = _get_host_snapshot_executor()
+    max_workers = max(1, min(max_workers or HOST_SNAPSHOT_MAX_WORKERS, HOST_SNAPSHOT_MAX_WORKERS))
+
+    def host_snapshot(process: GpuProcess) -> Snapshot:
+        # The failsafe mode is thread-local, enable it in the worker thread
+        with GpuProcess.failsafe() if failsafe else contextlib.nullcontext():
+            return process.host_snapshot()
+
+    def timed_out(pid: int, key: tuple[int, float | None]) -> Snapshot:
+        with _HOST_SNAPSHOT_LOCK:
+            snapshot = _LAST_HOST_SNAPSHOTS.get(key)
+        return snapshot if snapshot is not None else _fallback_host_snapshot(processes[pid])
+
+    snapshots = {}
+    pending = collections.deque()
+    for pid, process in processes.items():
+        key = process.host._ident  # pylint: disable=protected-access
+        with _HOST_SNAPSHOT_LOCK:
+            blocked = key in _HOST_SNAPSHOT_FUTURES
+        if blocked:
+            snapshots[pid] = timed_out(pid, key)
+        else:
+            pending.append((pid, key))
+
+    deadline = time.monotonic() + timeout
+    running = {}  # future -> (pid, key)
+    while pending or running:
+        while pending and len(running) < max_workers:
+            pid, key = pending.popleft()
+            with _HOST_SNAPSHOT_LOCK:
+                future = _HOST_SNAPSHOT_FUTURES[key] = executor.submit(
+                    host_snapshot,
+                    processes[pid],
+                )
+            future.add_done_callback(functools.partial(_host_snapshot_done, key))
+            running[future] = (pid, key)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0.0:
+            break
+        done, _ = concurrent.futures.wait(
+            running,
+            timeout=remaining,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in done:
+            pid, _ = running.pop(future)
+            snapshots[pid] = future.result()  # re-raise the exception if not failsafe
+
+    for future, (pid, key) in running.items():
+        if future.done():
+            snapshots[pid] = future.result()
+        else:
+            future.cancel()  # no effect if the worker thread is blocked in it
+            snapshots[pid] = timed_out(pid, key)
+    for pid, key in pending:
+        snapshots[pid] = timed_out(pid, key)
+
+    return snapshots
@@ -0,0 +1,210 @@
+# This file is part of nvitop, the interactive NVIDIA-GPU process viewer.
+#
+# Copyright 2021-2023 Xuehai Pan. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Bulk reader of the ``/proc`` file system for the host information of many processes (Linux only).
+
+:mod:`psutil` reads the files in ``/proc/<pid>`` one attribute at a time, which is slow when
+monitoring hundreds of processes (e.g., data loader workers) on each tick. :func:`read_processes`
+reads ``stat``, ``statm``, ``status`` and ``cmdline`` of a set of processes in one pass. The files
+are opened relative to the ``/proc/<pid>`` directory file descriptor, so all files of a process are
+read from the same process even if the PID is reused during the read, and the read buffer is reused
+across files and processes.
+
+Examples:
+    >>> from nvitop.api import procfs
+    >>> procfs.is_supported()
+    True
+    >>> procfs.read_processes([1, 12345])
+    {
+        1: ProcessInfo(pid=1, name='systemd', status='sleeping', ppid=0, uid=0, ...),
+        12345: ProcessInfo(pid=12345, name='python3', status='running', ppid=12340, uid=1000, ...),
+    }
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Iterable, Mapping, NamedTuple
+
+from nvitop.api import host
+
+
+__all__ = ['ProcessInfo', 'is_supported', 'read_processes']
+
+
+PROC_ROOT = '/proc'
+INITIAL_BUFFER_SIZE = 4096
+
+if host.LINUX:
+    CLOCK_TICKS = os.sysconf('SC_CLK_TCK')
+    PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+else:
+    CLOCK_TICKS = PAGE_SIZE = None
+
+PROC_STATUSES = {
+    b'R': host.STATUS_RUNNING,
+    b'S': host.STATUS_SLEEPING,
+    b'D': host.STATUS_DISK_SLEEP,
+    b'T': host.STATUS_STOPPED,
+    b't': host.STATUS_TRACING_STOP,
+    b'Z': host.STATUS_ZOMBIE,
+    b'X': host.STATUS_DEAD,
+    b'x': host.STATUS_DEAD,
+    b'K': getattr(host, 'STATUS_WAKE_KILL', 'wake-kill'),  # removed in psutil 7.0
+    b'W': host.STATUS_WAKING,
+    b'I': host.STATUS_IDLE,
+    b'P': host.STATUS_PARKED,
+}
+
+_LOCAL = threading.local()
+
+
+class ProcessInfo(NamedTuple):  # pylint: disable=missing-class-docstring
+    pid: int
+    name: str  # the process name truncated by the kernel (up to 15 characters)
+    status: str
+    ppid: int
+    uid: int  # the real user ID
+    cmdline: list[str] | None  # None if skipped
+    cpu_user: float  # in seconds
+    cpu_system: float  # in seconds
+    create_time: float  # in seconds since the epoch
+    rss: int  # in bytes
+
+
+def is_supported() -> bool:
+    """Whether the bulk reader is supported on the current system."""
+    return host.LINUX and os.path.isdir(PROC_ROOT)
+
+
+def _get_buffer() -> bytearray:
+    try:
+        return _LOCAL.buffer
+    except AttributeError:
+        buffer = _LOCAL.buffer = bytearray(INITIAL_BUFFER_SIZE)
+        return buffer
+
+
+def _read_file(name: str, dir_fd: int) -> bytes:
+    buffer = _get_buffer()
+    fd = os.open(name, os.O_RDONLY | os.O_CLOEXEC, dir_fd=dir_fd)
+    try:
+        size = 0
+        while True:
+            with memoryview(buffer) as view:
+                n = os.readv(fd, [view[size:]])
+            if n == 0:
+                break
+            size += n
+            if size == len(buffer):  # the file is larger than the buffer
+                buffer.extend(bytes(len(buffer)))
+        return bytes(buffer[:size])
+    finally:
+        os.close(fd)
+
+
+def _parse_cmdline(data: bytes) -> list[str]:
+    # The same as `psutil.Process.cmdline()` on Linux
+    data = os.fsdecode(data)
+    if not data:
+        return []
+    sep = '\0' if data.endswith('\0') else ' '
+    if data.endswith(sep):
+        data = data[:-1]
+    cmdline = data.split(sep)
+    # Some processes may change their cmdline after being started (via `setproctitle(3)`) and use
+    # spaces instead of null bytes as the separator
+    if sep == '\0' and len(cmdline) == 1 and ' ' in data:
+        cmdline = data.split(' ')
+    return cmdline
+
+
+def _read_process(pid: int, boot_time: float, cached_name: str | None = None) -> ProcessInfo | None:
+    try:
+        dir_fd = os.open(
+            os.path.join(PROC_ROOT, str(pid)),
+            os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC,
+        )
+    except OSError:
+        return None
+
+    try:
+        stat = _read_file('stat', dir_fd)
+        # The process name may contain spaces and parentheses
+        lpar, rpar = stat.find(b'('), stat.rfind(b')')
+        name = os.fsdecode(stat[lpar + 1 : rpar])
+        statm = _read_file('statm', dir_fd)
+        status = _read_file('status', dir_fd)
+        # The process name changes on `exec()`, read the command line again
+        cmdline = _read_file('cmdline', dir_fd) if name != cached_name else None
+    except OSError:
+        return None
+    finally:
+        os.close(dir_fd)
+
+    try:
+        fields = stat[rpar + 2 :].split()
+        uid_start = status.index(b'\nUid:') + len(b'\nUid:')
+        return ProcessInfo(
+            pid=pid,
+            name=name,
+            status=PROC_STATUSES.get(fields[0], '?'),
+            ppid=int(fields[1]),
+            uid=int(status[uid_start : status.index(b'\n', uid_start)].split()[0]),
+            cmdline=_parse_cmdline(cmdline) if cmdline is not None else None,
+            cpu_user=int(fields[11]) / CLOCK_TICKS,
+            cpu_system=int(fields[12]) / CLOCK_TICKS,
+            create_time=int(fields[19]) / CLOCK_TICKS + boot_time,
+            rss=int(statm.split()[1]) * PAGE_SIZE,
+        )
+    except (IndexError, ValueError):  # the process is gone during the read
+        return None
+
+
+def read_processes(
+    pids: Iterable[int],
+    *,
+    skip_cmdline: Mapping[int, str] | None = None,
+) -> dict[int, ProcessInfo]:
+    """Read the host information of the given processes from ``/proc`` in one pass.
+
+    The processes that are gone or not accessible are omitted in the result.
+
+    Args:
+        pids (Iterable[int]):
+            The process IDs to read.
+        skip_cmdline (Optional[Mapping[int, str]]):
+            A mapping from the process IDs to the process names, to skip reading the command lines
+            of the processes whose names are unchanged (e.g., already cached by the caller). The
+            ``cmdline`` field of these processes is :data:`None`.
+
+    Returns: Dict[int, ProcessInfo]
+        A dictionary mapping the process IDs to the host information.
+    """
+    if not is_supported():
+        return {}
+
+    if skip_cmdline is None:
+        skip_cmdline = {}
+
+    boot_time = host.boot_time()
+    results = {}
+    for pid in dict.fromkeys(pids):
+        info = _read_process(pid, boot_time, cached_name=skip_cmdline.get(pid))
+        if info is not None:
+            results[pid] = info
+    return results
@@ -0,0 +1,341 @@
+# This file is part of nvitop, the interactive NVIDIA-GPU process viewer.
+#
+# Copyright 2021-2023 Xuehai Pan. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Compact columnar (struct-of-arrays) device status for fleet-scale aggregation.
+
+A :class:`DeviceTable` stores the dynamic metrics of many devices in one array per metric, instead
+of one :class:`Snapshot` object with dozens of attributes per device. The columns are NumPy arrays if
+NumPy is installed, otherwise :class:`array.array` objects. The missing values (:const:`nvitop.NA`)
+are stored as NaN.
+
+Examples:
+    >>> from nvitop import Device, DeviceTable
+
+    >>> table = DeviceTable.from_devices()  # all physical devices and MIG devices
+    >>> table = Device.take_snapshots(Device.all(), as_table=True)
+    >>> table
+    DeviceTable(devices=8, columns=('physical_index', 'mig_index', 'memory_used', ...))
+
+    >>> table['memory_free'] / (1 << 30)  # vectorized with NumPy
+    array([73.06, 79.15, 0.53, ...])
+    >>> table.mean('gpu_utilization')
+    42.5
+    >>> table.rank('memory_free')  # the indices of the devices with the most free memory first
+    [1, 0, 4, ...]
+    >>> table.select(table['memory_free'] > 40 << 30).devices
+    [PhysicalDevice(index=0, ...), PhysicalDevice(index=1, ...), ...]
+
+The numeric export functions convert any batch of snapshots to float arrays directly:
+
+    >>> from nvitop.api.table import nanmax, snapshots_to_arrays
+    >>> columns = snapshots_to_arrays(GpuProcess.take_snapshots(...), ['gpu_memory', 'cpu_percent'])
+    >>> nanmax(columns['gpu_memory'])
+    8589934592.0
+"""
+
+from __future__ import annotations
+
+import array
+import math
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
+
+from nvitop.api.device import Device
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:
+    from nvitop.api.device import MigDevice
+
+
+__all__ = [
+    'DeviceTable',
+    'to_float_array',
+    'snapshots_to_arrays',
+    'nansum',
+    'nanmean',
+    'nanmin',
+    'nanmax',
+    'nanargsort',
+]
+
+
+def to_float_array(values: Iterable[Any]) -> Any:
+    """Convert the values to a float array, with NaN for the non-numeric values (e.g., :const:`NA`).
+
+    Return a NumPy array if NumPy is installed, otherwise an :class:`array.array` object.
+    """
+    # Check the type instead of calling `float(value)` to skip the Python-level `NaType.__float__`
+    values = [value if isinstance(value, (int, float)) else math.nan for value in values]
+    if np is not None:
+        return np.asarray(values, dtype=np.float64)
+    return array.array('d', values)
+
+
+def snapshots_to_arrays(snapshots: Iterable[Any], keys: Iterable[str]) -> dict[str, Any]:
+    """Convert the attributes of a batch of snapshots to float arrays with NaN for :const:`NA`.
+
+    Args:
+        snapshots (Iterable[Snapshot]):
+            The snapshots of the devices or processes.
+        keys (Iterable[str]):
+            The attribute names to export.
+
+    Returns: Dict[str, Union[numpy.ndarray, array.array]]
+        A dictionary mapping the attribute names to the float arrays. See also
+        :func:`to_float_array`.
+    """
+    snapshots = list(snapshots)
+    return {
+        key: to_float_array([getattr(snapshot, key) for snapshot in snapshots]) for key in keys
+    }
+
+
+def _valid(values: Sequence[float]) -> list[float]:
+    return [value for value in values if not math.isnan(value)]
+
+
+def nansum(values: Sequence[float]) -> float:
+    """Return the sum of the float array, ignoring NaN. Return ``0.0`` if all values are NaN."""
+    if np is not None:
+        return float(np.nansum(values))
+    return math.fsum(_valid(values))
+
+
+def nanmean(values: Sequence[float]) -> float:
+    """Return the mean of the float array, ignoring NaN. Return NaN if all values are NaN."""
+    if np is not None:
+        values = np.asarray(values, dtype=np.float64)
+        valid = values[~np.isnan(values)]
+        return float(valid.mean()) if valid.size > 0 else math.nan
+    valid = _valid(values)
+    return math.fsum(valid) / len(valid) if len(valid) > 0 else math.nan
+
+
+def nanmin(values: Sequence[float]) -> float:
+    """Return the minimum of the float array, ignoring NaN. Return NaN if all values are NaN."""
+    if np is not None:
+        values = np.asarray(values, dtype=np.float64)
+        valid = values[~np.isnan(values)]
+        return float(valid.min()) if valid.size > 0 else math.nan
+    return min(_valid(values), default=math.nan)
+
+
+def nanmax(values: Sequence[float]) -> float:
+    """Return the maximum of the float array, ignoring NaN. Return NaN if all values are NaN."""
+    if np is not None:
+        values = np.asarray(values, dtype=np.float64)
+        valid = values[~np.isnan(values)]
+        return float(valid.max()) if valid.size > 0 else math.nan
+    return max(_valid(values), default=math.nan)
+
+
+def nanargsort(values: Sequence[float], descending: bool = False) -> list[int]:
+    """Return the indices that sort the float array. The stable sort is used, and NaN is placed last."""
+    if np is not None:
+        values = np.asarray(values, dtype=np.float64)
+        keys = -values if descending else values
+        keys = np.where(np.isnan(keys), np.inf, keys)
+        return np.argsort(keys, kind='stable').tolist()
+    sign = -1.0 if descending else 1.0
+    valid = [i for i, value in enumerate(values) if not math.isnan(value)]
+    missing = [i for i, value in enumerate(values) if math.isnan(value)]
+    return sorted(valid, key=lambda i: sign * values[i]) + missing
+
+
+class DeviceTable:
+    """A struct-of-arrays table holds the dynamic metrics of many devices.
+
+    The column values are NumPy arrays if NumPy is installed, otherwise :class:`array.array` objects.
+    The missing values are stored as NaN, and the MIG index of the physical devices is ``-1``.
+
+    Args:
+        devices (Sequence[Device]):
+            The devices of the rows.
+        columns (Dict[str, Sequence[Union[int, float]]]):
+            The column values of all devices, the keys should be :attr:`COLUMNS`.
+    """
+
+    COLUMNS = (
+        'physical_index',
+        'mig_index',
+        'memory_used',
+        'memory_free',
+        'memory_total',
+        'gpu_utilization',
+        'memory_utilization',
+        'temperature',
+        'power_usage',
+        'power_limit',
+        'sm_clock',
+        'memory_clock',
+    )
+    """The names of the columns. The indices are integers, others are floats (NaN for N/A)."""
+
+    _INTEGER_COLUMNS = ('physical_index', 'mig_index')
+
+    _SNAPSHOT_KEYS = (
+        'memory_used',
+        'memory_free',
+        'memory_total',
+        'gpu_utilization',
+        'memory_utilization',
+        'temperature',
+        'power_usage',
+        'power_limit',
+        'sm_clock',
+        'memory_clock',
+    )
+
+    def __init__(self, devices: Sequence[Device], columns: dict[str, Sequence[int | float]]) -> None:
+        """Initialize the table from the column values."""
+        self.devices = list(devices)
+        self._columns = {}
+        for name in self.COLUMNS:
+            values = columns[name]
+            if len(values) != len(self.devices):
+                raise ValueError(
+                    f'The length of column {name!r} ({len(values)}) does not match the number of '
+                    f'devices ({len(self.devices)}).',
+                )
+            integer = name in self._INTEGER_COLUMNS
+            if np is not None:
+                self._columns[name] = np.asarray(values, dtype=np.int64 if integer else np.float64)
+            else:
+                self._columns[name] = array.array('q' if integer else 'd', values)
+
+    @classmethod
+    def from_devices(
+        cls,
+        devices: Iterable[Device] | None = None,
+        *,
+        max_workers: int | None = None,
+    ) -> DeviceTable:
+        """Query the devices and return a new table.
+
+        Args:
+            devices (Optional[Iterable[Device]]):
+                The devices to query. If not given, use all physical devices and the MIG devices on
+                them.
+            max_workers (Optional[int]):
+                The maximum number of worker threads. See also :meth:`Device.take_snapshots`.
+        """
+        if devices is None:
+            devices = []
+            for physical_device in Device.all():
+                devices.append(physical_device)
+                devices.extend(physical_device.mig_devices())
+
+        snapshots = Device.take_snapshots(devices, keys=cls._SNAPSHOT_KEYS, max_workers=max_workers)
+        return cls.from_snapshots(snapshots)
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Iterable[Any]) -> DeviceTable:
+        """Convert the device snapshots to a new table."""
+        snapshots = list(snapshots)
+        columns = {
+            'physical_index': [snapshot.physical_index for snapshot in snapshots],
+            'mig_index': [
+                snapshot.mig_index if snapshot.real.is_mig_device() else -1
+                for snapshot in snapshots
+            ],
+        }
+        columns.update(snapshots_to_arrays(snapshots, cls._SNAPSHOT_KEYS))
+        return cls([snapshot.real for snapshot in snapshots], columns)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the table."""
+        return f'{self.__class__.__name__}(devices={len(self)}, columns={self.COLUMNS!r})'
+
+    def __len__(self) -> int:
+        """Return the number of devices in the table."""
+        return len(self.devices)
+
+    def __getitem__(self, name: str) -> Any:
+        """Return the column values of the given name."""
+        try:
+            return self._columns[name]
+        except KeyError as ex:
+            raise KeyError(
+                f'Unknown column {name!r}. Available columns: {", ".join(self.COLUMNS)}.',
+            ) from ex
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the column names."""
+        return iter(self.COLUMNS)
+
+    def keys(self) -> Iterator[str]:
+        """Return the column names. Support ``dict(table)`` conversion."""
+        return iter(self.COLUMNS)
+
+    @property
+    def mig_devices(self) -> list[MigDevice]:
+        """The MIG devices in the table."""
+        return [device for device in self.devices if device.is_mig_device()]
+
+    def sum(self, name: str) -> float:
+        """Return the sum of the given column, ignoring the missing values."""
+        return nansum(self[name])
+
+    def mean(self, name: str) -> float:
+        """Return the mean value of the given column, ignoring the missing values.
+
+        Return NaN if all values are missing.
+        """
+        return nanmean(self[name])
+
+    def min(self, name: str) -> float:
+        """Return the minimum value of the given column, ignoring the missing values.
+
+        Return NaN if all values are missing.
+        """
+        return nanmin(self[name])
+
+    def max(self, name: str) -> float:
+        """Return the maximum value of the given column, ignoring the missing values.
+
+        Return NaN if all values are missing.
+        """
+        return nanmax(self[name])
+
+    def rank(self, name: str, descending: bool = True) -> list[int]:
+        """Return the row indices sorted by the values of the given column.
+
+        The stable sort is used, and the missing values are always placed last.
+        """
+        return nanargsort(self[name], descending=descending)
+
+    def select(self, rows: Iterable[bool] | Iterable[int]) -> DeviceTable:
+        """Return a new table with the selected rows.
+
+        Args:
+            rows (Union[Iterable[bool], Iterable[int]]):
+                A boolean mask with the same length as the table, or the row indices.
+        """
+        rows = list(rows.tolist() if np is not None and isinstance(rows, np.ndarray) else rows)
+        if len(rows) == len(self) and all(isinstance(row, bool) for row in rows):
+            indices = [i for i, selected in enumerate(rows) if selected]
+        else:
+            indices = [int(row) for row in rows]
+
+        if np is not None:
+            columns = {name: self._columns[name][indices] for name in self.COLUMNS}
+        else:
+            columns = {name: [self._columns[name][i] for i in indices] for name in self.COLUMNS}
+        return self.__class__([self.devices[i] for i in indices], columns)
@@ -20,14 +20,16 @@
 
 from __future__ import annotations
 
+import contextlib
 import datetime
 import functools
 import math
 import os
 import re
 import sys
+import threading
 import time
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, ContextManager, Iterable, Mapping
 
 from psutil import WINDOWS
 
@@ -51,6 +53,7 @@ __all__ = [
     'set_color',
     'boolify',
     'Snapshot',
+    'LazySnapshot',
 ]
 
 
@@ -152,6 +155,10 @@ class NaType(str):
             cls._instance = super().__new__(cls, 'N/A')
         return cls._instance
 
+    def __reduce__(self) -> str:
+        """Return the singleton instance (:const:`nvitop.NA`) for pickling and copying."""
+        return 'NA'
+
     def __bool__(self) -> bool:
         """Convert :const:`NA` to :class:`bool` and return :data:`False`.
 
@@ -626,8 +633,7 @@ class Snapshot:
 
     def __repr__(self) -> str:
         """Return a string representation of the snapshot."""
-        keys = set(self.__dict__.keys()).difference({'real', 'timestamp'})
-        keys = ['real', *sorted(keys)]
+        keys = ['real', *sorted(self)]
         keyvals = []
         for key in keys:
             value = getattr(self, key)
@@ -645,6 +651,11 @@ class Snapshot:
         """Return a hash value of the snapshot."""
         return hash((self.real, self.timestamp))
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return state information for pickling and copying."""
+        # Restore via `__init__()` to set `real` before the attribute lookups in `__getattr__()`
+        return self.__class__, (self.real,), dict(self.__dict__)
+
     def __getattr__(self, name: str) -> Any:
         """Get a member from the instance.
 
@@ -687,6 +698,116 @@ class Snapshot:
         return iter(self)
 
 
+class LazySnapshot(Snapshot):
+    """A snapshot that fetches the values from the original object on first access.
+
+    The values of the lazy keys are fetched in the ``oneshot()`` context of the original object on
+    first access and then frozen. The routines memoized by ``oneshot()`` (e.g., ``memory_info()`` of
+    devices) are carried over across accesses, so the values fetched on different accesses are
+    consistent with each other, as if all of them were fetched in one ``oneshot()`` window.
+
+    Args:
+        real (Any):
+            The original object.
+        keys (Union[Iterable[str], Mapping[str, str]]):
+            The names of the lazy attributes, or a mapping from the names to the names of the methods
+            of the original object to call.
+        window (Optional[Callable[[], ContextManager]]):
+            A function that returns a context manager to fetch the values in. If not given, use the
+            ``oneshot()`` method of the original object if available.
+        **items (Any):
+            The attributes that are already fetched.
+    """
+
+    def __init__(
+        self,
+        real: Any,
+        keys: Iterable[str] | Mapping[str, str],
+        window: Callable[[], ContextManager] | None = None,
+        **items: Any,
+    ) -> None:
+        """Initialize a new :class:`LazySnapshot` object with the given attributes."""
+        super().__init__(real, **items)
+        if not isinstance(keys, Mapping):
+            keys = {key: key for key in keys}
+        if window is None:
+            window = getattr(real, 'oneshot', contextlib.nullcontext)
+
+        self.__dict__.update(
+            _lazy_keys={key: method for key, method in keys.items() if key not in items},
+            _lazy_window=window,
+            _lazy_memo={},
+            # Reentrant for the getters that access other lazy attributes of the same snapshot
+            _lazy_lock=threading.RLock(),
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a member from the instance.
+
+        If the attribute is a lazy attribute, fetch the value from the original object and freeze it.
+        """
+        if name.startswith('_lazy_'):
+            raise AttributeError(name)
+
+        with self._lazy_lock:
+            method = self._lazy_keys.get(name)
+            if method is None:
+                try:
+                    return self.__dict__[name]  # fetched by another thread
+                except KeyError:
+                    pass
+            else:
+                # Check, fetch and store under the lock, so the value is fetched only once
+                value = self.__dict__[name] = self._lazy_fetch(method)
+                self._lazy_keys.pop(name, None)
+                return value
+        return super().__getattr__(name)
+
+    def _lazy_fetch(self, method: str) -> Any:  # the lock should be held
+        real = self.real
+        nested = hasattr(real, '_cache')  # already in a `oneshot()` context entered by the caller
+        with self._lazy_window():
+            cache = None if nested else getattr(real, '_cache', None)
+            if isinstance(cache, dict):
+                for key, value in self._lazy_memo.items():
+                    cache.setdefault(key, value)
+            attribute = getattr(real, method)
+            if callable(attribute):
+                attribute = attribute()
+            if isinstance(cache, dict):
+                self._lazy_memo.update(cache)
+        return attribute
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return state information for pickling and copying.
+
+        The lazy attributes are fetched and the snapshot is materialized into a plain
+        :class:`Snapshot`, which does not hold the lock and the memoized values.
+        """
+        state = {name: getattr(self, name) for name in self}
+        state.update(real=self.real, timestamp=self.timestamp)
+        return Snapshot, (self.real,), state
+
+    def __iter__(self) -> Iterable[str]:
+        """Support ``for name in snapshot`` syntax and ``*`` tuple unpack ``[*snapshot]`` syntax.
+
+        The lazy attributes are included in the iteration, and will be fetched on access.
+        """
+        with self._lazy_lock:
+            names = [
+                name
+                for name in (*self.__dict__, *self._lazy_keys)
+                if name not in ('real', 'timestamp') and not name.startswith('_lazy_')
+            ]
+        return iter(names)
+
+    def freeze(self) -> LazySnapshot:
+        """Fetch all the lazy attributes and return the snapshot itself."""
+        for name in list(self._lazy_keys):
+            getattr(self, name)
+        return self
+
+
 # Modified from psutil (https://github.com/giampaolo/psutil)
 def memoize_when_activated(method: Callable[[Any], Any]) -> Callable[[Any], Any]:
     """A memoize decorator which is disabled by default.
@@ -3,6 +3,8 @@
 
 """The interactive NVIDIA-GPU process viewer."""
 
+from __future__ import annotations
+
 import argparse
 import curses
 import os
@@ -101,6 +103,12 @@ def parse_arguments() -> argparse.Namespace:
         action='store_true',
         help='Use ASCII characters only, which is useful for terminals without Unicode support.',
     )
+    parser.add_argument(
+        '--nvml-stats',
+        dest='nvml_stats',
+        action='store_true',
+        help='Print the statistics of NVML queries (call counts, errors and latencies) on exit.',
+    )
 
     coloring = parser.add_argument_group('coloring')
     coloring.add_argument(
@@ -261,6 +269,52 @@ def parse_arguments() -> argparse.Namespace:
     return args
 
 
+def format_nvml_query_stats(stats: dict[str, libnvml.NVMLQueryStats]) -> str:
+    """Format the statistics of NVML queries as a table sorted by the total time spent."""
+
+    def format_bound(bound: float) -> str:
+        return f'{bound * 1e6:.0f}us' if bound < 1e-3 else f'{bound * 1e3:.0f}ms'
+
+    bounds = libnvml.QUERY_LATENCY_BUCKETS
+    buckets = [f'<{format_bound(bound)}' for bound in bounds[:-1]]
+    buckets.append(f'>={format_bound(bounds[-2])}')
+
+    width = max((len(name) for name in stats), default=8)
+    lines = [
+        'NVML query statistics:',
+        '{:<{width}}  {:>8}  {:>8}  {:>10}  {:>10}  {:>10}  {}'.format(
+            'Function',
+            'Calls',
+            'Errors',
+            'Total (ms)',
+            'Mean (us)',
+            'Max (us)',
+            '  '.join(f'{bucket:>7}' for bucket in buckets),
+            width=width,
+        ),
+    ]
+    for name, record in sorted(stats.items(), key=lambda item: item[1].total_time, reverse=True):
+        lines.append(
+            '{:<{width}}  {:>8}  {:>8}  {:>10.2f}  {:>10.1f}  {:>10.1f}  {}'.format(
+                name,
+                record.calls,
+                record.error_count,
+                record.total_time * 1e3,
+                record.mean_time * 1e6,
+                record.max_time * 1e6,
+                '  '.join(f'{count:>7}' for count in record.histogram),
+                width=width,
+            ),
+        )
+        if record.error_count > 0:
+            errors = ', '.join(
+                f'{error}: {count}'
+                for error, count in sorted(record.errors.items(), key=lambda item: -item[1])
+            )
+            lines.append(f'{"":<{width}}  ({errors})')
+    return '\n'.join(lines)
+
+
 # pylint: disable-next=too-many-branches,too-many-statements,too-many-locals
 def main() -> None:
     """Main function for ``nvitop`` CLI."""
@@ -289,6 +343,9 @@ def main() -> None:
     if not setlocale_utf8():
         args.ascii = True
 
+    if args.nvml_stats:
+        libnvml.nvmlQueryStatsEnable()
+
     try:
         device_count = Device.count()
     except libnvml.NVMLError_LibraryNotFound:
@@ -370,6 +427,9 @@ def main() -> None:
     ui.print()
     ui.destroy()
 
+    if args.nvml_stats:
+        print(format_nvml_query_stats(libnvml.nvmlQueryStats()), file=sys.stderr)
+
     if len(libnvml.UNKNOWN_FUNCTIONS) > 0:
         unknown_function_messages = [
             'ERROR: Some FunctionNotFound errors occurred while calling:'
@@ -66,8 +66,8 @@ class Device(DeviceBase):
         self.tuple_index = (self.index,) if isinstance(self.index, int) else self.index
         self.display_index = ':'.join(map(str, self.tuple_index))
 
-    def as_snapshot(self):
-        self._snapshot = super().as_snapshot()
+    def as_snapshot(self, keys=None, *, lazy=False):
+        self._snapshot = super().as_snapshot(keys=keys, lazy=lazy)
         self._snapshot.tuple_index = self.tuple_index
         self._snapshot.display_index = self.display_index
         return self._snapshot
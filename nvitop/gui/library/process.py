@@ -22,10 +22,9 @@ __all__ = [
 
 
 class GpuProcess(GpuProcessBase):
-    def __new__(cls, *args, **kwargs):
-        instance = super().__new__(cls, *args, **kwargs)
-        instance._snapshot = None
-        return instance
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._snapshot = None
 
     @property
     def snapshot(self) -> Snapshot:
@@ -33,8 +32,8 @@ class GpuProcess(GpuProcessBase):
             self.as_snapshot()
         return self._snapshot
 
-    def host_snapshot(self) -> Snapshot:
-        host_snapshot = super().host_snapshot()
+    def _finish_host_snapshot(self, host_snapshot: Snapshot) -> Snapshot:
+        host_snapshot = super()._finish_host_snapshot(host_snapshot)
 
         if host_snapshot.cpu_percent is NA:
             host_snapshot.cpu_percent_string = NA
@@ -52,8 +51,11 @@ class GpuProcess(GpuProcessBase):
 
         return host_snapshot
 
-    def as_snapshot(self, *, host_process_snapshot_cache=None) -> Snapshot:
-        snapshot = super().as_snapshot(host_process_snapshot_cache=host_process_snapshot_cache)
+    def as_snapshot(self, *, host_process_snapshot_cache=None, lazy=False) -> Snapshot:
+        snapshot = super().as_snapshot(
+            host_process_snapshot_cache=host_process_snapshot_cache,
+            lazy=lazy,
+        )
 
         snapshot.type = snapshot.type.replace('C+G', 'X')
         if snapshot.gpu_memory_human is NA and (host.WINDOWS or host.WSL):
@@ -129,7 +129,7 @@ class DevicePanel(Displayable):  # pylint: disable=too-many-instance-attributes
 
     @ttl_cache(ttl=1.0)
     def take_snapshots(self):
-        snapshots = [device.as_snapshot() for device in self.all_devices]
+        snapshots = Device.take_snapshots(self.all_devices)
 
         for device in snapshots:
             if device.name.startswith('NVIDIA '):
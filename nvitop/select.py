@@ -59,15 +59,23 @@ from __future__ import annotations
 import argparse
 import getpass
 import math
+import operator
 import os
 import sys
 import warnings
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Sequence
 
 from nvitop.api import Device, GpuProcess, colored, human2bytes, libnvml
+from nvitop.api.table import snapshots_to_arrays
 from nvitop.version import __version__
 
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
 __all__ = ['select_devices']
 
 try:
@@ -77,6 +85,15 @@ except ModuleNotFoundError:
 
 TTY = sys.stdout.isatty()
 
+# The device attributes used for device selection, other attributes are fetched on demand
+SNAPSHOT_KEYS = (
+    'memory_used',
+    'memory_free',
+    'memory_total',
+    'gpu_utilization',
+    'memory_utilization',
+)
+
 
 def select_devices(  # pylint: disable=too-many-branches,too-many-statements,too-many-locals,unused-argument
     devices: Iterable[Device] | None = None,
@@ -166,9 +183,9 @@ def select_devices(  # pylint: disable=too-many-branches,too-many-statements,too
 
     available_devices = []
     for device in devices:
-        available_devices.extend(dev.as_snapshot() for dev in device.to_leaf_devices())
-    for device in available_devices:
-        device.loosen_constraints = 0
+        available_devices.extend(
+            dev.as_snapshot(keys=SNAPSHOT_KEYS) for dev in device.to_leaf_devices()
+        )
 
     if len(free_accounts) > 0:
         with GpuProcess.failsafe():
@@ -180,73 +197,54 @@ def select_devices(  # pylint: disable=too-many-branches,too-many-statements,too
                 device.memory_free += as_free_memory
                 device.memory_used -= as_free_memory
 
+    # Convert the attributes to float arrays (NaN for N/A) and check the thresholds in batch
+    columns = snapshots_to_arrays(available_devices, SNAPSHOT_KEYS)
+    constraints = []
     if min_free_memory is not None:
-        loosen_min_free_memory = min_free_memory * (1.0 - tolerance)
-        available_devices = filter(
-            lambda device: (
-                device.memory_free >= loosen_min_free_memory,
-                setattr(
-                    device,
-                    'loosen_constraints',
-                    device.loosen_constraints + int(not device.memory_free >= min_free_memory),
-                ),
-            )[0],
-            available_devices,
+        constraints.append(
+            ('memory_free', operator.ge, min_free_memory, min_free_memory * (1.0 - tolerance)),
         )
     if min_total_memory is not None:
-        loosen_min_total_memory = min_total_memory * (1.0 - tolerance)
-        available_devices = filter(
-            lambda device: (
-                device.memory_total >= loosen_min_total_memory,
-                setattr(
-                    device,
-                    'loosen_constraints',
-                    device.loosen_constraints + int(not device.memory_total >= min_total_memory),
-                ),
-            )[0],
-            available_devices,
+        constraints.append(
+            ('memory_total', operator.ge, min_total_memory, min_total_memory * (1.0 - tolerance)),
         )
     if max_gpu_utilization is not None:
-        loosen_max_gpu_utilization = max_gpu_utilization + 100.0 * tolerance
-        available_devices = filter(
-            lambda device: (
-                device.gpu_utilization <= loosen_max_gpu_utilization,
-                setattr(
-                    device,
-                    'loosen_constraints',
-                    device.loosen_constraints
-                    + int(not device.gpu_utilization <= max_gpu_utilization),
-                ),
-            )[0],
-            available_devices,
+        constraints.append(
+            (
+                'gpu_utilization',
+                operator.le,
+                max_gpu_utilization,
+                max_gpu_utilization + 100.0 * tolerance,
+            ),
         )
     if max_memory_utilization is not None:
-        loosen_max_memory_utilization = max_memory_utilization + 100.0 * tolerance
-        available_devices = filter(
-            lambda device: (
-                device.memory_utilization <= loosen_max_memory_utilization,
-                setattr(
-                    device,
-                    'loosen_constraints',
-                    device.loosen_constraints
-                    + int(not device.memory_utilization <= max_memory_utilization),
-                ),
-            )[0],
-            available_devices,
+        constraints.append(
+            (
+                'memory_utilization',
+                operator.le,
+                max_memory_utilization,
+                max_memory_utilization + 100.0 * tolerance,
+            ),
         )
+    satisfied, loosen_constraints = _check_constraints(columns, constraints)
 
-    available_devices = list(available_devices)
+    indices = [i for i, ok in enumerate(satisfied) if ok]
     if sort:
-        available_devices.sort(
-            key=lambda device: (
-                device.loosen_constraints,
-                (not math.isnan(device.memory_free), -device.memory_free),  # descending
-                (not math.isnan(device.memory_used), -device.memory_used),  # descending
-                (not math.isnan(device.gpu_utilization), device.gpu_utilization),  # ascending
-                (not math.isnan(device.memory_utilization), device.memory_utilization),  # ascending
-                -device.physical_index,  # descending to keep <GPU 0> free
+        memory_free, memory_used, gpu_utilization, memory_utilization = (
+            columns[name].tolist()
+            for name in ('memory_free', 'memory_used', 'gpu_utilization', 'memory_utilization')
+        )
+        indices.sort(
+            key=lambda i: (
+                loosen_constraints[i],
+                (not math.isnan(memory_free[i]), -memory_free[i]),  # descending
+                (not math.isnan(memory_used[i]), -memory_used[i]),  # descending
+                (not math.isnan(gpu_utilization[i]), gpu_utilization[i]),  # ascending
+                (not math.isnan(memory_utilization[i]), memory_utilization[i]),  # ascending
+                -available_devices[i].physical_index,  # descending to keep <GPU 0> free
             ),
         )
+    available_devices = [available_devices[i] for i in indices]
 
     if any(device.is_mig_device for device in available_devices):  # found MIG devices!
         non_mig_devices = [device for device in available_devices if not device.is_mig_device]
@@ -267,6 +265,37 @@ def select_devices(  # pylint: disable=too-many-branches,too-many-statements,too
     return [device.index for device in available_devices]
 
 
+def _check_constraints(
+    columns: dict[str, Sequence[float]],
+    constraints: list[tuple[str, Callable[[Any, float], Any], float, float]],
+) -> tuple[list[bool], list[int]]:
+    """Check the constraints over the float columns.
+
+    Returns a list of whether each device satisfies all the loosened constraints, and a list of the
+    number of the strict constraints that each device violates. The same as comparisons with
+    :const:`NA`, NaN is treated as greater than any number.
+    """
+    num_devices = len(next(iter(columns.values()), ()))
+    if np is not None:
+        satisfied = np.ones(num_devices, dtype=np.bool_)
+        loosen_constraints = np.zeros(num_devices, dtype=np.int64)
+        for name, compare, threshold, loosen_threshold in constraints:
+            values = np.nan_to_num(columns[name], nan=np.inf)
+            satisfied &= compare(values, loosen_threshold)
+            loosen_constraints += ~compare(values, threshold)
+        return satisfied.tolist(), loosen_constraints.tolist()
+
+    satisfied = [True] * num_devices
+    loosen_constraints = [0] * num_devices
+    for name, compare, threshold, loosen_threshold in constraints:
+        for i, value in enumerate(columns[name]):
+            if math.isnan(value):
+                value = math.inf
+            satisfied[i] = satisfied[i] and compare(value, loosen_threshold)
+            loosen_constraints[i] += int(not compare(value, threshold))
+    return satisfied, loosen_constraints
+
+
 # pylint: disable-next=too-many-branches,too-many-statements
 def parse_arguments() -> argparse.Namespace:
     """Parse command-line arguments for ``nvisel``."""